@@ -13,7 +13,7 @@ from api.models import (
     PurchaseResponse
 )
 from services.purchase_service import PurchaseRequest, execute_purchase
-from services.csv_export_service import generate_csv_for_sales, SecurityError
+from services.csv_export_service import iter_csv_for_sales, SaleNotFoundError, SecurityError
 from services.inventory_allocation_service import (
     AllocationCriteria,
     allocate_inventory_by_criteria,
@@ -21,7 +21,6 @@ from services.inventory_allocation_service import (
 )
 from domain.lead import LeadClassification
 from domain.age_bucket import AgeBucket
-from repositories.sale_repository import get_sale_by_id
 
 router = APIRouter()
 
@@ -328,27 +327,24 @@ def download_purchase_csv(sale_ids: str, client_id: str):
                 detail=f"Invalid UUID format: {str(e)}"
             )
 
-        # Verify all sales exist
-        for sale_uuid in sale_uuids:
-            sale = get_sale_by_id(sale_uuid)
-            if sale is None:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Sale not found: {sale_uuid}"
-                )
-
-        # Generate CSV with authorization check (will verify all sales belong to client)
+        # Generate CSV with existence and authorization checks (will verify
+        # all sales exist and belong to client before anything is streamed)
         try:
-            csv_content = generate_csv_for_sales(sale_uuids, client_uuid)
+            csv_lines = iter_csv_for_sales(sale_uuids, client_uuid)
+        except SaleNotFoundError as e:
+            raise HTTPException(
+                status_code=404,
+                detail=str(e)
+            )
         except SecurityError as e:
             raise HTTPException(
                 status_code=403,
                 detail=f"Not authorized to download these sales: {str(e)}"
             )
 
-        # Return CSV as downloadable file
-        return Response(
-            content=csv_content,
+        # Stream CSV as downloadable file
+        return StreamingResponse(
+            csv_lines,
             media_type="text/csv",
             headers={
                 "Content-Disposition": f"attachment; filename=purchased_leads.csv"
@@ -7,10 +7,7 @@ Endpoints for calculating purchase quotes.
 from fastapi import APIRouter, HTTPException
 
 from api.models import QuoteRequest, QuoteResponse, QuoteLineItem
-from repositories.inventory_query_repository import (
-    InventoryQueryFilters,
-    query_available_inventory,
-)
+from repositories.inventory_query_repository import get_inventory_items_by_ids
 from services.pricing_service import calculate_purchase_quote
 
 router = APIRouter()
@@ -44,26 +41,16 @@ def calculate_quote(request: QuoteRequest):
     ```
     """
     try:
-        # Fetch all available inventory (we'll filter to requested IDs)
-        # TODO: Optimize with direct ID query in future
-        all_available = query_available_inventory(
-            InventoryQueryFilters(),
-            limit=10000
-        )
-
-        # Filter to requested items
-        requested_items = [
-            item for item in all_available
-            if item.inventory_id in request.inventory_item_ids
-        ]
+        # Fetch only the requested available items (filtered by ID in SQL)
+        requested_items = get_inventory_items_by_ids(request.inventory_item_ids)
 
         # Validate all items were found
-        if len(requested_items) != len(request.inventory_item_ids):
-            found_ids = {item.inventory_id for item in requested_items}
-            missing_ids = [
-                str(id) for id in request.inventory_item_ids
-                if id not in found_ids
-            ]
+        found_ids = {item.inventory_id for item in requested_items}
+        missing_ids = [
+            str(id) for id in dict.fromkeys(request.inventory_item_ids)
+            if id not in found_ids
+        ]
+        if missing_ids:
             raise HTTPException(
                 status_code=404,
                 detail=f"Some inventory items not found or unavailable: {missing_ids}"
@@ -0,0 +1,39 @@
+-- ============================================================================
+-- Inventory Query Plans
+-- ============================================================================
+--
+-- EXPLAIN (ANALYZE, BUFFERS) for the queries issued by
+-- repositories/inventory_query_repository.py, written the way PostgREST
+-- runs them. Run in the Supabase SQL Editor after loading data and check
+-- that inventory is read through the partial idx_inventory_* indexes (no
+-- Seq Scan on inventory and no Sort node for the ORDER BY).
+--
+-- Read-only: EXPLAIN ANALYZE executes the SELECTs but changes nothing.
+-- ============================================================================
+
+-- Browse one age bucket, filtered by lead classification and state
+-- (query_available_inventory with age_buckets/classifications/states)
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT i.inventory_id, i.lead_id, i.age_bucket, i.created_at_utc,
+       l.state, l.county, l.classification
+FROM inventory i
+JOIN leads l ON l.lead_id = i.lead_id
+WHERE i.sold_at_utc IS NULL
+  AND i.age_bucket = 'MONTH_12_TO_23'
+  AND l.classification = 'Gold'
+  AND l.state = 'LA'
+ORDER BY i.created_at_utc, i.inventory_id
+LIMIT 100;
+
+-- Next page after a keyset cursor (query_available_inventory with cursor)
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT i.inventory_id, i.lead_id, i.age_bucket, i.created_at_utc
+FROM inventory i
+WHERE i.sold_at_utc IS NULL
+  AND (i.created_at_utc, i.inventory_id) > (NOW() - INTERVAL '30 days', '00000000-0000-0000-0000-000000000000'::UUID)
+ORDER BY i.created_at_utc, i.inventory_id
+LIMIT 100;
+
+-- Inventory counts (get_inventory_counts / get_inventory_summary)
+EXPLAIN (ANALYZE, BUFFERS)
+SELECT * FROM inventory_counts_by_bucket(NULL, NULL, ARRAY['Gold'], NULL, TRUE);
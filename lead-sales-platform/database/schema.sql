@@ -13,6 +13,14 @@
 --
 -- Functions:
 --   - execute_sale_atomic() - Atomic purchase with race condition prevention
+--   - compute_lead_buckets() - Age bucket per eligible lead (inventory generation)
+--   - count_by_classification() - Lead counts per classification (export summary)
+--   - insert_eligible_inventory() - Server-side inventory generation (one page per call)
+--   - inventory_counts_by_bucket() - Inventory counts per age bucket and classification
+--   - inventory_summary() - Available/sold totals per age bucket and classification
+--   - purchase_inventory() - Batch purchase of inventory items in one transaction
+--   - query_mixed_inventory() - Multi-part inventory query (one LIMIT per request)
+--   - count_by_classification_and_state() - Lead counts per classification and state (import check)
 --
 -- ============================================================================
 
@@ -85,6 +93,7 @@ CREATE INDEX IF NOT EXISTS idx_leads_county ON leads(county);  -- NEW: for count
 CREATE INDEX IF NOT EXISTS idx_leads_created_at_utc ON leads(created_at_utc);
 CREATE INDEX IF NOT EXISTS idx_leads_source ON leads(source);
 CREATE INDEX IF NOT EXISTS idx_leads_state_classification ON leads(state, classification);
+CREATE INDEX IF NOT EXISTS idx_leads_classification_state_county ON leads(classification, state, county);  -- Inventory browsing filters
 
 -- Add comments for documentation
 COMMENT ON TABLE leads IS 'Lead records from CSV ingestion with full column expansion';
@@ -177,7 +186,9 @@ CREATE TABLE inventory (
 CREATE INDEX IF NOT EXISTS idx_inventory_lead_id ON inventory(lead_id);
 CREATE INDEX IF NOT EXISTS idx_inventory_age_bucket ON inventory(age_bucket);
 CREATE INDEX IF NOT EXISTS idx_inventory_availability ON inventory(sold_at_utc) WHERE sold_at_utc IS NULL;  -- Partial index for available inventory
-CREATE INDEX IF NOT EXISTS idx_inventory_bucket_availability ON inventory(age_bucket, sold_at_utc) WHERE sold_at_utc IS NULL;
+CREATE INDEX IF NOT EXISTS idx_inventory_bucket_availability ON inventory(age_bucket, created_at_utc, inventory_id) WHERE sold_at_utc IS NULL;  -- Bucket filter, rows already in query order
+CREATE INDEX IF NOT EXISTS idx_inventory_available_keyset ON inventory(created_at_utc, inventory_id) WHERE sold_at_utc IS NULL;  -- Keyset pagination of available inventory
+CREATE INDEX IF NOT EXISTS idx_inventory_available_lead_bucket ON inventory(lead_id) INCLUDE (age_bucket) WHERE sold_at_utc IS NULL;  -- Index-only scans for inventory counts
 
 COMMENT ON TABLE inventory IS 'Tracks sellable eligibility per (lead_id, age_bucket) combination';
 COMMENT ON COLUMN inventory.sold_at_utc IS 'NULL = available for sale, NOT NULL = already sold';
@@ -375,3 +386,368 @@ END;
 $$ LANGUAGE plpgsql;
 
 COMMENT ON FUNCTION execute_sale_atomic IS 'Atomically execute a sale with row-level locking to prevent race conditions. Verifies client status, checks inventory availability, and creates sale record in a single transaction.';
+
+-- ============================================================================
+-- 7. LEAD AGE BUCKETS (Inventory Generation)
+-- ============================================================================
+--
+-- Computes the age bucket for every lead that is at least 90 days old as of
+-- p_as_of, so that too-young leads never leave the database.
+--
+-- Mirrors domain/age_bucket.py:
+--   age_days = floor((as_of_utc - created_at_utc) / 24 hours)
+--
+-- Results are ordered by lead_id and paged by keyset: pass the last lead_id
+-- of the previous page as p_after_lead_id (NULL for the first page).
+
+CREATE OR REPLACE FUNCTION compute_lead_buckets(
+    p_as_of TIMESTAMPTZ,
+    p_after_lead_id UUID DEFAULT NULL,
+    p_limit INTEGER DEFAULT 1000
+)
+RETURNS TABLE (lead_id UUID, age_bucket TEXT) AS $$
+    SELECT
+        l.lead_id,
+        CASE
+            WHEN a.age_days <= 179 THEN 'MONTH_3_TO_5'
+            WHEN a.age_days <= 269 THEN 'MONTH_6_TO_8'
+            WHEN a.age_days <= 359 THEN 'MONTH_9_TO_11'
+            WHEN a.age_days <= 719 THEN 'MONTH_12_TO_23'
+            ELSE 'MONTH_24_PLUS'
+        END AS age_bucket
+    FROM leads l
+    CROSS JOIN LATERAL (
+        SELECT floor(extract(epoch FROM (p_as_of - l.created_at_utc)) / 86400)::INTEGER AS age_days
+    ) a
+    WHERE l.created_at_utc <= p_as_of - INTERVAL '90 days'
+      AND (p_after_lead_id IS NULL OR l.lead_id > p_after_lead_id)
+    ORDER BY l.lead_id
+    LIMIT p_limit;
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION compute_lead_buckets IS 'Returns (lead_id, age_bucket) for leads at least 90 days old as of p_as_of, keyset-paginated by lead_id. Used by scripts/generate_inventory.py.';
+
+-- ============================================================================
+-- 8. LEAD COUNTS BY CLASSIFICATION (Export Summary)
+-- ============================================================================
+--
+-- Counts leads per classification, optionally filtered by state and/or
+-- classification (NULL means no filter). Mirrors the filters accepted by
+-- repositories/lead_repository.py list_leads_by_filter().
+
+CREATE OR REPLACE FUNCTION count_by_classification(
+    p_state TEXT DEFAULT NULL,
+    p_classification TEXT DEFAULT NULL
+)
+RETURNS TABLE (classification TEXT, lead_count BIGINT) AS $$
+    SELECT l.classification, COUNT(*) AS lead_count
+    FROM leads l
+    WHERE (p_state IS NULL OR l.state = p_state)
+      AND (p_classification IS NULL OR l.classification = p_classification)
+    GROUP BY l.classification;
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION count_by_classification IS 'Returns (classification, lead_count) for leads matching optional state/classification filters. Used by scripts/export_leads.py.';
+
+-- ============================================================================
+-- 9. INVENTORY GENERATION (Server-Side Insert)
+-- ============================================================================
+--
+-- Inserts inventory records for one keyset page of eligible leads entirely
+-- inside the database, so no lead or inventory rows travel to the client.
+-- Existing (lead_id, age_bucket) records are left untouched.
+--
+-- Returns one row: the number of leads scanned in the page, the number of
+-- inventory records inserted, and the last lead_id of the page (pass it as
+-- p_after_lead_id for the next call; NULL once there are no more leads).
+
+CREATE OR REPLACE FUNCTION insert_eligible_inventory(
+    p_as_of TIMESTAMPTZ,
+    p_after_lead_id UUID DEFAULT NULL,
+    p_limit INTEGER DEFAULT 5000
+)
+RETURNS TABLE (scanned INTEGER, inserted INTEGER, last_lead_id UUID) AS $$
+    WITH page AS (
+        SELECT b.lead_id, b.age_bucket
+        FROM compute_lead_buckets(p_as_of, p_after_lead_id, p_limit) b
+    ),
+    ins AS (
+        INSERT INTO inventory (lead_id, age_bucket, created_at_utc, sold_at_utc)
+        SELECT page.lead_id, page.age_bucket, p_as_of, NULL
+        FROM page
+        ON CONFLICT (lead_id, age_bucket) DO NOTHING
+        RETURNING 1
+    )
+    SELECT
+        (SELECT COUNT(*)::INTEGER FROM page),
+        (SELECT COUNT(*)::INTEGER FROM ins),
+        (SELECT page.lead_id FROM page ORDER BY page.lead_id DESC LIMIT 1);
+$$ LANGUAGE sql;
+
+COMMENT ON FUNCTION insert_eligible_inventory IS 'Inserts inventory for one keyset page of leads at least 90 days old as of p_as_of (ON CONFLICT DO NOTHING). Used by scripts/generate_inventory.py.';
+
+-- ============================================================================
+-- 10. INVENTORY COUNTS (Browsing Summary)
+-- ============================================================================
+--
+-- Counts inventory per (age_bucket, classification) inside the database, so
+-- only one row per group travels to the client. Filters mirror
+-- InventoryQueryFilters in repositories/inventory_query_repository.py
+-- (NULL means no filter).
+
+CREATE OR REPLACE FUNCTION inventory_counts_by_bucket(
+    p_states TEXT[] DEFAULT NULL,
+    p_counties TEXT[] DEFAULT NULL,
+    p_classifications TEXT[] DEFAULT NULL,
+    p_age_buckets TEXT[] DEFAULT NULL,
+    p_available_only BOOLEAN DEFAULT TRUE
+)
+RETURNS TABLE (age_bucket TEXT, classification TEXT, inventory_count BIGINT) AS $$
+    SELECT i.age_bucket, l.classification, COUNT(*) AS inventory_count
+    FROM inventory i
+    JOIN leads l ON l.lead_id = i.lead_id
+    WHERE (NOT p_available_only OR i.sold_at_utc IS NULL)
+      AND (p_age_buckets IS NULL OR i.age_bucket = ANY(p_age_buckets))
+      AND (p_states IS NULL OR l.state = ANY(p_states))
+      AND (p_counties IS NULL OR l.county = ANY(p_counties))
+      AND (p_classifications IS NULL OR l.classification = ANY(p_classifications))
+    GROUP BY i.age_bucket, l.classification;
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION inventory_counts_by_bucket IS 'Returns (age_bucket, classification, inventory_count) for inventory matching optional state/county/classification/age bucket filters. Used by repositories/inventory_query_repository.py.';
+
+-- ============================================================================
+-- 11. INVENTORY SUMMARY (Single Pass)
+-- ============================================================================
+--
+-- Totals for get_inventory_summary() in one scan: GROUPING SETS returns one
+-- row per (sold, age_bucket), one per (sold, classification), and one total
+-- per sold flag. Columns outside a row's grouping set are NULL.
+
+CREATE OR REPLACE FUNCTION inventory_summary()
+RETURNS TABLE (sold BOOLEAN, age_bucket TEXT, classification TEXT, inventory_count BIGINT) AS $$
+    SELECT i.sold_at_utc IS NOT NULL AS sold, i.age_bucket, l.classification, COUNT(*) AS inventory_count
+    FROM inventory i
+    JOIN leads l ON l.lead_id = i.lead_id
+    GROUP BY GROUPING SETS (
+        (i.sold_at_utc IS NOT NULL, i.age_bucket),
+        (i.sold_at_utc IS NOT NULL, l.classification),
+        (i.sold_at_utc IS NOT NULL)
+    );
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION inventory_summary IS 'Returns (sold, age_bucket, classification, inventory_count) grouped by sold flag alone, with age bucket, and with classification (GROUPING SETS). Used by get_inventory_summary() in repositories/inventory_query_repository.py.';
+
+-- ============================================================================
+-- 12. BATCH PURCHASE (Purchase Service)
+-- ============================================================================
+--
+-- Sells a list of inventory items to one client in a single transaction:
+-- one UPDATE marks every available item sold and one INSERT ... SELECT
+-- records the sales. Rows locked by a concurrent purchase are skipped
+-- (SKIP LOCKED) rather than waited on; skipped or already-sold items are
+-- simply absent from the result, so the caller can find replacements.
+--
+-- This is the only guard against concurrent sales: query_mixed_inventory()
+-- and criteria allocation reserve nothing, so the same items can be offered
+-- to several buyers, but each item is sold at most once here.
+--
+-- p_items: JSON array of {"inventory_id": UUID, "purchase_price": NUMERIC}
+
+CREATE OR REPLACE FUNCTION purchase_inventory(
+    p_client_id UUID,
+    p_items JSONB,
+    p_sold_at TIMESTAMPTZ
+)
+RETURNS JSON AS $$
+DECLARE
+    v_client_status TEXT;
+    v_sales JSON;
+BEGIN
+    -- 1. Verify client is active
+    SELECT status INTO v_client_status
+    FROM clients
+    WHERE client_id = p_client_id;
+
+    IF v_client_status IS NULL THEN
+        RETURN json_build_object(
+            'success', false,
+            'error', 'INVALID_CLIENT',
+            'message', 'Client does not exist'
+        );
+    END IF;
+
+    IF v_client_status != 'active' THEN
+        RETURN json_build_object(
+            'success', false,
+            'error', 'CLIENT_SUSPENDED',
+            'message', 'Client account is not active (status: ' || v_client_status || ')'
+        );
+    END IF;
+
+    -- 2. Lock available items, mark them sold, and record the sales
+    WITH requested AS (
+        SELECT DISTINCT ON ((item->>'inventory_id')::UUID)
+               (item->>'inventory_id')::UUID AS inventory_id,
+               (item->>'purchase_price')::NUMERIC AS purchase_price
+        FROM jsonb_array_elements(p_items) AS item
+    ),
+    locked AS (
+        SELECT i.inventory_id, i.lead_id, i.age_bucket, r.purchase_price,
+               gen_random_uuid() AS sale_id
+        FROM inventory i
+        JOIN requested r ON r.inventory_id = i.inventory_id
+        WHERE i.sold_at_utc IS NULL
+        FOR UPDATE OF i SKIP LOCKED
+    ),
+    sold AS (
+        UPDATE inventory i
+        SET sold_at_utc = p_sold_at
+        FROM locked
+        WHERE i.inventory_id = locked.inventory_id
+          AND i.sold_at_utc IS NULL
+        RETURNING i.inventory_id
+    ),
+    ins AS (
+        INSERT INTO sales (sale_id, lead_id, client_id, age_bucket, sold_at_utc, purchase_price, payment_status)
+        SELECT locked.sale_id, locked.lead_id, p_client_id, locked.age_bucket, p_sold_at, locked.purchase_price, 'completed'
+        FROM locked
+        JOIN sold ON sold.inventory_id = locked.inventory_id
+        RETURNING sale_id
+    )
+    SELECT COALESCE(
+        json_agg(json_build_object('inventory_id', locked.inventory_id, 'sale_id', ins.sale_id)),
+        '[]'::json
+    )
+    INTO v_sales
+    FROM ins
+    JOIN locked ON locked.sale_id = ins.sale_id;
+
+    -- 3. Return the items actually sold
+    RETURN json_build_object(
+        'success', true,
+        'sales', v_sales
+    );
+
+EXCEPTION
+    WHEN foreign_key_violation THEN
+        RETURN json_build_object(
+            'success', false,
+            'error', 'INVALID_REFERENCE',
+            'message', 'Invalid lead_id, client_id, or age_bucket'
+        );
+    WHEN OTHERS THEN
+        RETURN json_build_object(
+            'success', false,
+            'error', 'DATABASE_ERROR',
+            'message', 'Database error: ' || SQLERRM
+        );
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION purchase_inventory IS 'Sells a list of inventory items to one client in a single transaction (FOR UPDATE SKIP LOCKED, one UPDATE, one INSERT ... SELECT). Returns {success, sales: [{inventory_id, sale_id}]} for the items actually sold. Used by services/purchase_service.py.';
+
+-- ============================================================================
+-- 13. MIXED INVENTORY QUERY (Inventory Browsing)
+-- ============================================================================
+--
+-- Serves every MixedInventoryRequest in one call: each element of p_requests
+-- runs its own LIMIT quantity query, in request order, ordered like
+-- query_available_inventory.
+--
+-- The same lead can be in inventory under more than one age bucket. Leads
+-- chosen by earlier requests are excluded before each request's LIMIT, so a
+-- lead is never returned twice and later requests are filled from the
+-- remaining leads instead of coming back short.
+--
+-- p_requests: JSON array of {"classification", "age_bucket", "quantity",
+--   "states"?, "counties"?}; omit states/counties for no location filter.
+--
+-- Returns a single JSON array (not a row set) so PostgREST's max-rows limit
+-- cannot truncate large orders. Each element matches the inventory row shape
+-- used by query_available_inventory, with lead fields under "leads".
+
+CREATE OR REPLACE FUNCTION query_mixed_inventory(p_requests JSONB)
+RETURNS JSON AS $$
+DECLARE
+    v_request JSONB;
+    v_index BIGINT;
+    v_rows JSONB;
+    v_lead_ids UUID[];
+    v_chosen UUID[] := '{}';
+    v_result JSONB := '[]'::jsonb;
+BEGIN
+    FOR v_request, v_index IN
+        SELECT r.request, r.ordinality - 1
+        FROM jsonb_array_elements(p_requests) WITH ORDINALITY AS r(request, ordinality)
+    LOOP
+        SELECT COALESCE(
+                   jsonb_agg(
+                       jsonb_build_object(
+                           'request_index', v_index,
+                           'inventory_id', m.inventory_id,
+                           'lead_id', m.lead_id,
+                           'age_bucket', m.age_bucket,
+                           'created_at_utc', m.created_at_utc,
+                           'leads', jsonb_build_object(
+                               'state', m.state,
+                               'county', m.county,
+                               'classification', m.classification,
+                               'first_name', m.first_name,
+                               'last_name', m.last_name,
+                               'city', m.city,
+                               'zip', m.zip,
+                               'mortgage_amount', m.mortgage_amount,
+                               'borrower_age', m.borrower_age,
+                               'borrower_phone', m.borrower_phone
+                           )
+                       )
+                       ORDER BY m.created_at_utc, m.inventory_id
+                   ),
+                   '[]'::jsonb
+               ),
+               COALESCE(array_agg(m.lead_id), '{}')
+        INTO v_rows, v_lead_ids
+        FROM (
+            SELECT i.inventory_id, i.lead_id, i.age_bucket, i.created_at_utc,
+                   l.state, l.county, l.classification, l.first_name, l.last_name,
+                   l.city, l.zip, l.mortgage_amount, l.borrower_age, l.borrower_phone
+            FROM inventory i
+            JOIN leads l ON l.lead_id = i.lead_id
+            WHERE i.sold_at_utc IS NULL
+              AND i.age_bucket = v_request->>'age_bucket'
+              AND l.classification = v_request->>'classification'
+              AND NOT (i.lead_id = ANY(v_chosen))
+              AND (v_request->'states' IS NULL
+                   OR l.state IN (SELECT jsonb_array_elements_text(v_request->'states')))
+              AND (v_request->'counties' IS NULL
+                   OR l.county IN (SELECT jsonb_array_elements_text(v_request->'counties')))
+            ORDER BY i.created_at_utc, i.inventory_id
+            LIMIT (v_request->>'quantity')::INTEGER
+        ) m;
+
+        v_result := v_result || v_rows;
+        v_chosen := v_chosen || v_lead_ids;
+    END LOOP;
+
+    RETURN v_result::json;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+COMMENT ON FUNCTION query_mixed_inventory IS 'Returns a JSON array of available inventory (with embedded lead fields) for a list of {classification, age_bucket, quantity, states?, counties?} requests, at most quantity items per request, in request order. Each lead is returned at most once; later requests skip leads chosen by earlier ones. Used by repositories/inventory_query_repository.py.';
+
+-- ============================================================================
+-- 14. LEAD COUNTS BY CLASSIFICATION AND STATE (Import Verification)
+-- ============================================================================
+--
+-- One row per (classification, state), so totals, per-classification and
+-- per-state counts can all be summed from a single call.
+
+CREATE OR REPLACE FUNCTION count_by_classification_and_state()
+RETURNS TABLE (classification TEXT, state TEXT, lead_count BIGINT) AS $$
+    SELECT l.classification, l.state, COUNT(*) AS lead_count
+    FROM leads l
+    GROUP BY l.classification, l.state;
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION count_by_classification_and_state IS 'Returns (classification, state, lead_count) for all leads. Used by scripts/verify_import.py.';
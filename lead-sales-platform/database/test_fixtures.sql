@@ -0,0 +1,66 @@
+-- ============================================================================
+-- Test Fixtures
+-- ============================================================================
+--
+-- Helper functions used by the scripts/test_*.py scripts to set up data in a
+-- single round trip. Apply to development/test databases only.
+--
+-- Run this AFTER running schema.sql.
+-- ============================================================================
+
+-- ============================================================================
+-- CSV EXPORT FIXTURE (client + lead + sale)
+-- ============================================================================
+--
+-- Gets or creates an active test client by email, inserts the given lead,
+-- and records a sale of that lead to the client, all in one transaction.
+--
+-- p_lead: lead row as JSON (same shape as lead_repository._lead_to_row)
+-- p_sale: {"age_bucket", "sold_at_utc", "purchase_price", "currency"}
+--
+-- Returns: {"client_id": UUID, "lead_id": UUID, "sale_id": UUID}
+
+CREATE OR REPLACE FUNCTION setup_csv_export_fixture(
+    p_email TEXT,
+    p_company_name TEXT,
+    p_lead JSONB,
+    p_sale JSONB
+)
+RETURNS JSON AS $$
+DECLARE
+    v_client_id UUID;
+    v_lead_id UUID;
+    v_sale_id UUID;
+BEGIN
+    INSERT INTO clients (email, company_name, status, auth_provider, email_verified)
+    VALUES (p_email, p_company_name, 'active', 'local', TRUE)
+    ON CONFLICT (email) DO NOTHING;
+
+    SELECT client_id INTO v_client_id
+    FROM clients
+    WHERE email = p_email;
+
+    INSERT INTO leads
+    SELECT (jsonb_populate_record(NULL::leads, jsonb_build_object('created_at', NOW()) || p_lead)).*
+    RETURNING lead_id INTO v_lead_id;
+
+    INSERT INTO sales (lead_id, client_id, age_bucket, sold_at_utc, purchase_price, currency)
+    VALUES (
+        v_lead_id,
+        v_client_id,
+        p_sale->>'age_bucket',
+        (p_sale->>'sold_at_utc')::TIMESTAMPTZ,
+        (p_sale->>'purchase_price')::NUMERIC,
+        COALESCE(p_sale->>'currency', 'USD')
+    )
+    RETURNING sale_id INTO v_sale_id;
+
+    RETURN json_build_object(
+        'client_id', v_client_id,
+        'lead_id', v_lead_id,
+        'sale_id', v_sale_id
+    );
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION setup_csv_export_fixture IS 'Test helper: get-or-create client, insert lead, and record sale in one call. Used by scripts/test_csv_injection_logging.py.';
@@ -7,12 +7,18 @@ This module contains *only* the database connection setup and exposes a single
 Environment variables required:
 - SUPABASE_URL: Your Supabase project URL
 - SUPABASE_KEY: Your Supabase API key (use a server-side key only on the backend)
+
+Optional:
+- DATABASE_URL: Direct Postgres connection string, used for COPY bulk loads
 """
 
 from __future__ import annotations
 
 import os
+import random
+import time
 from pathlib import Path
+from typing import Any
 
 from dotenv import load_dotenv
 
@@ -42,6 +48,102 @@ if not SUPABASE_KEY:
     )
 
 # Official Supabase Python client instance to be imported by other modules.
+# Import this shared instance rather than calling create_client() again: its
+# PostgREST client owns one pooled, keep-alive httpx session, so every
+# table()/rpc() call (including the thread-pooled queries) reuses open
+# connections instead of paying a new TLS handshake.
 supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
 
-__all__ = ["supabase"]
+# Direct Postgres connection string (Project Settings > Database). Optional:
+# only bulk loads that use COPY need it; everything else goes through the
+# Supabase client.
+DATABASE_URL: str | None = os.getenv("DATABASE_URL") or None
+
+# Retry policy for transient failures (rate limiting, temporary unavailability).
+_RETRYABLE_STATUS_CODES = frozenset({429, 503})
+# PostgREST error codes it answers with HTTP 503: database connection lost or
+# unavailable, or schema cache not loaded yet. APIError.code otherwise holds a
+# Postgres SQLSTATE, never an HTTP status.
+_RETRYABLE_POSTGREST_CODES = frozenset({"PGRST000", "PGRST001", "PGRST002"})
+# The API gateway answers 429/503 itself with a JSON body but no error code,
+# e.g. {"message": "API rate limit exceeded"}. postgrest's APIError drops the
+# HTTP status for JSON bodies, so those are recognised by their message.
+_TRANSIENT_MESSAGE_MARKERS = (
+    "rate limit",
+    "too many requests",
+    "service unavailable",
+    "temporarily unavailable",
+)
+_MAX_RETRIES = 5
+_BASE_DELAY_SECONDS = 0.5
+_MAX_DELAY_SECONDS = 8.0
+
+
+def _http_status(exc: Exception) -> int | None:
+    """Return the HTTP status code of the response behind an exception, if known."""
+    # httpx.HTTPStatusError and similar carry the response itself
+    status = getattr(getattr(exc, "response", None), "status_code", None)
+    if isinstance(status, int):
+        return status
+    # postgrest's APIError only carries the status when the body was not JSON
+    code = getattr(exc, "code", None)
+    return code if isinstance(code, int) else None
+
+
+def _is_transient_error(exc: Exception) -> bool:
+    """Return True if an exception is an HTTP 429/503 response."""
+    status = _http_status(exc)
+    if status is not None:
+        return status in _RETRYABLE_STATUS_CODES
+    code = getattr(exc, "code", None)
+    if isinstance(code, str):
+        return code in _RETRYABLE_POSTGREST_CODES
+    # No status and no error code: a gateway error body, matched by its text
+    text = " ".join(
+        part for part in (getattr(exc, "message", None), getattr(exc, "details", None))
+        if isinstance(part, str)
+    ).lower()
+    return any(marker in text for marker in _TRANSIENT_MESSAGE_MARKERS)
+
+
+def execute_with_retry(query: Any, max_retries: int = _MAX_RETRIES) -> Any:
+    """
+    Execute a Supabase query builder, retrying transient failures.
+
+    HTTP 429 (Too Many Requests) and 503 (Service Unavailable) responses,
+    including PostgREST's connection errors (PGRST000-PGRST002) and gateway
+    errors whose JSON body only names the condition (e.g. "API rate limit
+    exceeded"), are retried with capped exponential backoff plus jitter. Any
+    other error is raised immediately. Only use this for idempotent requests (reads, upserts
+    with ignore_duplicates) since a retried request may already have applied.
+
+    Args:
+        query: Query builder with an execute() method
+        max_retries: Maximum number of attempts
+
+    Returns:
+        The response returned by query.execute()
+
+    Raises:
+        ValueError: If max_retries < 1
+
+    Example:
+        >>> response = execute_with_retry(supabase.table("leads").select("lead_id").limit(1))
+    """
+    if max_retries < 1:
+        raise ValueError("max_retries must be >= 1")
+
+    for attempt in range(max_retries - 1):
+        try:
+            return query.execute()
+        except Exception as e:
+            if not _is_transient_error(e):
+                raise
+            delay = min(_MAX_DELAY_SECONDS, _BASE_DELAY_SECONDS * (2 ** attempt))
+            time.sleep(delay + random.uniform(0, _BASE_DELAY_SECONDS))
+
+    # Last attempt: any error is raised
+    return query.execute()
+
+
+__all__ = ["supabase", "execute_with_retry", "DATABASE_URL"]
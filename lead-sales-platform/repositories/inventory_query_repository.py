@@ -9,13 +9,37 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, List, Mapping, Optional
+from typing import Any, Iterator, List, Mapping, Optional, Sequence
 from uuid import UUID
 
 from domain.age_bucket import AgeBucket
 from domain.lead import LeadClassification
 from repositories.client import supabase
 
+# Rows fetched per request when streaming inventory. Larger results are read
+# page by page, so only one page of raw JSON is held at a time (and no single
+# request exceeds the PostgREST max-rows setting, 1000 by default on Supabase).
+INVENTORY_PAGE_SIZE = 1000
+
+# IDs per IN (...) filter in get_inventory_items_by_ids; keeps the request URL short.
+_IDS_PER_REQUEST = 200
+
+# Columns selected for AvailableInventoryItem rows (inventory + embedded lead).
+_INVENTORY_ITEM_COLUMNS = (
+    "inventory_id, lead_id, age_bucket, created_at_utc, "
+    "leads!inner(state, county, classification, first_name, last_name, "
+    "city, zip, mortgage_amount, borrower_age, borrower_phone)"
+)
+
+# Module-level constants for row deserialization hot paths.
+# A dict lookup avoids EnumMeta.__call__ for every row.
+_AGE_BUCKET_BY_VALUE: dict[str, AgeBucket] = {m.value: m for m in AgeBucket}
+_CLASSIFICATION_BY_VALUE: dict[str, LeadClassification] = {m.value: m for m in LeadClassification}
+
+# Keyset pagination position: (created_at_utc, inventory_id) of the last item
+# on the previous page.
+InventoryCursor = tuple[datetime, UUID]
+
 
 @dataclass(frozen=True, slots=True)
 class AvailableInventoryItem:
@@ -96,37 +120,147 @@ def _parse_utc_datetime(value: Any) -> datetime:
     return dt.astimezone(timezone.utc)
 
 
+def next_inventory_cursor(items: List[AvailableInventoryItem]) -> Optional[InventoryCursor]:
+    """Return the cursor for the page after `items` (None if the page is empty)."""
+    if not items:
+        return None
+    last = items[-1]
+    return (last.created_at_utc, last.inventory_id)
+
+
 def query_available_inventory(
     filters: InventoryQueryFilters,
     limit: int = 100,
-    offset: int = 0
+    cursor: Optional[InventoryCursor] = None
 ) -> List[AvailableInventoryItem]:
     """
     Query available inventory with filters.
 
+    Results are ordered by (created_at_utc, inventory_id). Pages are fetched
+    with keyset pagination: pass the cursor of the previous page's last item
+    (see next_inventory_cursor) to continue after it.
+
     Performance optimizations:
     - Uses JOIN to fetch lead data in single query
-    - Leverages partial index on (sold_at_utc IS NULL)
+    - Leverages partial index on (created_at_utc, inventory_id)
+      WHERE sold_at_utc IS NULL, so each page is an index range scan
+      however deep it is
     - Limits result set to prevent large data transfers
+    - Limits above INVENTORY_PAGE_SIZE are fetched in pages
+      (see iter_available_inventory)
 
     Args:
         filters: Query filters
         limit: Maximum number of results (default 100)
-        offset: Pagination offset (default 0)
+        cursor: Return items after this position (default: first page)
 
     Returns:
         List of AvailableInventoryItem matching filters
+
+    Example:
+        >>> page1 = query_available_inventory(filters, limit=50)
+        >>> page2 = query_available_inventory(
+        ...     filters, limit=50, cursor=next_inventory_cursor(page1))
     """
-    # Build query with INNER JOIN
-    # Note: !inner forces INNER JOIN to exclude inventory without matching leads
-    query = (
-        supabase.table("inventory")
-        .select(
-            "inventory_id, lead_id, age_bucket, created_at_utc, "
-            "leads!inner(state, county, classification, first_name, last_name, "
-            "city, zip, mortgage_amount, borrower_age, borrower_phone)"
+    return list(iter_available_inventory(filters, limit=limit, cursor=cursor))
+
+
+def iter_available_inventory(
+    filters: InventoryQueryFilters,
+    limit: Optional[int] = None,
+    cursor: Optional[InventoryCursor] = None,
+    page_size: int = INVENTORY_PAGE_SIZE
+) -> Iterator[AvailableInventoryItem]:
+    """
+    Stream available inventory matching filters, one page at a time.
+
+    Yields items in the same order as query_available_inventory, fetching
+    the next keyset page only once the previous one has been consumed, so
+    peak memory is bounded by page_size rather than the total result.
+
+    Args:
+        filters: Query filters
+        limit: Maximum number of items to yield (default: all matching)
+        cursor: Start after this position (default: from the beginning)
+        page_size: Rows fetched per request
+
+    Yields:
+        AvailableInventoryItem matching filters
+
+    Raises:
+        RuntimeError: If Supabase returns an error response
+    """
+    remaining = limit
+    while remaining is None or remaining > 0:
+        page_limit = page_size if remaining is None else min(page_size, remaining)
+        page = _fetch_inventory_page(filters, page_limit, cursor)
+        yield from page
+
+        if len(page) < page_limit:
+            return
+        if remaining is not None:
+            remaining -= len(page)
+        cursor = next_inventory_cursor(page)
+
+
+def get_inventory_items_by_ids(inventory_ids: Sequence[UUID]) -> List[AvailableInventoryItem]:
+    """
+    Fetch available (unsold) inventory items by ID with IN (...) queries.
+
+    The filter runs in the database against the primary key, so only the
+    requested rows are transferred. IDs are sent _IDS_PER_REQUEST at a time
+    to keep request URLs short.
+
+    Args:
+        inventory_ids: Inventory IDs to fetch
+
+    Returns:
+        Available items found, in no particular order (unknown or sold IDs
+        are simply absent)
+
+    Raises:
+        RuntimeError: If Supabase returns an error response
+    """
+    unique_ids = list(dict.fromkeys(str(inventory_id) for inventory_id in inventory_ids))
+    items: List[AvailableInventoryItem] = []
+    for start in range(0, len(unique_ids), _IDS_PER_REQUEST):
+        chunk = unique_ids[start:start + _IDS_PER_REQUEST]
+        response = (
+            supabase.table("inventory")
+            .select(_INVENTORY_ITEM_COLUMNS)
+            .in_("inventory_id", chunk)
+            .is_("sold_at_utc", "null")
+            .execute()
         )
-    )
+        error = getattr(response, "error", None)
+        if error:
+            raise RuntimeError(f"Failed to fetch inventory items: {error}")
+
+        for row in getattr(response, "data", None) or []:
+            item = _row_to_item(row)
+            if item is not None:
+                items.append(item)
+    return items
+
+
+def _fetch_inventory_page(
+    filters: InventoryQueryFilters,
+    limit: int,
+    cursor: Optional[InventoryCursor]
+) -> List[AvailableInventoryItem]:
+    """
+    Fetch one keyset page of inventory (a single request).
+
+    Raises:
+        RuntimeError: If Supabase returns an error response
+    """
+    # Build query with INNER JOIN
+    # Note: !inner forces INNER JOIN to exclude inventory without matching leads.
+    # PostgREST runs the embed as one SQL join in the same request, so lead
+    # fields cost no extra round trip. Fetching inventory first and leads in
+    # a second IN (...) query would add requests, and with state, county or
+    # classification filters the LIMIT must apply after the join anyway.
+    query = supabase.table("inventory").select(_INVENTORY_ITEM_COLUMNS)
 
     # Apply filters
     if filters.available_only:
@@ -144,12 +278,19 @@ def query_available_inventory(
     if filters.classifications:
         query = query.in_("leads.classification", [c.value for c in filters.classifications])
 
-    # Pagination
-    # Note: Use .limit() instead of .range() to avoid off-by-one issues with joins
-    if offset == 0:
-        query = query.limit(limit)
-    else:
-        query = query.range(offset, offset + limit - 1)
+    # Keyset pagination: rows strictly after the cursor in
+    # (created_at_utc, inventory_id) order
+    if cursor is not None:
+        created_at, inventory_id = cursor
+        created_at_iso = created_at.astimezone(timezone.utc).isoformat()
+        query = query.or_(
+            f'created_at_utc.gt."{created_at_iso}",'
+            f'and(created_at_utc.eq."{created_at_iso}",inventory_id.gt.{inventory_id})'
+        )
+
+    # One order() call with both columns: repeated order() calls add separate
+    # "order" parameters in older postgrest-py releases
+    query = query.order("created_at_utc,inventory_id").limit(limit)
 
     # Execute
     response = query.execute()
@@ -162,30 +303,51 @@ def query_available_inventory(
     # Transform to domain models
     results = []
     for row in rows:
-        lead_data = row.get("leads")
+        item = _row_to_item(row)
+        if item is not None:
+            results.append(item)
 
-        # Skip rows where lead data is missing (shouldn't happen with !inner join)
-        if not lead_data:
-            continue
+    return results
 
-        results.append(AvailableInventoryItem(
-            inventory_id=UUID(str(row["inventory_id"])),
-            lead_id=UUID(str(row["lead_id"])),
-            age_bucket=AgeBucket(str(row["age_bucket"])),
-            created_at_utc=_parse_utc_datetime(row["created_at_utc"]),
-            state=str(lead_data["state"]),
-            county=lead_data.get("county"),
-            classification=LeadClassification(str(lead_data["classification"])),
-            first_name=lead_data.get("first_name"),
-            last_name=lead_data.get("last_name"),
-            city=lead_data.get("city"),
-            zip=lead_data.get("zip"),
-            mortgage_amount=lead_data.get("mortgage_amount"),
-            borrower_age=lead_data.get("borrower_age"),
-            borrower_phone=lead_data.get("borrower_phone"),
-        ))
 
-    return results
+def _parse_age_bucket(value: Any) -> AgeBucket:
+    """Map a stored age bucket to its enum member (ValueError if unknown)."""
+
+    member = _AGE_BUCKET_BY_VALUE.get(value)
+    return member if member is not None else AgeBucket(str(value))
+
+
+def _parse_classification(value: Any) -> LeadClassification:
+    """Map a stored classification to its enum member (ValueError if unknown)."""
+
+    member = _CLASSIFICATION_BY_VALUE.get(value)
+    return member if member is not None else LeadClassification(str(value))
+
+
+def _row_to_item(row: Mapping[str, Any]) -> Optional[AvailableInventoryItem]:
+    """Convert an inventory row with an embedded "leads" object into an item."""
+    lead_data = row.get("leads")
+
+    # Skip rows where lead data is missing (shouldn't happen with !inner join)
+    if not lead_data:
+        return None
+
+    return AvailableInventoryItem(
+        inventory_id=UUID(str(row["inventory_id"])),
+        lead_id=UUID(str(row["lead_id"])),
+        age_bucket=_parse_age_bucket(row["age_bucket"]),
+        created_at_utc=_parse_utc_datetime(row["created_at_utc"]),
+        state=str(lead_data["state"]),
+        county=lead_data.get("county"),
+        classification=_parse_classification(lead_data["classification"]),
+        first_name=lead_data.get("first_name"),
+        last_name=lead_data.get("last_name"),
+        city=lead_data.get("city"),
+        zip=lead_data.get("zip"),
+        mortgage_amount=lead_data.get("mortgage_amount"),
+        borrower_age=lead_data.get("borrower_age"),
+        borrower_phone=lead_data.get("borrower_phone"),
+    )
 
 
 def query_mixed_inventory(
@@ -194,8 +356,13 @@ def query_mixed_inventory(
     """
     Query for complex multi-part inventory requests.
 
-    Executes multiple queries for specific classification+age bucket combinations
-    and combines the results. Useful for scenarios like:
+    Fetches leads for specific classification+age bucket combinations and
+    combines the results in request order. All requests are served by one
+    query_mixed_inventory() database call (see database/schema.sql), which
+    runs a LIMIT quantity query per request. A lead is returned at most
+    once: leads chosen by earlier requests are skipped before each request's
+    LIMIT, so later requests are filled from the remaining leads.
+    Useful for scenarios like:
     - "I want 300 Silver leads aged 6-8 months + 100 Gold leads aged 6-8 months"
     - "I want 100 Silver leads aged 9-11 months in LA + 100 Gold leads aged 3-5 months in TX"
 
@@ -205,6 +372,9 @@ def query_mixed_inventory(
     Returns:
         Combined list of all requested inventory items
 
+    Raises:
+        RuntimeError: If Supabase returns an error response
+
     Example:
         requests = [
             MixedInventoryRequest(
@@ -223,154 +393,138 @@ def query_mixed_inventory(
         leads = query_mixed_inventory(requests)
         # Returns 400 total leads (300 Silver + 100 Gold, all 6-8 months old in LA)
     """
-    all_results = []
+    return [
+        item
+        for request_items in query_mixed_inventory_by_request(requests)
+        for item in request_items
+    ]
 
-    for request in requests:
-        # Build filters for this specific request
-        filters = InventoryQueryFilters(
-            classifications=[request.classification],
-            age_buckets=[request.age_bucket],
-            states=request.states,
-            counties=request.counties,
-            available_only=True
-        )
-
-        # Query with the requested quantity
-        results = query_available_inventory(
-            filters=filters,
-            limit=request.quantity
-        )
-
-        all_results.extend(results)
 
-    return all_results
-
-
-def get_inventory_counts(
-    filters: InventoryQueryFilters
-) -> dict[AgeBucket, int]:
+def query_mixed_inventory_by_request(
+    requests: List[MixedInventoryRequest]
+) -> List[List[AvailableInventoryItem]]:
     """
-    Get counts of available inventory grouped by age bucket.
+    Query for complex multi-part inventory requests, grouped per request.
 
-    Useful for UI to show "25 leads in MONTH_3_TO_5, 40 in MONTH_6_TO_8", etc.
+    Same single database call and lead de-duplication as query_mixed_inventory,
+    but the items are returned as one list per request, aligned with requests.
 
     Args:
-        filters: Query filters (same as query_available_inventory)
+        requests: List of MixedInventoryRequest specifying what to fetch
 
     Returns:
-        Dictionary mapping AgeBucket to count
-    """
-    # Build base query
-    query = supabase.table("inventory").select("age_bucket", count="exact")
-
-    # Apply filters
-    if filters.available_only:
-        query = query.is_("sold_at_utc", "null")
-
-    if filters.age_buckets:
-        query = query.in_("age_bucket", [b.value for b in filters.age_buckets])
-
-    # For state/county/classification filters, we need to join with leads
-    # Supabase doesn't support GROUP BY in the Python client easily,
-    # so we'll fetch all and group in Python
-    if filters.states or filters.counties or filters.classifications:
-        # Fetch with lead data and pagination
-        # First get total count
-        count_query = supabase.table("inventory").select("*", count="exact")
-
-        if filters.available_only:
-            count_query = count_query.is_("sold_at_utc", "null")
-
-        count_response = count_query.execute()
-        total_count = getattr(count_response, "count", 0) or 0
+        List of inventory item lists, one per request (in request order)
 
-        # Fetch all with pagination
-        all_rows = []
-        page_size = 1000
-        offset = 0
-
-        while offset < total_count:
-            query_page = supabase.table("inventory").select("""
-                age_bucket,
-                leads!inner(state, county, classification)
-            """)
-
-            if filters.available_only:
-                query_page = query_page.is_("sold_at_utc", "null")
+    Raises:
+        RuntimeError: If Supabase returns an error response
+    """
+    return _query_mixed_inventory_rpc("query_mixed_inventory", requests)
 
-            if filters.states:
-                query_page = query_page.in_("leads.state", filters.states)
 
-            if filters.counties:
-                query_page = query_page.in_("leads.county", filters.counties)
+def _query_mixed_inventory_rpc(
+    function_name: str,
+    requests: List[MixedInventoryRequest]
+) -> List[List[AvailableInventoryItem]]:
+    """Call a mixed inventory database function and group its rows per request."""
+    if not requests:
+        return []
 
-            if filters.classifications:
-                query_page = query_page.in_("leads.classification", [c.value for c in filters.classifications])
+    # States/counties are omitted (not sent as null) when unfiltered
+    payload = []
+    for request in requests:
+        entry: dict[str, Any] = {
+            "classification": request.classification.value,
+            "age_bucket": request.age_bucket.value,
+            "quantity": request.quantity,
+        }
+        if request.states:
+            entry["states"] = request.states
+        if request.counties:
+            entry["counties"] = request.counties
+        payload.append(entry)
 
-            query_page = query_page.range(offset, offset + page_size - 1)
-            response_page = query_page.execute()
+    response = supabase.rpc(function_name, {"p_requests": payload}).execute()
+    error = getattr(response, "error", None)
+    if error:
+        raise RuntimeError(f"Failed to query mixed inventory: {error}")
 
-            error = getattr(response_page, "error", None)
-            if error:
-                raise RuntimeError(f"Failed to get inventory counts: {error}")
+    # Rows arrive grouped by request, in request order
+    grouped: List[List[AvailableInventoryItem]] = [[] for _ in requests]
+    for row in getattr(response, "data", None) or []:
+        item = _row_to_item(row)
+        if item is not None:
+            grouped[int(row["request_index"])].append(item)
+    return grouped
 
-            page_rows = getattr(response_page, "data", None) or []
-            if not page_rows:
-                break
 
-            all_rows.extend(page_rows)
-            offset += len(page_rows)
+def _count_inventory(
+    filters: InventoryQueryFilters
+) -> dict[tuple[AgeBucket, LeadClassification], int]:
+    """
+    Count inventory per (age bucket, classification) with one database call.
 
-        # Group by age_bucket in Python
-        counts: dict[AgeBucket, int] = {}
-        for row in all_rows:
-            bucket = AgeBucket(str(row["age_bucket"]))
-            counts[bucket] = counts.get(bucket, 0) + 1
+    The grouping runs in the inventory_counts_by_bucket() function (see
+    database/schema.sql), so only one row per group is transferred.
 
-        return counts
+    Raises:
+        RuntimeError: If Supabase returns an error response
+    """
+    response = supabase.rpc(
+        "inventory_counts_by_bucket",
+        {
+            "p_states": filters.states or None,
+            "p_counties": filters.counties or None,
+            "p_classifications": [c.value for c in filters.classifications] if filters.classifications else None,
+            "p_age_buckets": [b.value for b in filters.age_buckets] if filters.age_buckets else None,
+            "p_available_only": filters.available_only,
+        },
+    ).execute()
+    error = getattr(response, "error", None)
+    if error:
+        raise RuntimeError(f"Failed to get inventory counts: {error}")
 
-    else:
-        # Simple case: no lead filters, fetch all with pagination
-        # Get total count first
-        count_query = supabase.table("inventory").select("*", count="exact")
-        if filters.available_only:
-            count_query = count_query.is_("sold_at_utc", "null")
+    rows = getattr(response, "data", None) or []
+    return {
+        (_parse_age_bucket(row["age_bucket"]), _parse_classification(row["classification"])):
+            int(row["inventory_count"])
+        for row in rows
+    }
 
-        count_response = count_query.execute()
-        total_count = getattr(count_response, "count", 0) or 0
 
-        # Fetch all with pagination
-        all_rows = []
-        page_size = 1000
-        offset = 0
+def count_available_inventory(filters: InventoryQueryFilters) -> int:
+    """
+    Count inventory matching the filters without fetching any rows.
 
-        while offset < total_count:
-            query_page = supabase.table("inventory").select("age_bucket")
+    Args:
+        filters: Query filters (same as query_available_inventory)
 
-            if filters.available_only:
-                query_page = query_page.is_("sold_at_utc", "null")
+    Returns:
+        Number of matching inventory items
 
-            query_page = query_page.range(offset, offset + page_size - 1)
-            response_page = query_page.execute()
+    Raises:
+        RuntimeError: If Supabase returns an error response
+    """
+    return sum(_count_inventory(filters).values())
 
-            error = getattr(response_page, "error", None)
-            if error:
-                raise RuntimeError(f"Failed to get inventory counts: {error}")
 
-            page_rows = getattr(response_page, "data", None) or []
-            if not page_rows:
-                break
+def get_inventory_counts(
+    filters: InventoryQueryFilters
+) -> dict[AgeBucket, int]:
+    """
+    Get counts of available inventory grouped by age bucket.
 
-            all_rows.extend(page_rows)
-            offset += len(page_rows)
+    Useful for UI to show "25 leads in MONTH_3_TO_5, 40 in MONTH_6_TO_8", etc.
 
-        # Group by age_bucket
-        counts: dict[AgeBucket, int] = {}
-        for row in all_rows:
-            bucket = AgeBucket(str(row["age_bucket"]))
-            counts[bucket] = counts.get(bucket, 0) + 1
+    Args:
+        filters: Query filters (same as query_available_inventory)
 
-        return counts
+    Returns:
+        Dictionary mapping AgeBucket to count
+    """
+    counts: dict[AgeBucket, int] = {}
+    for (bucket, _), count in _count_inventory(filters).items():
+        counts[bucket] = counts.get(bucket, 0) + count
+    return counts
 
 
 def get_inventory_summary() -> dict[str, Any]:
@@ -384,69 +538,38 @@ def get_inventory_summary() -> dict[str, Any]:
             'by_bucket': dict[AgeBucket, int],
             'by_classification': dict[LeadClassification, int]
         }
-    """
-    # Count available inventory
-    available_response = (
-        supabase.table("inventory")
-        .select("*", count="exact")
-        .is_("sold_at_utc", "null")
-        .execute()
-    )
-
-    available_count = getattr(available_response, "count", 0) or 0
 
-    # Count sold inventory
-    sold_response = (
-        supabase.table("inventory")
-        .select("*", count="exact")
-        .not_.is_("sold_at_utc", "null")
-        .execute()
-    )
-
-    sold_count = getattr(sold_response, "count", 0) or 0
-
-    # Get available inventory by bucket
-    filters = InventoryQueryFilters(available_only=True)
-    by_bucket = get_inventory_counts(filters)
-
-    # Get available inventory by classification with pagination
-    # Need to join with leads table
-    # Get total available count (we already have this from available_count)
-    all_rows = []
-    page_size = 1000
-    offset = 0
-
-    while offset < available_count:
-        query_page = (
-            supabase.table("inventory")
-            .select("leads!inner(classification)")
-            .is_("sold_at_utc", "null")
-            .range(offset, offset + page_size - 1)
-            .execute()
-        )
-
-        error = getattr(query_page, "error", None)
-        if error:
-            raise RuntimeError(f"Failed to get inventory summary: {error}")
-
-        page_rows = getattr(query_page, "data", None) or []
-        if not page_rows:
-            break
-
-        all_rows.extend(page_rows)
-        offset += len(page_rows)
+    Raises:
+        RuntimeError: If Supabase returns an error response
+    """
+    response = supabase.rpc("inventory_summary", {}).execute()
+    error = getattr(response, "error", None)
+    if error:
+        raise RuntimeError(f"Failed to get inventory summary: {error}")
 
-    # Group by classification
+    # One result set from GROUPING SETS: a row with neither grouping column
+    # is the total for its sold flag; otherwise it is a per-bucket or
+    # per-classification count.
+    totals = {True: 0, False: 0}
+    by_bucket: dict[AgeBucket, int] = {}
     by_classification: dict[LeadClassification, int] = {}
-    for row in all_rows:
-        lead_data = row.get("leads")
-        if lead_data:
-            classification = LeadClassification(str(lead_data["classification"]))
-            by_classification[classification] = by_classification.get(classification, 0) + 1
+    for row in getattr(response, "data", None) or []:
+        sold = bool(row["sold"])
+        bucket = row.get("age_bucket")
+        classification = row.get("classification")
+        count = int(row["inventory_count"])
+        if bucket is None and classification is None:
+            totals[sold] = count
+        elif sold:
+            continue
+        elif bucket is not None:
+            by_bucket[_parse_age_bucket(bucket)] = count
+        else:
+            by_classification[_parse_classification(classification)] = count
 
     return {
-        'total_available': available_count,
-        'total_sold': sold_count,
+        'total_available': totals[False],
+        'total_sold': totals[True],
         'by_bucket': {bucket.value: count for bucket, count in by_bucket.items()},
         'by_classification': {cls.value: count for cls, count in by_classification.items()},
     }
@@ -454,10 +577,17 @@ def get_inventory_summary() -> dict[str, Any]:
 
 __all__ = [
     "AvailableInventoryItem",
+    "InventoryCursor",
     "InventoryQueryFilters",
     "MixedInventoryRequest",
+    "INVENTORY_PAGE_SIZE",
+    "get_inventory_items_by_ids",
+    "iter_available_inventory",
+    "next_inventory_cursor",
     "query_available_inventory",
     "query_mixed_inventory",
+    "query_mixed_inventory_by_request",
+    "count_available_inventory",
     "get_inventory_counts",
     "get_inventory_summary",
 ]
@@ -21,6 +21,9 @@ from repositories.client import supabase
 # Keep this aligned with your database schema.
 _INVENTORY_TABLE: str = "inventory"
 
+# A dict lookup avoids EnumMeta.__call__ for every row.
+_AGE_BUCKET_BY_VALUE: dict[str, AgeBucket] = {m.value: m for m in AgeBucket}
+
 
 def _to_iso_utc(dt: datetime, *, name: str) -> str:
     """Serialize a UTC datetime to ISO-8601 (timezone-aware, offset 0)."""
@@ -48,6 +51,13 @@ def _parse_utc_datetime(value: Any) -> datetime:
     return dt.astimezone(timezone.utc)
 
 
+def _parse_age_bucket(value: Any) -> AgeBucket:
+    """Map a stored age bucket to its enum member (ValueError if unknown)."""
+
+    member = _AGE_BUCKET_BY_VALUE.get(value)
+    return member if member is not None else AgeBucket(str(value))
+
+
 def _row_to_inventory(row: Mapping[str, Any]) -> InventoryRecord:
     """Convert a Supabase row into an InventoryRecord."""
 
@@ -55,7 +65,7 @@ def _row_to_inventory(row: Mapping[str, Any]) -> InventoryRecord:
     return InventoryRecord(
         inventory_id=str(row["inventory_id"]),
         lead_id=UUID(str(row["lead_id"])),
-        age_bucket=AgeBucket(str(row["age_bucket"])),
+        age_bucket=_parse_age_bucket(row["age_bucket"]),
         created_at=_parse_utc_datetime(row["created_at_utc"]),
         sold_at=_parse_utc_datetime(sold_at_val) if sold_at_val is not None else None,
     )
@@ -7,17 +7,35 @@ No business rules (classification, age buckets, inventory eligibility) belong he
 
 from __future__ import annotations
 
+import asyncio
+import importlib
 from datetime import datetime, timezone
-from typing import Any, List, Mapping
+from types import ModuleType
+from typing import Any, Iterator, List, Mapping, Sequence
 from uuid import UUID
 
+# asyncpg is optional: it is only needed for COPY bulk loads (copy_leads).
+asyncpg: ModuleType | None
+try:
+    asyncpg = importlib.import_module("asyncpg")
+except ImportError:  # pragma: no cover - depends on environment
+    asyncpg = None
+
 from domain.lead import Lead, LeadClassification
-from repositories.client import supabase
+from repositories.client import DATABASE_URL, execute_with_retry, supabase
 
 # Supabase table name for Lead records.
 # Keep this aligned with your database schema.
 _LEADS_TABLE: str = "leads"
 
+# Module-level constants for row (de)serialization hot paths.
+# A dict lookup avoids EnumMeta.__call__ for every row.
+_UTC = timezone.utc
+_CLASSIFICATION_BY_VALUE: dict[str, LeadClassification] = {m.value: m for m in LeadClassification}
+
+# IDs per IN (...) filter in get_leads_by_ids; keeps the request URL short.
+_IDS_PER_REQUEST = 200
+
 
 def _to_iso_utc(dt: datetime) -> str:
     """
@@ -30,7 +48,7 @@ def _to_iso_utc(dt: datetime) -> str:
 
     if dt.tzinfo is None or dt.utcoffset() is None:
         raise ValueError("created_at_utc must be timezone-aware (UTC)")
-    return dt.astimezone(timezone.utc).isoformat()
+    return dt.astimezone(_UTC).isoformat()
 
 
 def _parse_utc_datetime(value: Any) -> datetime:
@@ -52,9 +70,9 @@ def _parse_utc_datetime(value: Any) -> datetime:
     # If the backend returns a naive timestamp, interpret it as UTC so that the
     # domain model's UTC invariant is satisfied.
     if dt.tzinfo is None or dt.utcoffset() is None:
-        return dt.replace(tzinfo=timezone.utc)
+        return dt.replace(tzinfo=_UTC)
 
-    return dt.astimezone(timezone.utc)
+    return dt.astimezone(_UTC)
 
 
 def _lead_to_row(lead: Lead) -> dict[str, Any]:
@@ -107,6 +125,13 @@ def _lead_to_row(lead: Lead) -> dict[str, Any]:
     }
 
 
+def _parse_classification(value: Any) -> LeadClassification:
+    """Map a stored classification to its enum member (ValueError if unknown)."""
+
+    member = _CLASSIFICATION_BY_VALUE.get(value)
+    return member if member is not None else LeadClassification(str(value))
+
+
 def _row_to_lead(row: Mapping[str, Any]) -> Lead:
     """Convert a Supabase row into a domain Lead."""
 
@@ -119,7 +144,7 @@ def _row_to_lead(row: Mapping[str, Any]) -> Lead:
         # Core identifiers (required)
         lead_id=UUID(str(row["lead_id"])),
         state=str(row["state"]),
-        classification=LeadClassification(str(row["classification"])),
+        classification=_parse_classification(row["classification"]),
         created_at_utc=_parse_utc_datetime(row["created_at_utc"]),
 
         # Optional fields
@@ -211,6 +236,59 @@ def insert_leads_bulk(leads: List[Lead]) -> None:
         raise RuntimeError(f"Failed to bulk insert {len(leads)} leads: {error}")
 
 
+# True when copy_leads() can be used (asyncpg installed and DATABASE_URL set).
+COPY_AVAILABLE: bool = asyncpg is not None and DATABASE_URL is not None
+
+
+def _lead_to_record(lead: Lead) -> tuple[Any, ...]:
+    """Convert a domain Lead to a COPY record (column order of _lead_to_row)."""
+
+    row = _lead_to_row(lead)
+    row["lead_id"] = lead.lead_id
+    row["created_at_utc"] = lead.created_at_utc.astimezone(_UTC)
+    return tuple(row.values())
+
+
+async def _copy_records(columns: list[str], records: list[tuple[Any, ...]]) -> None:
+    if asyncpg is None:
+        raise RuntimeError("copy_leads requires asyncpg")
+    conn = await asyncpg.connect(DATABASE_URL)
+    try:
+        await conn.copy_records_to_table(_LEADS_TABLE, records=records, columns=columns)
+    finally:
+        await conn.close()
+
+
+def copy_leads(leads: Sequence[Lead]) -> None:
+    """
+    Bulk load Leads with COPY ... FROM STDIN over a direct Postgres connection.
+
+    COPY skips per-row statement parsing and planning on the server, so it is
+    considerably faster than a multi-row INSERT for large batches. Like
+    insert_leads_bulk(), the whole batch fails if any row is rejected.
+
+    Args:
+        leads: Lead domain objects to insert
+
+    Raises:
+        RuntimeError: If asyncpg is not installed or DATABASE_URL is not set
+        asyncpg.PostgresError: If the server rejects the COPY
+        ValueError/TypeError: For invalid domain values (e.g., timestamps)
+
+    Notes:
+        - Empty sequence is a no-op
+        - Bypasses PostgREST, so row-level security policies do not apply
+    """
+    if not leads:
+        return
+    if not COPY_AVAILABLE:
+        raise RuntimeError("copy_leads requires asyncpg and DATABASE_URL")
+
+    columns = list(_lead_to_row(leads[0]))
+    records = [_lead_to_record(lead) for lead in leads]
+    asyncio.run(_copy_records(columns, records))
+
+
 def get_lead_by_id(lead_id: UUID) -> Lead | None:
     """
     Fetch a Lead by ID.
@@ -237,6 +315,31 @@ def get_lead_by_id(lead_id: UUID) -> Lead | None:
     return _row_to_lead(rows[0])
 
 
+def get_leads_by_ids(lead_ids: Sequence[UUID]) -> List[Lead]:
+    """
+    Fetch several Leads by ID with IN (...) queries.
+
+    IDs are sent _IDS_PER_REQUEST at a time to keep request URLs short, so N
+    leads cost ceil(N / _IDS_PER_REQUEST) round-trips instead of N.
+
+    Returns:
+    - Leads found, in no particular order (unknown IDs are simply absent)
+    """
+
+    unique_ids = list(dict.fromkeys(str(lead_id) for lead_id in lead_ids))
+    leads: List[Lead] = []
+    for start in range(0, len(unique_ids), _IDS_PER_REQUEST):
+        chunk = unique_ids[start:start + _IDS_PER_REQUEST]
+        response = supabase.table(_LEADS_TABLE).select("*").in_("lead_id", chunk).execute()
+        error = getattr(response, "error", None)
+        if error:
+            raise RuntimeError(f"Failed to fetch leads: {error}")
+
+        rows = getattr(response, "data", None) or []
+        leads.extend(_row_to_lead(row) for row in rows)
+    return leads
+
+
 def list_leads_by_filter(
     state: str | None = None,
     classification: str | None = None,
@@ -264,11 +367,119 @@ def list_leads_by_filter(
     return [_row_to_lead(row) for row in rows]
 
 
+def iter_leads_by_filter(
+    state: str | None = None,
+    classification: str | None = None,
+    page_size: int = 1000,
+) -> Iterator[Lead]:
+    """
+    Stream Leads with optional filtering by state and/or classification.
+
+    Unlike list_leads_by_filter(), rows are fetched one page at a time and
+    yielded as they arrive, so memory use stays constant regardless of table
+    size and callers can start processing after the first page.
+
+    Args:
+    - state: filter by Lead.state (exact match)
+    - classification: filter by classification string (e.g., "Gold" or "Silver")
+    - page_size: number of rows fetched per request
+
+    Raises:
+        RuntimeError: If Supabase returns an error response
+        ValueError: If page_size < 1
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be >= 1")
+
+    offset = 0
+    while True:
+        query = supabase.table(_LEADS_TABLE).select("*")
+        if state is not None:
+            query = query.eq("state", state)
+        if classification is not None:
+            query = query.eq("classification", classification)
+
+        # A stable order is required for range paging to be consistent.
+        response = execute_with_retry(
+            query.order("lead_id").range(offset, offset + page_size - 1)
+        )
+        error = getattr(response, "error", None)
+        if error:
+            raise RuntimeError(f"Failed to list leads: {error}")
+
+        rows = getattr(response, "data", None) or []
+        for row in rows:
+            yield _row_to_lead(row)
+
+        if len(rows) < page_size:
+            return
+        offset += page_size
+
+
+def count_leads_by_classification(
+    state: str | None = None,
+    classification: str | None = None,
+) -> dict[str, int]:
+    """
+    Count Leads per classification, aggregated in the database.
+
+    Accepts the same filters as list_leads_by_filter().
+
+    Returns:
+        Mapping of classification string (e.g., "Gold") to lead count.
+        Classifications with no matching leads are absent.
+
+    Raises:
+        RuntimeError: If Supabase returns an error response
+    """
+    response = execute_with_retry(
+        supabase.rpc(
+            "count_by_classification",
+            {"p_state": state, "p_classification": classification},
+        )
+    )
+    error = getattr(response, "error", None)
+    if error:
+        raise RuntimeError(f"Failed to count leads by classification: {error}")
+
+    rows = getattr(response, "data", None) or []
+    return {row["classification"]: int(row["lead_count"]) for row in rows}
+
+
+def count_leads_by_classification_and_state() -> dict[tuple[str, str], int]:
+    """
+    Count all Leads per (classification, state), aggregated in the database.
+
+    Returns:
+        Mapping of (classification, state) to lead count.
+        Combinations with no leads are absent.
+
+    Raises:
+        RuntimeError: If Supabase returns an error response
+    """
+    response = execute_with_retry(supabase.rpc("count_by_classification_and_state", {}))
+    error = getattr(response, "error", None)
+    if error:
+        raise RuntimeError(f"Failed to count leads by classification and state: {error}")
+
+    rows = getattr(response, "data", None) or []
+    return {
+        (row["classification"], row["state"]): int(row["lead_count"])
+        for row in rows
+    }
+
+
 __all__ = [
     "insert_lead",
     "insert_leads_bulk",
+    "copy_leads",
+    "COPY_AVAILABLE",
     "get_lead_by_id",
+    "get_leads_by_ids",
     "list_leads_by_filter",
+    "iter_leads_by_filter",
+    "count_leads_by_classification",
+    "count_leads_by_classification_and_state",
 ]
 
 
@@ -7,8 +7,9 @@ classification (Gold/Silver) and age bucket.
 
 from __future__ import annotations
 
+import time
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Optional
 from uuid import UUID
 
 from domain.age_bucket import AgeBucket
@@ -16,6 +17,52 @@ from domain.lead import LeadClassification
 from repositories.client import supabase
 
 
+# Active pricing rarely changes, so all active rules are cached in-process and
+# refreshed with one query once this many seconds have passed.
+_PRICING_CACHE_TTL_SECONDS = 300.0
+
+# (classification, age_bucket) value pair -> active price, and the
+# time.monotonic() deadline after which it is refetched.
+_pricing_cache: dict[tuple[str, str], Decimal] = {}
+_pricing_cache_expires_at = 0.0
+
+
+def _get_cached_pricing() -> dict[tuple[str, str], Decimal]:
+    """Return all active pricing, refetching it when the cache has expired."""
+    global _pricing_cache, _pricing_cache_expires_at
+
+    now = time.monotonic()
+    if now >= _pricing_cache_expires_at:
+        _pricing_cache = get_all_active_pricing()
+        _pricing_cache_expires_at = now + _PRICING_CACHE_TTL_SECONDS
+    return _pricing_cache
+
+
+def clear_pricing_cache() -> None:
+    """
+    Drop cached pricing so the next lookup reads the pricing_rules table.
+
+    Call this after changing pricing rules if the new prices must apply
+    before the cache expires on its own.
+    """
+    global _pricing_cache_expires_at
+    _pricing_cache_expires_at = 0.0
+
+
+def _parse_price(value: Any) -> Decimal:
+    """
+    Convert a base_price value from Supabase into a Decimal.
+
+    PostgREST may serialize NUMERIC columns either as JSON strings or as JSON
+    numbers. Strings are passed to Decimal directly; numbers go through their
+    shortest repr so that e.g. 7.1 becomes Decimal('7.1') rather than the
+    exact binary float value.
+    """
+    if isinstance(value, str):
+        return Decimal(value)
+    return Decimal(str(value))
+
+
 def get_active_pricing(
     classification: LeadClassification,
     age_bucket: AgeBucket
@@ -34,26 +81,7 @@ def get_active_pricing(
         price = get_active_pricing(LeadClassification.GOLD, AgeBucket.MONTH_6_TO_8)
         # Returns Decimal('8.00') based on seed_pricing.sql
     """
-    response = (
-        supabase.table("pricing_rules")
-        .select("base_price")
-        .eq("classification", classification.value)
-        .eq("age_bucket", age_bucket.value)
-        .is_("effective_to", "null")  # Only active pricing (not historical)
-        .limit(1)
-        .execute()
-    )
-
-    error = getattr(response, "error", None)
-    if error:
-        raise RuntimeError(f"Failed to fetch pricing: {error}")
-
-    rows = getattr(response, "data", None) or []
-
-    if not rows:
-        return None
-
-    return Decimal(str(rows[0]["base_price"]))
+    return _get_cached_pricing().get((classification.value, age_bucket.value))
 
 
 def get_pricing_for_inventory_items(
@@ -73,7 +101,7 @@ def get_pricing_for_inventory_items(
         pricing = get_pricing_for_inventory_items(items)
         # Returns: {UUID('...'): Decimal('8.00'), UUID('...'): Decimal('7.50'), ...}
     """
-    # Group items by (classification, age_bucket) to minimize queries
+    # Group items by (classification, age_bucket) so each price is looked up once
     unique_combinations = set(
         (item.classification, item.age_bucket) for item in items
     )
@@ -129,7 +157,7 @@ def get_all_active_pricing() -> dict[tuple[str, str], Decimal]:
     result: dict[tuple[str, str], Decimal] = {}
     for row in rows:
         key = (row["classification"], row["age_bucket"])
-        result[key] = Decimal(str(row["base_price"]))
+        result[key] = _parse_price(row["base_price"])
 
     return result
 
@@ -138,4 +166,5 @@ __all__ = [
     "get_active_pricing",
     "get_pricing_for_inventory_items",
     "get_all_active_pricing",
+    "clear_pricing_cache",
 ]
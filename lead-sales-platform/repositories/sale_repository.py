@@ -8,10 +8,11 @@ only inserts and fetches sale records.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any, List, Mapping, Optional
-from uuid import UUID, uuid4
+from typing import Any, List, Mapping, Optional, Sequence
+from uuid import UUID
 
 from domain.age_bucket import AgeBucket
 from domain.sale import SaleRecord
@@ -22,12 +23,38 @@ from repositories.client import supabase
 # Keep this aligned with your database schema.
 _SALES_TABLE: str = "sales"
 
+# Module-level constants for row (de)serialization hot paths.
+# A dict lookup avoids EnumMeta.__call__ for every row.
+_UTC = timezone.utc
+_BUCKET_BY_VALUE: dict[str, AgeBucket] = {m.value: m for m in AgeBucket}
+
+# IDs per IN (...) filter in get_sales_by_ids; keeps the request URL short.
+_IDS_PER_REQUEST = 200
+
+
+@dataclass(frozen=True, slots=True)
+class SaleInput:
+    """
+    Input for recording a sale event.
+
+    Mirrors the arguments of record_sale(); sale_id and created_at are
+    assigned at insert time.
+    """
+    lead_id: UUID
+    client_id: UUID
+    bucket: AgeBucket
+    sold_at: datetime
+    purchase_price: Decimal
+    currency: str = "USD"
+    payment_status: Optional[str] = None  # pending, completed, failed, refunded
+    payment_transaction_id: Optional[str] = None  # External payment processor ID
+
 
 def _to_iso_utc(dt: datetime, *, name: str) -> str:
     """Serialize a UTC datetime to ISO-8601 (timezone-aware, offset 0)."""
 
     require_utc_timestamp(name, dt)
-    return dt.astimezone(timezone.utc).isoformat()
+    return dt.astimezone(_UTC).isoformat()
 
 
 def _parse_utc_datetime(value: Any) -> datetime:
@@ -45,8 +72,15 @@ def _parse_utc_datetime(value: Any) -> datetime:
         raise TypeError(f"Unsupported timestamp type: {type(value)!r}")
 
     if dt.tzinfo is None or dt.utcoffset() is None:
-        return dt.replace(tzinfo=timezone.utc)
-    return dt.astimezone(timezone.utc)
+        return dt.replace(tzinfo=_UTC)
+    return dt.astimezone(_UTC)
+
+
+def _parse_age_bucket(value: Any) -> AgeBucket:
+    """Map a stored age bucket to its enum member (ValueError if unknown)."""
+
+    member = _BUCKET_BY_VALUE.get(value)
+    return member if member is not None else AgeBucket(str(value))
 
 
 def _row_to_sale(row: Mapping[str, Any]) -> SaleRecord:
@@ -56,7 +90,7 @@ def _row_to_sale(row: Mapping[str, Any]) -> SaleRecord:
         sale_id=UUID(str(row["sale_id"])),
         lead_id=UUID(str(row["lead_id"])),
         client_id=UUID(str(row["client_id"])),
-        age_bucket=AgeBucket(str(row["age_bucket"])),
+        age_bucket=_parse_age_bucket(row["age_bucket"]),
         sold_at=_parse_utc_datetime(row["sold_at_utc"]),
         purchase_price=Decimal(str(row["purchase_price"])),
         currency=str(row.get("currency", "USD")),
@@ -66,6 +100,76 @@ def _row_to_sale(row: Mapping[str, Any]) -> SaleRecord:
     )
 
 
+def _sale_input_to_row(sale: SaleInput, created_at: datetime) -> dict[str, Any]:
+    """Convert a SaleInput to a Supabase row payload (sale_id omitted)."""
+
+    return {
+        "lead_id": str(sale.lead_id),
+        "client_id": str(sale.client_id),
+        "age_bucket": sale.bucket.value,
+        "sold_at_utc": _to_iso_utc(sale.sold_at, name="sold_at"),
+        "purchase_price": str(sale.purchase_price),
+        "currency": sale.currency,
+        "payment_status": sale.payment_status,
+        "payment_transaction_id": sale.payment_transaction_id,
+        "created_at_utc": created_at.isoformat(),
+    }
+
+
+def _insert_sales(sales: List[SaleInput], created_at: datetime, batch_size: int) -> List[UUID]:
+    """Insert sales in chunks of batch_size and return the database-assigned sale_ids in order."""
+
+    sale_ids: List[UUID] = []
+    for start in range(0, len(sales), batch_size):
+        chunk = sales[start:start + batch_size]
+        payloads = [_sale_input_to_row(sale, created_at) for sale in chunk]
+
+        response = supabase.table(_SALES_TABLE).insert(payloads).execute()
+        error = getattr(response, "error", None)
+        if error:
+            raise RuntimeError(f"Failed to record {len(chunk)} sales: {error}")
+
+        rows = getattr(response, "data", None) or []
+        if len(rows) != len(chunk):
+            raise RuntimeError(
+                f"Failed to record sales: expected {len(chunk)} rows returned, got {len(rows)}"
+            )
+        sale_ids.extend(UUID(str(row["sale_id"])) for row in rows)
+
+    return sale_ids
+
+
+def record_sales_bulk(sales: List[SaleInput], batch_size: int = 1000) -> List[UUID]:
+    """
+    Bulk insert multiple sale events into Supabase.
+
+    This is more efficient than calling record_sale() repeatedly: each chunk of
+    batch_size sales is sent in a single request.
+
+    Args:
+        sales: List of SaleInput to record
+        batch_size: Maximum number of rows per insert request (default: 1000)
+
+    Returns:
+        Database-assigned sale_ids, in the same order as `sales`
+
+    Raises:
+        RuntimeError: If Supabase returns an error response
+        ValueError: For invalid domain values (e.g., non-UTC sold_at)
+
+    Notes:
+        - Empty list is a no-op
+        - Each chunk is a single statement; chunks already inserted are not
+          rolled back if a later chunk fails
+    """
+    if not sales:
+        return []
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+
+    return _insert_sales(sales, datetime.now(_UTC), batch_size)
+
+
 def record_sale(
     lead_id: UUID,
     client_id: UUID,
@@ -91,29 +195,24 @@ def record_sale(
 
     Returns:
         SaleRecord domain model with the recorded sale
-    """
-
-    # Generate a new sale_id
-    sale_id = uuid4()
-    now = datetime.now(timezone.utc)
 
-    payload: dict[str, Any] = {
-        "sale_id": str(sale_id),
-        "lead_id": str(lead_id),
-        "client_id": str(client_id),
-        "age_bucket": bucket.value,
-        "sold_at_utc": _to_iso_utc(sold_at, name="sold_at"),
-        "purchase_price": str(purchase_price),
-        "currency": currency,
-        "payment_status": payment_status,
-        "payment_transaction_id": payment_transaction_id,
-        "created_at_utc": now.isoformat(),
-    }
+    Notes:
+        - sale_id is assigned by the database (gen_random_uuid() default) and
+          read back from the inserted row.
+    """
 
-    response = supabase.table(_SALES_TABLE).insert(payload).execute()
-    error = getattr(response, "error", None)
-    if error:
-        raise RuntimeError(f"Failed to record sale: {error}")
+    sale = SaleInput(
+        lead_id=lead_id,
+        client_id=client_id,
+        bucket=bucket,
+        sold_at=sold_at,
+        purchase_price=purchase_price,
+        currency=currency,
+        payment_status=payment_status,
+        payment_transaction_id=payment_transaction_id,
+    )
+    now = datetime.now(_UTC)
+    sale_id = _insert_sales([sale], now, batch_size=1)[0]
 
     return SaleRecord(
         sale_id=sale_id,
@@ -196,6 +295,34 @@ def get_sale_by_id(sale_id: UUID) -> Optional[SaleRecord]:
     return _row_to_sale(rows[0])
 
 
+def get_sales_by_ids(sale_ids: Sequence[UUID]) -> List[SaleRecord]:
+    """
+    Retrieve several sale records by ID with IN (...) queries.
+
+    IDs are sent _IDS_PER_REQUEST at a time to keep request URLs short, so N
+    sales cost ceil(N / _IDS_PER_REQUEST) round-trips instead of N.
+
+    Args:
+        sale_ids: Sale identifiers
+
+    Returns:
+        List[SaleRecord] in no particular order (unknown IDs are simply absent)
+    """
+
+    unique_ids = list(dict.fromkeys(str(sale_id) for sale_id in sale_ids))
+    sales: List[SaleRecord] = []
+    for start in range(0, len(unique_ids), _IDS_PER_REQUEST):
+        chunk = unique_ids[start:start + _IDS_PER_REQUEST]
+        response = supabase.table(_SALES_TABLE).select("*").in_("sale_id", chunk).execute()
+        error = getattr(response, "error", None)
+        if error:
+            raise RuntimeError(f"Failed to get sales: {error}")
+
+        rows = getattr(response, "data", None) or []
+        sales.extend(_row_to_sale(row) for row in rows)
+    return sales
+
+
 def update_payment_status(
     sale_id: UUID,
     payment_status: str,
@@ -230,10 +357,13 @@ def update_payment_status(
 
 
 __all__ = [
+    "SaleInput",
     "record_sale",
+    "record_sales_bulk",
     "list_sales_by_lead",
     "list_sales_by_client",
     "get_sale_by_id",
+    "get_sales_by_ids",
     "update_payment_status",
 ]
 
@@ -15,14 +15,15 @@ def check_inventory_status():
     """Check how many inventory items are sold vs available."""
 
     # Count total inventory
-    total_response = supabase.table("inventory").select("*", count="exact").execute()
+    total_response = supabase.table("inventory").select("inventory_id", count="exact").limit(1).execute()
     total_count = getattr(total_response, "count", 0) or 0
 
     # Count available (not sold)
     available_response = (
         supabase.table("inventory")
-        .select("*", count="exact")
+        .select("inventory_id", count="exact")
         .is_("sold_at_utc", "null")
+        .limit(1)
         .execute()
     )
     available_count = getattr(available_response, "count", 0) or 0
@@ -30,8 +31,9 @@ def check_inventory_status():
     # Count sold
     sold_response = (
         supabase.table("inventory")
-        .select("*", count="exact")
+        .select("inventory_id", count="exact")
         .not_.is_("sold_at_utc", "null")
+        .limit(1)
         .execute()
     )
     sold_count = getattr(sold_response, "count", 0) or 0
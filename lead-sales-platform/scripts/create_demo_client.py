@@ -22,17 +22,7 @@ DEMO_CLIENT_ID = UUID("123e4567-e89b-12d3-a456-426614174002")
 
 
 def create_demo_client():
-    """Create or update the demo client."""
-
-    # Check if client already exists
-    existing = supabase.table("clients").select("*").eq("client_id", str(DEMO_CLIENT_ID)).execute()
-
-    if existing.data:
-        print(f"Demo client already exists: {DEMO_CLIENT_ID}")
-        print(f"Client data: {existing.data[0]}")
-        return
-
-    # Insert demo client with correct schema
+    """Create the demo client if it does not already exist."""
     from datetime import datetime, timezone
     now = datetime.now(timezone.utc).isoformat()
 
@@ -48,17 +38,28 @@ def create_demo_client():
         "updated_at_utc": now
     }
 
-    result = supabase.table("clients").insert(client_data).execute()
+    # Single round trip: an existing row is left untouched and not returned
+    result = (
+        supabase.table("clients")
+        .upsert(client_data, on_conflict="client_id", ignore_duplicates=True)
+        .execute()
+    )
 
-    if result.data:
-        print(f"[SUCCESS] Demo client created successfully!")
-        print(f"  Client ID: {DEMO_CLIENT_ID}")
-        print(f"  Company: Demo Corporation")
-        print(f"  Email: demo@example.com")
-        print(f"  Status: active")
-    else:
+    error = getattr(result, "error", None)
+    if error:
         print(f"[ERROR] Failed to create demo client")
-        print(f"  Error: {result}")
+        print(f"  Error: {error}")
+        return
+
+    if not result.data:
+        print(f"Demo client already exists: {DEMO_CLIENT_ID}")
+        return
+
+    print(f"[SUCCESS] Demo client created successfully!")
+    print(f"  Client ID: {DEMO_CLIENT_ID}")
+    print(f"  Company: Demo Corporation")
+    print(f"  Email: demo@example.com")
+    print(f"  Status: active")
 
 
 if __name__ == "__main__":
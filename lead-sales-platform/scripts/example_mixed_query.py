@@ -9,6 +9,7 @@ different classification and age bucket combinations.
 from __future__ import annotations
 
 import sys
+from collections import Counter
 from pathlib import Path
 
 # Add parent directory to path
@@ -49,9 +50,11 @@ def example_1_same_bucket_different_classifications():
 
     leads = query_mixed_inventory(requests)
 
+    counts = Counter(l.classification for l in leads)
+
     print(f"Total leads: {len(leads)}")
-    print(f"Silver: {sum(1 for l in leads if l.classification == LeadClassification.SILVER)}")
-    print(f"Gold: {sum(1 for l in leads if l.classification == LeadClassification.GOLD)}")
+    print(f"Silver: {counts[LeadClassification.SILVER]}")
+    print(f"Gold: {counts[LeadClassification.GOLD]}")
     print()
 
 
@@ -87,10 +90,10 @@ def example_2_different_buckets_with_state_filter():
     print(f"Total leads: {len(leads)}")
 
     # Group by classification and bucket
+    groups = Counter((l.classification, l.age_bucket) for l in leads)
     for classification in [LeadClassification.SILVER, LeadClassification.GOLD]:
         for bucket in [AgeBucket.MONTH_6_TO_8, AgeBucket.MONTH_9_TO_11]:
-            count = sum(1 for l in leads
-                       if l.classification == classification and l.age_bucket == bucket)
+            count = groups[(classification, bucket)]
             if count > 0:
                 print(f"  {classification.value} + {bucket.value}: {count}")
     print()
@@ -140,10 +143,7 @@ def example_3_complex_multi_part():
     print("\nBreakdown:")
 
     # Group by classification and bucket
-    groups = {}
-    for lead in leads:
-        key = (lead.classification, lead.age_bucket)
-        groups[key] = groups.get(key, 0) + 1
+    groups = Counter((l.classification, l.age_bucket) for l in leads)
 
     for (classification, bucket), count in sorted(groups.items(),
                                                    key=lambda x: (x[0][0].value, x[0][1].value)):
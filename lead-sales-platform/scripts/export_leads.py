@@ -15,15 +15,24 @@ from __future__ import annotations
 
 import argparse
 import csv
+import os
 import sys
+from operator import attrgetter
 from pathlib import Path
-from typing import List
+from typing import Iterable
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from domain.lead import Lead
-from repositories.lead_repository import list_leads_by_filter
+from repositories.lead_repository import (
+    count_leads_by_classification,
+    iter_leads_by_filter,
+)
+
+# Output file buffer size. A large buffer lets rows accumulate in memory and
+# reach the OS in few large writes instead of many small ones.
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB
 
 # CSV column names in order (matching original CSV format)
 CSV_COLUMNS = [
@@ -55,74 +64,107 @@ CSV_COLUMNS = [
 ]
 
 
-def lead_to_csv_row(lead: Lead) -> dict[str, str]:
+# Lead attribute for each CSV column, in CSV_COLUMNS order
+_LEAD_FIELDS = (
+    "mortgage_id",
+    "campaign_id",
+    "type",
+    "call_in_date",
+    "status",
+    "full_name",
+    "first_name",
+    "last_name",
+    "co_borrower_name",
+    "address",
+    "city",
+    "county",
+    "state",
+    "zip",
+    "mortgage_amount",
+    "lender",
+    "sale_date",
+    "agent_id",
+    "call_in_phone_number",
+    "borrower_age",
+    "borrower_medical_issues",
+    "borrower_tobacco_use",
+    "co_borrower",
+    "borrower_phone",
+    "source",
+)
+
+# Fetches all fields of a lead in a single C-level call
+_get_lead_fields = attrgetter(*_LEAD_FIELDS)
+
+
+class NoLeadsToExportError(ValueError):
+    """Raised when there are no leads to export."""
+    pass
+
+
+def lead_to_csv_row(lead: Lead) -> tuple[str, ...]:
     """
-    Convert a Lead domain object to a CSV row dictionary.
+    Convert a Lead domain object to a CSV row.
 
     Args:
         lead: Lead domain object
 
     Returns:
-        Dictionary mapping CSV column names to values
+        Tuple of values in CSV_COLUMNS order, with None written as ""
     """
-    return {
-        "Mortage ID": lead.mortgage_id or "",
-        "Campaign ID": lead.campaign_id or "",
-        "Type": lead.type or "",
-        "Call In Date": lead.call_in_date or "",
-        "Status": lead.status or "",
-        "Full Name": lead.full_name or "",
-        "First Name": lead.first_name or "",
-        "Last Name": lead.last_name or "",
-        "Co-Borrower Name": lead.co_borrower_name or "",
-        "Address": lead.address or "",
-        "City": lead.city or "",
-        "County": lead.county or "",
-        "State": lead.state,
-        "Zip": lead.zip or "",
-        "Mortgage Amount": lead.mortgage_amount or "",
-        "Lender": lead.lender or "",
-        "Sale Date": lead.sale_date or "",
-        "Agent ID": lead.agent_id or "",
-        "Call In Phone Number": lead.call_in_phone_number or "",
-        "Borrower Age": lead.borrower_age or "",
-        "Borrower Medical Issues": lead.borrower_medical_issues or "",
-        "Borrower Tobacco Use": lead.borrower_tobacco_use or "",
-        "Co-Borrower ?": lead.co_borrower or "",
-        "Borrower Phone": lead.borrower_phone or "",
-        "Source": lead.source or "",
-    }
+    return tuple("" if value is None else value for value in _get_lead_fields(lead))
 
 
 def export_leads_to_csv(
-    leads: List[Lead],
+    leads: Iterable[Lead],
     output_path: str,
-) -> None:
+) -> int:
     """
     Export leads to CSV file with all columns.
 
+    Leads are written as they are consumed from the iterable, so a streaming
+    source never has to be held in memory. The output file is only created
+    once the first lead has arrived, and is removed if the export fails
+    part way.
+
     Args:
-        leads: List of Lead objects to export
+        leads: Iterable of Lead objects to export
         output_path: Path to output CSV file
 
+    Returns:
+        Number of leads written
+
     Raises:
-        ValueError: If leads list is empty
+        NoLeadsToExportError: If there are no leads (no file is created)
     """
-    if not leads:
-        raise ValueError("No leads to export")
+    leads = iter(leads)
+    first_lead = next(leads, None)
+    if first_lead is None:
+        raise NoLeadsToExportError("No leads to export")
 
-    print(f"Exporting {len(leads)} leads to {output_path}")
+    print(f"Exporting leads to {output_path}")
     print(f"CSV will contain {len(CSV_COLUMNS)} columns")
 
     # Write CSV
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
-        writer.writeheader()
-
-        for lead in leads:
-            writer.writerow(lead_to_csv_row(lead))
-
-    print(f"✓ Successfully exported {len(leads)} leads")
+    written = 0
+    f = open(output_path, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE)
+    try:
+        with f:
+            writer = csv.writer(f)
+            writerow = writer.writerow
+            writerow(CSV_COLUMNS)
+            writerow(lead_to_csv_row(first_lead))
+            written += 1
+            for lead in leads:
+                writerow(lead_to_csv_row(lead))
+                written += 1
+    except BaseException:
+        # Don't leave a truncated export behind
+        os.remove(output_path)
+        raise
+
+    print(f"✓ Successfully exported {written} leads")
+    return written
 
 
 def main() -> int:
@@ -178,28 +220,32 @@ Examples:
         print(f"  State filter: {args.state or 'None (all)'}")
         print()
 
-        leads = list_leads_by_filter(
+        leads = iter_leads_by_filter(
             state=args.state,
             classification=args.classification,
         )
 
-        if not leads:
+        # Export to CSV
+        try:
+            exported = export_leads_to_csv(leads, args.output)
+        except NoLeadsToExportError:
             print("No leads found matching the specified filters")
             return 1
 
-        # Export to CSV
-        export_leads_to_csv(leads, args.output)
-
         # Print summary
         print()
         print("=" * 60)
         print("EXPORT SUMMARY")
         print("=" * 60)
-        print(f"Total leads exported: {len(leads)}")
+        print(f"Total leads exported: {exported}")
 
-        # Count classifications
-        gold_count = sum(1 for lead in leads if lead.classification.value == "Gold")
-        silver_count = len(leads) - gold_count
+        # Count classifications (aggregated in the database)
+        classification_counts = count_leads_by_classification(
+            state=args.state,
+            classification=args.classification,
+        )
+        gold_count = classification_counts.get("Gold", 0)
+        silver_count = classification_counts.get("Silver", 0)
 
         print(f"  Gold leads:   {gold_count}")
         print(f"  Silver leads: {silver_count}")
@@ -17,16 +17,132 @@ Schedule via cron (daily at 1 AM UTC):
 from __future__ import annotations
 
 import argparse
+import logging
 import sys
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from uuid import UUID
+from typing import Iterator
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from domain.age_bucket import AgeBucket, LeadAge
-from repositories.client import supabase
+from domain.age_bucket import AgeBucket
+from repositories.client import execute_with_retry, supabase
+
+logger = logging.getLogger(__name__)
+
+# Log progress every PROGRESS_INTERVAL eligible leads (must be a power of two)
+PROGRESS_INTERVAL = 4096
+
+# Number of leads processed per insert_eligible_inventory() call. Each call
+# runs as one statement, so keep it well within the statement timeout.
+SERVER_PAGE_SIZE = 5000
+
+
+def _fetch_existing_inventory_keys(page_size: int = 1000) -> set[tuple[str, str]]:
+    """
+    Fetch all existing inventory (lead_id, age_bucket) pairs.
+
+    Returns:
+        Set of (lead_id, age_bucket) string pairs already present in inventory
+    """
+    existing: set[tuple[str, str]] = set()
+    offset = 0
+
+    while True:
+        response = execute_with_retry(
+            supabase.table("inventory")
+            .select("lead_id, age_bucket")
+            .range(offset, offset + page_size - 1)
+        )
+        error = getattr(response, "error", None)
+        if error:
+            raise RuntimeError(f"Failed to fetch existing inventory: {error}")
+
+        rows = getattr(response, "data", None) or []
+        if not rows:
+            break
+
+        existing.update((str(row["lead_id"]), str(row["age_bucket"])) for row in rows)
+        if len(rows) < page_size:
+            break
+        offset += len(rows)
+
+    return existing
+
+
+def _iter_eligible_leads(as_of_date: datetime, page_size: int = 1000) -> Iterator[dict]:
+    """
+    Stream (lead_id, age_bucket) rows for leads eligible as of as_of_date.
+
+    Pages through the compute_lead_buckets() database function using keyset
+    pagination on lead_id, so only one page is held in memory at a time.
+    """
+    last_lead_id = None
+
+    while True:
+        response = execute_with_retry(
+            supabase.rpc(
+                "compute_lead_buckets",
+                {
+                    "p_as_of": as_of_date.isoformat(),
+                    "p_after_lead_id": last_lead_id,
+                    "p_limit": page_size,
+                },
+            )
+        )
+        error = getattr(response, "error", None)
+        if error:
+            raise RuntimeError(f"Failed to compute lead buckets: {error}")
+
+        rows = getattr(response, "data", None) or []
+        if not rows:
+            return
+
+        yield from rows
+
+        if len(rows) < page_size:
+            return
+        last_lead_id = rows[-1]["lead_id"]
+
+
+def _insert_eligible_inventory_page(
+    as_of_date: datetime,
+    after_lead_id: str | None,
+    page_size: int = SERVER_PAGE_SIZE,
+) -> tuple[int, int, str | None]:
+    """
+    Insert inventory for the next keyset page of eligible leads, server-side.
+
+    Calls the insert_eligible_inventory() database function, which buckets the
+    page and inserts it with ON CONFLICT (lead_id, age_bucket) DO NOTHING, so
+    the request is safe to retry when Supabase rate-limits it.
+
+    Returns:
+        Tuple of (leads_scanned, rows_inserted, last_lead_id_of_page)
+
+    Raises:
+        RuntimeError: If the page could not be written
+    """
+    response = execute_with_retry(
+        supabase.rpc(
+            "insert_eligible_inventory",
+            {
+                "p_as_of": as_of_date.isoformat(),
+                "p_after_lead_id": after_lead_id,
+                "p_limit": page_size,
+            },
+        )
+    )
+    error = getattr(response, "error", None)
+    if error:
+        raise RuntimeError(f"Failed to insert inventory page: {error}")
+
+    rows = getattr(response, "data", None) or []
+    if not rows:
+        return 0, 0, None
+    row = rows[0]
+    return int(row["scanned"] or 0), int(row["inserted"] or 0), row["last_lead_id"]
 
 
 def generate_inventory_for_all_leads(
@@ -36,6 +152,10 @@ def generate_inventory_for_all_leads(
     """
     Scan all leads and create inventory records for eligible age buckets.
 
+    Inventory is inserted by the database one page at a time; only counts
+    are returned to the script. A dry run streams the computed buckets
+    instead and compares them with the existing inventory locally.
+
     Args:
         as_of_date: The timestamp to use for age calculation
         dry_run: If True, only simulate without inserting records
@@ -57,119 +177,72 @@ def generate_inventory_for_all_leads(
         'too_young': 0,
     }
 
-    print(f"Generating inventory as of: {as_of_date.isoformat()}")
-    print(f"Dry run: {dry_run}")
-    print()
-
-    # Query all leads (Supabase RPC to get count first, then paginate)
-    print("Fetching all leads from database...")
-
-    # Get total count first
-    count_response = supabase.table("leads").select("*", count="exact").execute()
-    total_leads_in_db = getattr(count_response, "count", 0) or 0
-    print(f"Database contains {total_leads_in_db} total leads")
-
-    # Fetch all leads with pagination
-    all_leads = []
-    page_size = 1000
-    offset = 0
-
-    while offset < total_leads_in_db:
-        print(f"  Fetching leads {offset} to {offset + page_size}...")
-        response = (
-            supabase.table("leads")
-            .select("lead_id, created_at_utc")
-            .range(offset, offset + page_size - 1)
-            .execute()
-        )
-        error = getattr(response, "error", None)
-        if error:
-            raise RuntimeError(f"Failed to fetch leads: {error}")
-
-        page_leads = getattr(response, "data", None) or []
-        if not page_leads:
-            break
-
-        all_leads.extend(page_leads)
-        offset += len(page_leads)
-
-    leads = all_leads
-    stats['total_leads'] = len(leads)
-
-    print(f"Found {stats['total_leads']} leads")
-    print()
-
-    # Process each lead
-    for idx, lead_row in enumerate(leads, start=1):
-        lead_id = UUID(lead_row["lead_id"])
-        created_at_utc_str = lead_row["created_at_utc"]
-
-        # Parse timestamp
-        if isinstance(created_at_utc_str, str):
-            created_at_utc_str = created_at_utc_str.replace("Z", "+00:00")
-            created_at_utc = datetime.fromisoformat(created_at_utc_str)
-        elif isinstance(created_at_utc_str, datetime):
-            created_at_utc = created_at_utc_str
-        else:
-            print(f"  WARNING: Lead {lead_id} has invalid created_at_utc type")
-            continue
-
-        # Ensure UTC
-        if created_at_utc.tzinfo is None:
-            created_at_utc = created_at_utc.replace(tzinfo=timezone.utc)
-
-        # Calculate age
-        lead_age = LeadAge(created_at_utc=created_at_utc, as_of_utc=as_of_date)
-        age_days = lead_age.age_days()
-        bucket = lead_age.bucket()
-
-        # Progress indicator
-        if idx % 500 == 0:
-            print(f"Processed {idx}/{stats['total_leads']} leads...")
-
-        # Skip if too young (< 90 days)
-        if bucket is None:
-            stats['too_young'] += 1
-            continue
+    logger.info("Generating inventory as of: %s", as_of_date.isoformat())
+    logger.info("Dry run: %s", dry_run)
 
+    # Count leads younger than 90 days (range count on idx_leads_created_at_utc)
+    too_young_cutoff = as_of_date - timedelta(days=90)
+    too_young_response = execute_with_retry(
+        supabase.table("leads")
+        .select("lead_id", count="exact")
+        .gt("created_at_utc", too_young_cutoff.isoformat())
+        .limit(1)
+    )
+    stats['too_young'] = getattr(too_young_response, "count", 0) or 0
+
+    logger.info("Processing eligible leads...")
+
+    if not dry_run:
+        # Bucketing and inserting both happen in the database, page by page
+        last_lead_id: str | None = None
+        while True:
+            scanned, inserted, last_lead_id = _insert_eligible_inventory_page(
+                as_of_date, last_lead_id
+            )
+            stats['eligible_leads'] += scanned
+            stats['new_inventory_created'] += inserted
+            stats['already_exists'] += scanned - inserted
+
+            if scanned:
+                logger.info(
+                    "Processed %d eligible leads (%d new inventory records)...",
+                    stats['eligible_leads'],
+                    stats['new_inventory_created'],
+                )
+            if scanned < SERVER_PAGE_SIZE or last_lead_id is None:
+                break
+
+        stats['total_leads'] = stats['eligible_leads'] + stats['too_young']
+        return stats
+
+    # Dry run cannot rely on ON CONFLICT to detect duplicates, so fetch
+    # existing (lead_id, age_bucket) pairs once and check locally.
+    logger.info("Fetching existing inventory records...")
+    existing = _fetch_existing_inventory_keys()
+    logger.info("Found %d existing inventory records", len(existing))
+
+    bucket_values = {bucket.value for bucket in AgeBucket}
+
+    # Stream eligible leads page by page (age bucket computed in the database;
+    # leads younger than 90 days are filtered out server-side)
+    for row in _iter_eligible_leads(as_of_date):
+        # Both values arrive from the RPC as strings already
+        lead_id: str = row["lead_id"]
+        bucket_value: str = row["age_bucket"]
+        if bucket_value not in bucket_values:
+            raise ValueError(f"Unknown age bucket from database: {bucket_value!r}")
         stats['eligible_leads'] += 1
 
-        # Check if inventory already exists
-        check_response = (
-            supabase.table("inventory")
-            .select("inventory_id")
-            .eq("lead_id", str(lead_id))
-            .eq("age_bucket", bucket.value)
-            .limit(1)
-            .execute()
-        )
-
-        existing = getattr(check_response, "data", None) or []
+        # Progress indicator
+        if stats['eligible_leads'] & (PROGRESS_INTERVAL - 1) == 0:
+            logger.info("Processed %d eligible leads...", stats['eligible_leads'])
 
-        if existing:
+        if (lead_id, bucket_value) in existing:
             stats['already_exists'] += 1
-            continue
-
-        # Create new inventory record
-        if not dry_run:
-            inventory_payload = {
-                "lead_id": str(lead_id),
-                "age_bucket": bucket.value,
-                "created_at_utc": as_of_date.isoformat(),
-                "sold_at_utc": None,  # Available
-            }
-
-            insert_response = supabase.table("inventory").insert(inventory_payload).execute()
-            insert_error = getattr(insert_response, "error", None)
-
-            if insert_error:
-                print(f"  ERROR: Failed to create inventory for lead {lead_id}: {insert_error}")
-                continue
-
-        stats['new_inventory_created'] += 1
+        else:
+            stats['new_inventory_created'] += 1
 
-        if stats['new_inventory_created'] % 100 == 0:
-            print(f"  Created {stats['new_inventory_created']} new inventory records...")
+    stats['total_leads'] = stats['eligible_leads'] + stats['too_young']
 
     return stats
 
@@ -231,6 +304,13 @@ Schedule via cron (daily at 1 AM UTC):
 
     args = parser.parse_args()
 
+    # Status lines go to stderr; stdout carries only the summary
+    logging.basicConfig(
+        level=logging.INFO,
+        stream=sys.stderr,
+        format="%(asctime)s %(message)s",
+    )
+
     try:
         # Determine as-of date
         if args.as_of_date:
@@ -241,8 +321,7 @@ Schedule via cron (daily at 1 AM UTC):
             as_of_date = datetime.now(timezone.utc)
 
         # Run inventory generation
-        print("Starting inventory generation...")
-        print()
+        logger.info("Starting inventory generation...")
 
         stats = generate_inventory_for_all_leads(
             as_of_date=as_of_date,
@@ -7,33 +7,268 @@ Imports leads from CSV files into the Supabase database with:
 - Dynamic timezone detection from State column
 - Batch processing with error handling
 - Summary statistics and error logging
+- C++ CSV parsing via pyarrow when installed (optional)
+- Error log encoded with orjson when installed (optional)
+- Bounded memory: at most one batch per insert worker is queued, and raw
+  CSV rows are not retained once their Lead has been built
+- Optional multi-process parsing of large files (--parallel)
 
 Usage:
     python ingest_csv_leads.py path/to/leads.csv
     python ingest_csv_leads.py path/to/leads.csv --batch-size 500 --dry-run
+    python ingest_csv_leads.py path/to/leads.csv --parallel 4
 """
 
 from __future__ import annotations
 
 import argparse
 import csv
+import importlib
+import io
 import json
+import mmap
+import os
+import queue
 import sys
-from dataclasses import dataclass
-from datetime import datetime
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import timezone
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from uuid import uuid4
+from types import ModuleType
+from typing import TYPE_CHECKING, Callable, Generator, Iterable, Iterator, Mapping, Sequence, cast
+from zoneinfo import ZoneInfo
+from uuid import UUID, uuid4
+
+# pyarrow is optional: when installed, CSV files are tokenized by its
+# multithreaded C++ reader instead of the pure-Python csv module.
+pyarrow: ModuleType | None
+try:
+    pyarrow = importlib.import_module("pyarrow")
+    importlib.import_module("pyarrow.csv")
+except ImportError:  # pragma: no cover - depends on environment
+    pyarrow = None
+
+if TYPE_CHECKING:
+    # Names used only in annotations of the pyarrow reader
+    from pyarrow import RecordBatch  # type: ignore[import-not-found, import-untyped]
+    from pyarrow.csv import CSVStreamingReader  # type: ignore[import-not-found, import-untyped]
+
+# orjson is optional: when installed, the error log is encoded by it instead
+# of the stdlib json module.
+orjson: ModuleType | None
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
 
 # Add parent directory to path to import modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from domain.lead import Lead
-from repositories.lead_repository import insert_lead, insert_leads_bulk
-from scripts.classification import classify_lead, get_classification_summary
-from scripts.timezone_utils import parse_timestamp_with_state_timezone
+from domain.lead import Lead, LeadClassification
+from repositories.lead_repository import COPY_AVAILABLE, copy_leads, insert_lead, insert_leads_bulk
+from scripts.classification import GOLD_REQUIRED_FIELDS, get_classification_summary
+from scripts.timezone_utils import DEFAULT_TIMESTAMP_FORMAT, get_timezone_for_state, parse_naive_timestamp
 
 
-@dataclass
+# Read buffer for CSV files parsed with the csv module
+READ_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+# Bytes of CSV text parsed per pyarrow record batch
+ARROW_BLOCK_SIZE = 8 << 20  # 8 MiB
+
+# Rows sent per bulk insert request
+DEFAULT_BATCH_SIZE = 1000
+
+# Batches at least this large are loaded with COPY when asyncpg and
+# DATABASE_URL are available; smaller ones use the Supabase bulk insert.
+COPY_MIN_BATCH_SIZE = 500
+
+# Error details kept in memory (and written to the error log); older ones
+# are dropped first. Counters still cover every error.
+DEFAULT_MAX_ERRORS = 10_000
+
+# Lead IDs generated per os.urandom call while parsing
+LEAD_ID_BLOCK_SIZE = 1024
+
+# With --parallel, the file is split into newline-aligned byte ranges of at
+# most PARSE_RANGE_SIZE bytes (smaller for small files, so every process gets
+# RANGES_PER_PARSE_PROCESS of them). At most RANGES_PER_PARSE_PROCESS ranges
+# per process are parsed ahead of the insert workers, so the leads held in
+# memory cover at most processes * RANGES_PER_PARSE_PROCESS * PARSE_RANGE_SIZE
+# bytes of CSV, whatever the file size.
+PARSE_RANGE_SIZE = 4 << 20  # 4 MiB
+RANGES_PER_PARSE_PROCESS = 4
+
+# Insert requests in flight at once. Keep well below the Supabase
+# connection pool size.
+DEFAULT_INSERT_WORKERS = 4
+
+
+# Format of the "Call In Date" column (local time in the lead's state)
+CALL_IN_DATE_FORMAT = DEFAULT_TIMESTAMP_FORMAT
+
+# Optional Lead fields and the CSV column each one is read from
+_OPTIONAL_FIELD_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("source", "Source"),
+
+    # Mortgage identification
+    ("mortgage_id", "Mortage ID"),  # Note: CSV has typo "Mortage"
+    ("campaign_id", "Campaign ID"),
+    ("type", "Type"),
+    ("status", "Status"),
+
+    # Contact information
+    ("full_name", "Full Name"),
+    ("first_name", "First Name"),
+    ("last_name", "Last Name"),
+    ("co_borrower_name", "Co-Borrower Name"),
+
+    # Address fields
+    ("address", "Address"),
+    ("city", "City"),
+    ("county", "County"),
+    ("zip", "Zip"),
+
+    # Financial information
+    ("mortgage_amount", "Mortgage Amount"),
+    ("lender", "Lender"),
+    ("sale_date", "Sale Date"),
+
+    # Agent and contact details
+    ("agent_id", "Agent ID"),
+    ("call_in_phone_number", "Call In Phone Number"),
+    ("borrower_phone", "Borrower Phone"),
+
+    # Qualification fields
+    ("borrower_age", "Borrower Age"),
+    ("borrower_medical_issues", "Borrower Medical Issues"),
+    ("borrower_tobacco_use", "Borrower Tobacco Use"),
+    ("co_borrower", "Co-Borrower ?"),
+)
+
+
+# Columns every row must have a non-empty value for
+REQUIRED_COLUMNS: tuple[str, ...] = ("State", "Call In Date")
+
+
+@dataclass(frozen=True, slots=True)
+class CsvLayout:
+    """
+    Column positions for reading CSV rows as sequences of strings.
+
+    Built once from the header so that each row is read by index instead of
+    being turned into a dictionary.
+    """
+    state: int
+    call_in_date: int
+    optional_fields: tuple[tuple[str, int], ...]  # (Lead field, column index)
+    gold_fields: tuple[str, ...]  # Lead fields whose column is Gold-required
+    has_all_gold_fields: bool
+
+    # Generated Lead builder for these positions (see _compile_lead_builder)
+    build_lead: Callable[..., Lead] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "build_lead", _compile_lead_builder(self))
+
+    @classmethod
+    def from_header(cls, header: Sequence[str]) -> "CsvLayout":
+        """
+        Build a layout from the CSV header row.
+
+        Optional and Gold columns missing from the header are ignored (the
+        Lead field stays None and the lead can only be Silver).
+
+        Raises:
+            ValueError: If a required column is missing
+        """
+        index = {name: i for i, name in enumerate(header)}
+        missing = [name for name in REQUIRED_COLUMNS if name not in index]
+        if missing:
+            raise ValueError(f"CSV missing required columns: {', '.join(missing)}")
+
+        gold_fields = tuple(
+            field
+            for field, column in _OPTIONAL_FIELD_COLUMNS
+            if column in GOLD_REQUIRED_FIELDS and column in index
+        )
+        return cls(
+            state=index["State"],
+            call_in_date=index["Call In Date"],
+            optional_fields=tuple(
+                (field, index[column])
+                for field, column in _OPTIONAL_FIELD_COLUMNS
+                if column in index
+            ),
+            gold_fields=gold_fields,
+            has_all_gold_fields=len(gold_fields) == len(GOLD_REQUIRED_FIELDS),
+        )
+
+
+@lru_cache(maxsize=16)
+def _compile_lead_builder(layout: CsvLayout) -> Callable[..., Lead]:
+    """
+    Generate the function that strips a row's optional fields, classifies
+    the lead and constructs it, with this layout's column indices written
+    in as constants.
+
+    Rows then run straight-line code instead of building a keyword-argument
+    dictionary per row. Only Lead field names from _OPTIONAL_FIELD_COLUMNS
+    and integer indices are interpolated, never CSV header text. Layouts
+    built from the same header share one function.
+
+    The generated function is
+    build(values, lead_id, state, call_in_date, created_at_utc) -> Lead.
+    """
+    lines = ["def build(values, lead_id, state, call_in_date, created_at_utc):"]
+    for name, i in layout.optional_fields:
+        lines.append(f"    {name} = values[{i}].strip() or None")
+
+    # Same rule as classification.classify_lead
+    if layout.has_all_gold_fields:
+        lines.append(f"    classification = GOLD if ({' and '.join(layout.gold_fields)}) else SILVER")
+    else:
+        lines.append("    classification = SILVER")
+
+    lines.append("    return Lead(")
+    lines.append("        lead_id=lead_id, state=state, classification=classification,")
+    lines.append("        created_at_utc=created_at_utc, call_in_date=call_in_date,")
+    lines.extend(f"        {name}={name}," for name, _ in layout.optional_fields)
+    lines.append("    )")
+
+    namespace = {
+        "Lead": Lead,
+        "GOLD": LeadClassification.GOLD,
+        "SILVER": LeadClassification.SILVER,
+    }
+    exec("\n".join(lines), namespace)
+    return cast("Callable[..., Lead]", namespace["build"])
+
+
+# Every column the ingestion reads, used to adapt dictionary rows
+_KNOWN_COLUMNS: tuple[str, ...] = tuple(dict.fromkeys(
+    [*REQUIRED_COLUMNS, *GOLD_REQUIRED_FIELDS, *(column for _, column in _OPTIONAL_FIELD_COLUMNS)]
+))
+_KNOWN_COLUMNS_LAYOUT = CsvLayout.from_header(_KNOWN_COLUMNS)
+
+
+def _as_indexed_row(
+    row: Mapping[str, str] | Sequence[str],
+    layout: CsvLayout | None,
+) -> tuple[Sequence[str], CsvLayout]:
+    """Return (values, layout) for a row; dictionary rows are converted to values."""
+    if layout is not None:
+        return row, layout  # type: ignore[return-value]
+    return [row.get(column) or "" for column in _KNOWN_COLUMNS], _KNOWN_COLUMNS_LAYOUT  # type: ignore[union-attr]
+
+
+@dataclass(slots=True)
 class IngestionResult:
     """Results from CSV ingestion operation."""
     total_rows: int
@@ -42,10 +277,116 @@ class IngestionResult:
     skipped: int
     gold_count: int
     silver_count: int
-    errors: list[dict]
+    errors: deque[dict]  # Most recent errors; bounded by max_errors
+
+
+@dataclass(slots=True)
+class _ParsedRows:
+    """Leads built from a run of CSV rows, plus that run's counters and errors."""
+    leads: list[Lead]
+    errors: list[dict]  # row_num counts from 0 at the first row of the run
+    total_rows: int
+    skipped: int
+    failed: int
+    gold_count: int
+    silver_count: int
+
 
+def _open_csv_text(csv_file: Path) -> io.TextIOWrapper:
+    """
+    Open a CSV file for the csv module with a large read buffer.
 
-def validate_row(row: dict[str, str], row_num: int) -> tuple[bool, str | None]:
+    The file is read in binary mode through a READ_BUFFER_SIZE buffer and a
+    leading UTF-8 BOM is skipped once, instead of relying on utf-8-sig
+    decoding with the default 8 KiB buffer.
+    """
+    raw = io.BufferedReader(io.FileIO(csv_file, "rb"), buffer_size=READ_BUFFER_SIZE)
+    if raw.peek(len(_UTF8_BOM)).startswith(_UTF8_BOM):
+        raw.read(len(_UTF8_BOM))
+    return io.TextIOWrapper(raw, encoding="utf-8", newline="")
+
+
+def _read_csv_header(csv_file: Path) -> list[str]:
+    """Return the CSV column names from the header row (empty if the file is empty)."""
+    with _open_csv_text(csv_file) as f:
+        return next(csv.reader(f), [])
+
+
+def _iter_csv_rows(csv_file: Path, fieldnames: list[str]) -> Iterator[Sequence[str]]:
+    """
+    Yield CSV data rows as sequences of strings in header order.
+
+    Uses pyarrow's streaming CSV reader when available, reading every column
+    as a string. Falls back to csv.reader otherwise, when the header repeats
+    a column name, or from the first row pyarrow rejects (such as a short or
+    ragged row), so both backends yield the same rows. Blank lines are
+    skipped.
+
+    Args:
+        csv_file: Path to the CSV file
+        fieldnames: Column names from the header row
+
+    Yields:
+        One sequence of column values per data row
+    """
+    if pyarrow is None or len(set(fieldnames)) != len(fieldnames):
+        yield from _iter_csv_module_rows(csv_file)
+        return
+
+    rows_read = 0
+    try:
+        for row in _iter_arrow_rows(csv_file, fieldnames):
+            yield row
+            rows_read += 1
+    except pyarrow.ArrowInvalid:
+        # pyarrow aborts on a row with the wrong number of columns, while
+        # csv.reader returns it to be padded or reported like any other.
+        # Continue with csv.reader after the rows already yielded.
+        yield from islice(_iter_csv_module_rows(csv_file), rows_read, None)
+
+
+def _iter_csv_module_rows(csv_file: Path) -> Iterator[list[str]]:
+    """Yield the data rows of a CSV file parsed with csv.reader, skipping blank lines."""
+    with _open_csv_text(csv_file) as f:
+        reader = csv.reader(f)
+        next(reader, None)  # Header
+        for row in reader:
+            if row:
+                yield row
+
+
+def _iter_arrow_rows(csv_file: Path, fieldnames: list[str]) -> Iterator[tuple[str, ...]]:
+    """
+    Yield the data rows of a CSV file parsed with pyarrow, skipping blank lines.
+
+    Quoted values may contain line breaks, as with csv.reader.
+
+    Raises:
+        RuntimeError: If pyarrow is not installed
+        pyarrow.ArrowInvalid: If a row does not have one value per column
+    """
+    if pyarrow is None:
+        raise RuntimeError("pyarrow is not installed")
+    reader: CSVStreamingReader = pyarrow.csv.open_csv(
+        csv_file,
+        read_options=pyarrow.csv.ReadOptions(block_size=ARROW_BLOCK_SIZE),
+        parse_options=pyarrow.csv.ParseOptions(newlines_in_values=True),
+        convert_options=pyarrow.csv.ConvertOptions(
+            column_types={name: pyarrow.string() for name in fieldnames},
+            strings_can_be_null=False,
+        ),
+    )
+    batch: RecordBatch
+    for batch in reader:
+        # Columns are read by position, not name
+        yield from zip(*(column.to_pylist() for column in batch.columns))
+
+
+def validate_row(
+    row: Mapping[str, str] | Sequence[str],
+    row_num: int,
+    layout: CsvLayout | None = None,
+) -> tuple[bool, str | None]:
     """
     Validate that a CSV row has all required fields.
 
@@ -56,28 +397,52 @@ def validate_row(row: dict[str, str], row_num: int) -> tuple[bool, str | None]:
     Note: Source is now optional - empty Source classifies lead as Silver.
 
     Args:
-        row: CSV row dictionary
+        row: CSV row values (with layout) or a dictionary keyed by column name
         row_num: Row number for error reporting
+        layout: Column positions for a row given as values
 
     Returns:
         Tuple of (is_valid, error_message)
     """
-    required_fields = ["State", "Call In Date"]
+    values, layout = _as_indexed_row(row, layout)
 
-    for field in required_fields:
-        value = row.get(field, "").strip()
-        if not value:
-            return False, f"Missing required field: {field}"
+    if not values[layout.state].strip():
+        return False, "Missing required field: State"
+    if not values[layout.call_in_date].strip():
+        return False, "Missing required field: Call In Date"
 
     return True, None
 
 
-def create_lead_from_row(row: dict[str, str]) -> Lead:
+@lru_cache(maxsize=256)
+def _timezone_for_state(state_code: str) -> ZoneInfo:
+    """Cached get_timezone_for_state(); a CSV holds only a handful of distinct states."""
+    return get_timezone_for_state(state_code)
+
+
+def _uuid4_block(count: int) -> list[UUID]:
+    """
+    Generate count random (version 4) UUIDs from a single os.urandom call.
+
+    Equivalent to calling uuid4() count times, but reads the random bytes
+    with one system call instead of one per UUID.
+    """
+    data = os.urandom(16 * count)
+    return [UUID(bytes=data[i:i + 16], version=4) for i in range(0, 16 * count, 16)]
+
+
+def create_lead_from_row(
+    row: Mapping[str, str] | Sequence[str],
+    lead_id: UUID | None = None,
+    layout: CsvLayout | None = None,
+) -> Lead:
     """
     Create a Lead domain object from a CSV row.
 
     Args:
-        row: CSV row dictionary
+        row: CSV row values (with layout) or a dictionary keyed by column name
+        lead_id: ID for the new lead (default: a fresh uuid4())
+        layout: Column positions for a row given as values
 
     Returns:
         Lead domain object with all fields populated
@@ -90,68 +455,69 @@ def create_lead_from_row(row: dict[str, str]) -> Lead:
         - All CSV columns are mapped to individual Lead fields
         - Empty strings are preserved (not converted to None)
     """
-    # Parse timestamp with state-based timezone detection
-    created_at_utc = parse_timestamp_with_state_timezone(
-        timestamp_str=row["Call In Date"],
-        state_code=row["State"]
+    values, layout = _as_indexed_row(row, layout)
+    state = values[layout.state]
+    call_in_date = values[layout.call_in_date]
+
+    # Parse timestamp with state-based timezone detection first, so a bad
+    # timestamp fails before any optional field is touched
+    # (same conversion as timezone_utils.parse_timestamp_with_state_timezone)
+    naive_dt = parse_naive_timestamp(call_in_date, CALL_IN_DATE_FORMAT)
+    created_at_utc = naive_dt.replace(
+        tzinfo=_timezone_for_state(state)
+    ).astimezone(timezone.utc)
+
+    # Optional fields are stripped (empty values stored as None), then the
+    # lead is classified by data completeness (including Source) and built
+    return layout.build_lead(
+        values,
+        lead_id if lead_id is not None else uuid4(),
+        state,
+        call_in_date,
+        created_at_utc,
     )
 
-    # Classify lead based on data completeness (including Source)
-    classification = classify_lead(row)
-
-    # Helper to get optional field (preserve empty strings)
-    def get_field(key: str) -> str | None:
-        value = row.get(key, "").strip()
-        return value if value else None
-
-    # Create frozen Lead domain object with all fields
-    return Lead(
-        # Core identifiers (required)
-        lead_id=uuid4(),
-        state=row["State"],
-        classification=classification,
-        created_at_utc=created_at_utc,
-
-        # Optional fields
-        source=get_field("Source"),
-
-        # Mortgage identification
-        mortgage_id=get_field("Mortage ID"),  # Note: CSV has typo "Mortage"
-        campaign_id=get_field("Campaign ID"),
-        type=get_field("Type"),
-        status=get_field("Status"),
-
-        # Contact information
-        full_name=get_field("Full Name"),
-        first_name=get_field("First Name"),
-        last_name=get_field("Last Name"),
-        co_borrower_name=get_field("Co-Borrower Name"),
-
-        # Address fields
-        address=get_field("Address"),
-        city=get_field("City"),
-        county=get_field("County"),
-        zip=get_field("Zip"),
-
-        # Financial information
-        mortgage_amount=get_field("Mortgage Amount"),
-        lender=get_field("Lender"),
-        sale_date=get_field("Sale Date"),
-
-        # Agent and contact details
-        agent_id=get_field("Agent ID"),
-        call_in_phone_number=get_field("Call In Phone Number"),
-        borrower_phone=get_field("Borrower Phone"),
-
-        # Qualification fields
-        borrower_age=get_field("Borrower Age"),
-        borrower_medical_issues=get_field("Borrower Medical Issues"),
-        borrower_tobacco_use=get_field("Borrower Tobacco Use"),
-        co_borrower=get_field("Co-Borrower ?"),
-
-        # Original timestamp string
-        call_in_date=row.get("Call In Date", ""),
-    )
+
+def _isolate_failures(batch: list[Lead]) -> tuple[int, list[dict]]:
+    """
+    Insert a batch that failed as a whole by bisecting it.
+
+    Each half is retried with a bulk insert and only halves that fail are
+    split further, so k bad rows in a batch of n cost O(k log n) requests
+    instead of n individual inserts.
+
+    Args:
+        batch: Leads whose bulk insert failed
+
+    Returns:
+        Tuple of (success_count, errors)
+    """
+    if len(batch) == 1:
+        lead = batch[0]
+        try:
+            insert_lead(lead)
+            return 1, []
+        except Exception as e:
+            return 0, [{
+                "lead_id": str(lead.lead_id),
+                "error": str(e),
+                "state": lead.state,
+                "source": lead.source,
+            }]
+
+    success_count = 0
+    errors = []
+    mid = len(batch) // 2
+    for half in (batch[:mid], batch[mid:]):
+        try:
+            insert_leads_bulk(half)
+            success_count += len(half)
+        except Exception:
+            half_success, half_errors = _isolate_failures(half)
+            success_count += half_success
+            errors.extend(half_errors)
+
+    return success_count, errors
 
 
 def process_batch(
@@ -162,8 +528,9 @@ def process_batch(
     Process a batch of leads with bulk insert and error fallback.
 
     Strategy:
-    1. Try bulk insert first (fast)
-    2. On error, fallback to one-by-one inserts (error isolation)
+    1. Try bulk insert first (fast): COPY for large batches when available,
+       otherwise a Supabase multi-row insert
+    2. On error, bisect the batch to isolate the failing rows
 
     Args:
         batch: List of Lead objects to insert
@@ -181,36 +548,240 @@ def process_batch(
 
     try:
         # Try bulk insert (fast path)
-        insert_leads_bulk(batch)
+        if COPY_AVAILABLE and len(batch) >= COPY_MIN_BATCH_SIZE:
+            copy_leads(batch)
+        else:
+            insert_leads_bulk(batch)
         return len(batch), []
 
     except Exception as bulk_error:
-        # Bulk insert failed - fall back to one-by-one for error isolation
+        # Bulk insert failed - bisect the batch for error isolation
         print(f"  Bulk insert failed: {bulk_error}")
-        print(f"  Falling back to individual inserts for error isolation...")
+        print(f"  Bisecting batch to isolate failing rows...")
+        return _isolate_failures(batch)
+
+
+def _insert_worker(
+    batches: queue.Queue[list[Lead] | None],
+    result: IngestionResult,
+    lock: threading.Lock,
+    dry_run: bool,
+    failures: list[BaseException],
+) -> None:
+    """
+    Insert batches from the queue until a None sentinel is received.
+
+    Runs on background threads (one sentinel per thread) so that database
+    round trips overlap with CSV parsing and with each other. Counters shared
+    with the parsing thread are updated under lock. An unexpected exception
+    is recorded in failures; later batches are then drained without
+    inserting so the producer never blocks.
+    """
+    while (batch := batches.get()) is not None:
+        if failures:
+            continue
+
+        try:
+            success_count, batch_errors = process_batch(batch, dry_run)
+        except BaseException as e:
+            failures.append(e)
+            continue
+
+        with lock:
+            result.successful += success_count
+            result.failed += len(batch_errors)
+            result.errors.extend(batch_errors)
+
+            print(f"Processed {result.total_rows} rows "
+                  f"({result.successful} successful, "
+                  f"{result.failed} failed, "
+                  f"{result.skipped} skipped)")
+
+
+def _parse_rows(
+    rows: Iterable[Sequence[str]],
+    fieldnames: list[str],
+    layout: CsvLayout,
+) -> _ParsedRows:
+    """
+    Validate CSV rows and build a Lead for each valid one.
+
+    Rows are consumed one at a time and not retained. Counters and errors
+    are kept in locals and returned together, so callers touch shared state
+    once per run of rows instead of once per row.
+
+    Args:
+        rows: CSV data rows in header order
+        fieldnames: Column names from the header row
+        layout: Column positions for fieldnames
+
+    Returns:
+        _ParsedRows whose error row numbers are relative to the first row
+    """
+    row_width = len(fieldnames)
+    state_idx = layout.state
+    call_in_idx = layout.call_in_date
+
+    leads: list[Lead] = []
+    errors: list[dict] = []
+    leads_append = leads.append
+    errors_append = errors.append
+    build_lead = create_lead_from_row
+    total = skipped = failed = gold = silver = 0
+
+    # Lead IDs are generated a block at a time and handed out per row
+    lead_ids: list[UUID] = []
+
+    for row_num, row in enumerate(rows):
+        total += 1
+        if len(row) < row_width:
+            # Short row: treat missing trailing columns as empty
+            row = [*row, *([""] * (row_width - len(row)))]
+
+        # Validate row. Clean rows take the inline check; validate_row()
+        # only runs to describe a failure.
+        if not (row[state_idx].strip() and row[call_in_idx].strip()):
+            _, error_msg = validate_row(row, row_num, layout)
+            skipped += 1
+            errors_append({
+                "row_num": row_num,
+                "error": error_msg,
+                "csv_row": dict(zip(fieldnames, row)),
+            })
+            continue
+
+        try:
+            # Create Lead object
+            if not lead_ids:
+                lead_ids = _uuid4_block(LEAD_ID_BLOCK_SIZE)
+            lead = build_lead(row, lead_id=lead_ids.pop(), layout=layout)
+        except Exception as e:
+            failed += 1
+            errors_append({
+                "row_num": row_num,
+                "error": f"Failed to create Lead: {str(e)}",
+                "csv_row": dict(zip(fieldnames, row)),
+            })
+            continue
+
+        leads_append(lead)
+
+        # Track classification counts
+        if lead.classification is LeadClassification.GOLD:
+            gold += 1
+        else:
+            silver += 1
+
+    return _ParsedRows(leads, errors, total, skipped, failed, gold, silver)
+
+
+def _iter_parsed_rows(
+    csv_file: Path,
+    fieldnames: list[str],
+    layout: CsvLayout,
+    rows_per_run: int,
+) -> Generator[_ParsedRows, None, None]:
+    """Parse the file in this process, rows_per_run rows at a time."""
+    rows = _iter_csv_rows(csv_file, fieldnames)
+    while (parsed := _parse_rows(islice(rows, rows_per_run), fieldnames, layout)).total_rows:
+        yield parsed
 
-        success_count = 0
-        errors = []
 
-        for lead in batch:
-            try:
-                insert_lead(lead)
-                success_count += 1
-            except Exception as e:
-                errors.append({
-                    "lead_id": str(lead.lead_id),
-                    "error": str(e),
-                    "state": lead.state,
-                    "source": lead.source,
-                })
+def _split_on_newline(mm: mmap.mmap, start: int, step: int) -> list[tuple[int, int]]:
+    """
+    Split mm[start:] into byte ranges of about `step` bytes that each end on a newline.
+
+    Assumes no quoted field contains a newline, since a range boundary could
+    otherwise fall inside a record.
+    """
+    size = len(mm)
+    step = max(1, step)
+    bounds = [start]
+    while bounds[-1] + step < size:
+        newline = mm.find(b"\n", bounds[-1] + step)
+        if newline == -1:
+            break
+        bounds.append(newline + 1)
+    if bounds[-1] < size:
+        bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def _parse_csv_range(
+    csv_path: str,
+    start: int,
+    end: int,
+    fieldnames: list[str],
+) -> _ParsedRows:
+    """Parse one newline-aligned byte range of the file (runs in a worker process)."""
+    # The layout is rebuilt here since its generated builder can't be pickled
+    layout = CsvLayout.from_header(fieldnames)
+    with open(csv_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        text = mm[start:end].decode("utf-8")
+    rows = (row for row in csv.reader(io.StringIO(text, newline="")) if row)
+    return _parse_rows(rows, fieldnames, layout)
+
+
+def _iter_parsed_rows_parallel(
+    csv_file: Path,
+    fieldnames: list[str],
+    processes: int,
+) -> Generator[_ParsedRows, None, None]:
+    """
+    Parse the file in worker processes, yielding results in file order.
 
-        return success_count, errors
+    The file is memory-mapped, split into newline-aligned byte ranges after
+    the header, and each range is parsed by a worker process with csv.reader.
+    Ranges are at most PARSE_RANGE_SIZE bytes and at most
+    RANGES_PER_PARSE_PROCESS ranges per process are in flight, so large files
+    are never parsed into memory all at once.
+    """
+    max_pending = processes * RANGES_PER_PARSE_PROCESS
+    with open(csv_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        header_end = mm.find(b"\n") + 1
+        if header_end == 0:
+            return  # Header only, no data rows
+        range_size = min(PARSE_RANGE_SIZE, (len(mm) - header_end) // max_pending)
+        ranges = _split_on_newline(mm, header_end, range_size)
+
+    pending: deque[Future[_ParsedRows]] = deque()
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        try:
+            for start, end in ranges:
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+                pending.append(executor.submit(
+                    _parse_csv_range, str(csv_file), start, end, fieldnames
+                ))
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _merge_parsed(
+    result: IngestionResult,
+    lock: threading.Lock,
+    parsed: _ParsedRows,
+) -> None:
+    """Fold counters and errors from a run of parsed rows into the shared result."""
+    with lock:
+        result.total_rows += parsed.total_rows
+        result.skipped += parsed.skipped
+        result.failed += parsed.failed
+        result.gold_count += parsed.gold_count
+        result.silver_count += parsed.silver_count
+        result.errors.extend(parsed.errors)
 
 
 def ingest_csv(
     csv_path: str,
-    batch_size: int = 250,
-    dry_run: bool = False
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    dry_run: bool = False,
+    insert_workers: int = DEFAULT_INSERT_WORKERS,
+    parallel: int = 1,
+    max_errors: int | None = DEFAULT_MAX_ERRORS,
 ) -> IngestionResult:
     """
     Ingest leads from a CSV file into the database.
@@ -219,14 +790,27 @@ def ingest_csv(
         csv_path: Path to the CSV file
         batch_size: Number of rows to process per batch
         dry_run: If True, parse and validate but don't insert
+        insert_workers: Number of batches inserted concurrently
+        parallel: Number of processes parsing the file. Above 1, the file is
+            memory-mapped and split at newlines, so quoted fields must not
+            contain line breaks.
+        max_errors: Number of error details to keep (None for no limit)
 
     Returns:
         IngestionResult with statistics and errors
 
     Raises:
         FileNotFoundError: If CSV file doesn't exist
-        ValueError: If CSV is malformed
+        ValueError: If CSV is malformed, insert_workers < 1, parallel < 1
+            or max_errors < 1
     """
+    if insert_workers < 1:
+        raise ValueError("insert_workers must be >= 1")
+    if parallel < 1:
+        raise ValueError("parallel must be >= 1")
+    if max_errors is not None and max_errors < 1:
+        raise ValueError("max_errors must be >= 1")
+
     csv_file = Path(csv_path)
     if not csv_file.exists():
         raise FileNotFoundError(f"CSV file not found: {csv_path}")
@@ -238,84 +822,86 @@ def ingest_csv(
         skipped=0,
         gold_count=0,
         silver_count=0,
-        errors=[],
+        errors=deque(maxlen=max_errors),
     )
 
     print(f"Reading CSV: {csv_path}")
     print(f"Batch size: {batch_size}")
+    print(f"Insert workers: {insert_workers}")
+    print(f"Parse processes: {parallel}")
     print(f"Dry run: {dry_run}")
     print()
 
-    with open(csv_file, "r", encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
-
-        # Validate CSV has required columns
-        if not reader.fieldnames:
-            raise ValueError("CSV file is empty or malformed")
-
-        required_columns = {"State", "Call In Date"}
-        missing_columns = required_columns - set(reader.fieldnames)
-        if missing_columns:
-            raise ValueError(
-                f"CSV missing required columns: {', '.join(missing_columns)}"
-            )
-
-        batch = []
-
-        for row_num, row in enumerate(reader, start=2):  # Row 1 is header
-            result.total_rows += 1
-
-            # Validate row
-            is_valid, error_msg = validate_row(row, row_num)
-            if not is_valid:
-                result.skipped += 1
-                result.errors.append({
-                    "row_num": row_num,
-                    "error": error_msg,
-                    "csv_row": row,
-                })
-                continue
-
-            try:
-                # Create Lead object
-                lead = create_lead_from_row(row)
-                batch.append(lead)
-
-                # Track classification counts
-                if lead.classification.value == "Gold":
-                    result.gold_count += 1
-                else:
-                    result.silver_count += 1
-
-                # Process batch when full
-                if len(batch) >= batch_size:
-                    success_count, batch_errors = process_batch(batch, dry_run)
-                    result.successful += success_count
-                    result.failed += len(batch_errors)
-                    result.errors.extend(batch_errors)
-
-                    print(f"Processed {result.total_rows} rows "
-                          f"({result.successful} successful, "
-                          f"{result.failed} failed, "
-                          f"{result.skipped} skipped)")
-
-                    batch = []
-
-            except Exception as e:
-                result.failed += 1
-                result.errors.append({
-                    "row_num": row_num,
-                    "error": f"Failed to create Lead: {str(e)}",
-                    "csv_row": row,
-                })
-                continue
+    fieldnames = _read_csv_header(csv_file)
+
+    # Validate CSV has required columns
+    if not fieldnames:
+        raise ValueError("CSV file is empty or malformed")
+
+    # Resolve column positions once; raises if required columns are missing
+    layout = CsvLayout.from_header(fieldnames)
+
+    # Parsed batches are handed to worker threads for insertion, so parsing
+    # overlaps with several database round trips at once. Parsing blocks
+    # while every worker is busy and one batch per worker is queued, so
+    # memory holds at most those batches plus the runs parsed ahead (one
+    # batch, or up to RANGES_PER_PARSE_PROCESS ranges per process with
+    # --parallel).
+    batches: queue.Queue[list[Lead] | None] = queue.Queue(maxsize=insert_workers)
+    lock = threading.Lock()
+    failures: list[BaseException] = []
+    workers = [
+        threading.Thread(
+            target=_insert_worker,
+            args=(batches, result, lock, dry_run, failures),
+            daemon=True,
+        )
+        for _ in range(insert_workers)
+    ]
+    for worker in workers:
+        worker.start()
+
+    parsed_runs: Generator[_ParsedRows, None, None]
+    if parallel > 1:
+        parsed_runs = _iter_parsed_rows_parallel(csv_file, fieldnames, parallel)
+    else:
+        parsed_runs = _iter_parsed_rows(csv_file, fieldnames, layout, batch_size)
+
+    # Leads left over after handing off full batches
+    batch: list[Lead] = []
+
+    try:
+        first_row_num = 2  # Row 1 is header
+        for parsed in parsed_runs:
+            for error in parsed.errors:
+                error["row_num"] += first_row_num
+            first_row_num += parsed.total_rows
+
+            # Merge counters before queueing so worker progress lines are current
+            _merge_parsed(result, lock, parsed)
+
+            # Hand off full batches. put() may block while every worker is
+            # busy; the raw rows behind these leads are already released.
+            leads = batch + parsed.leads if batch else parsed.leads
+            del parsed
+            full = len(leads) - len(leads) % batch_size
+            for i in range(0, full, batch_size):
+                batches.put(leads[i:i + batch_size])
+            batch = leads[full:]
+            del leads
 
         # Process remaining batch
         if batch:
-            success_count, batch_errors = process_batch(batch, dry_run)
-            result.successful += success_count
-            result.failed += len(batch_errors)
-            result.errors.extend(batch_errors)
+            batches.put(batch)
+    finally:
+        parsed_runs.close()
+        for _ in workers:
+            batches.put(None)
+        for worker in workers:
+            worker.join()
+
+    if failures:
+        raise failures[0]
 
     return result
 
@@ -336,10 +922,19 @@ def print_summary(result: IngestionResult) -> None:
     print()
 
     if result.errors:
-        print(f"Errors:           {len(result.errors)}")
-        print()
-        print("First 5 errors:")
-        for error in result.errors[:5]:
+        error_count = result.failed + result.skipped
+        dropped = error_count - len(result.errors)
+        print(f"Errors:           {error_count}")
+        if dropped > 0:
+            # result.errors keeps the most recent errors; older ones were dropped
+            print(f"                  (details kept for the last {len(result.errors)}, "
+                  f"{dropped} older dropped)")
+            print()
+            print(f"Sample of the {len(result.errors)} most recent errors:")
+        else:
+            print()
+            print("First 5 errors:")
+        for error in islice(result.errors, 5):
             print(f"  - Row {error.get('row_num', 'N/A')}: {error['error']}")
         if len(result.errors) > 5:
             print(f"  ... and {len(result.errors) - 5} more")
@@ -349,13 +944,18 @@ def print_summary(result: IngestionResult) -> None:
     print("=" * 60)
 
 
-def save_error_log(errors: list[dict], output_path: str) -> None:
+def save_error_log(errors: Iterable[dict], output_path: str) -> None:
     """Save error details to JSON file."""
+    errors = list(errors)
     if not errors:
         return
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(errors, f, indent=2, default=str)
+    if orjson is not None:
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(errors, option=orjson.OPT_INDENT_2, default=str))
+    else:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(errors, f, indent=2, default=str)
 
     print(f"\nError log saved to: {output_path}")
 
@@ -376,6 +976,9 @@ Examples:
   # Custom batch size
   python ingest_csv_leads.py leads.csv --batch-size 500
 
+  # Parse a large file with 4 processes
+  python ingest_csv_leads.py leads.csv --parallel 4
+
   # Save error log to custom path
   python ingest_csv_leads.py leads.csv --error-log errors.json
         """
@@ -389,8 +992,31 @@ Examples:
     parser.add_argument(
         "--batch-size",
         type=int,
-        default=250,
-        help="Number of rows to process per batch (default: 250)"
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Number of rows to process per batch (default: {DEFAULT_BATCH_SIZE})"
+    )
+
+    parser.add_argument(
+        "--insert-workers",
+        type=int,
+        default=DEFAULT_INSERT_WORKERS,
+        help=f"Number of batches inserted concurrently (default: {DEFAULT_INSERT_WORKERS})"
+    )
+
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        help="Number of processes parsing the CSV (default: 1). Requires that "
+             "no quoted field contains a line break"
+    )
+
+    parser.add_argument(
+        "--max-errors",
+        type=int,
+        default=DEFAULT_MAX_ERRORS,
+        help=f"Number of error details kept for the summary and error log; "
+             f"older ones are dropped first (default: {DEFAULT_MAX_ERRORS})"
     )
 
     parser.add_argument(
@@ -416,6 +1042,9 @@ Examples:
             csv_path=args.csv_path,
             batch_size=args.batch_size,
             dry_run=args.dry_run,
+            insert_workers=args.insert_workers,
+            parallel=args.parallel,
+            max_errors=args.max_errors,
         )
 
         # Print summary
@@ -27,8 +27,9 @@ def reset_inventory():
     # Count currently sold items
     sold_response = (
         supabase.table("inventory")
-        .select("*", count="exact")
+        .select("inventory_id", count="exact")
         .not_.is_("sold_at_utc", "null")
+        .limit(1)
         .execute()
     )
     sold_count = getattr(sold_response, "count", 0) or 0
@@ -52,8 +53,9 @@ def reset_inventory():
     # Verify reset
     remaining_sold = (
         supabase.table("inventory")
-        .select("*", count="exact")
+        .select("inventory_id", count="exact")
         .not_.is_("sold_at_utc", "null")
+        .limit(1)
         .execute()
     )
     remaining_count = getattr(remaining_sold, "count", 0) or 0
@@ -66,8 +68,9 @@ def reset_inventory():
     # Show updated stats
     available_response = (
         supabase.table("inventory")
-        .select("*", count="exact")
+        .select("inventory_id", count="exact")
         .is_("sold_at_utc", "null")
+        .limit(1)
         .execute()
     )
     available_count = getattr(available_response, "count", 0) or 0
@@ -10,10 +10,12 @@ This test creates a lead with malicious data and verifies that:
 from __future__ import annotations
 
 import logging
+import re
 import sys
+from contextlib import contextmanager
 from io import StringIO
 from pathlib import Path
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -21,12 +23,15 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from datetime import datetime, timezone
 from domain.lead import Lead, LeadClassification
 from domain.age_bucket import AgeBucket
-from repositories.lead_repository import insert_lead
-from repositories.sale_repository import record_sale
-from repositories.client_repository import create_test_client, get_client_by_email
+from repositories.client import supabase
+from repositories.lead_repository import _lead_to_row
 from services.csv_export_service import generate_csv_for_sales
 
 
+# Data line starting with a spreadsheet formula trigger character
+_INJECT_RE = re.compile(rb"(?m)^[=+\-@\t]")
+
+
 # Set up logging to capture warnings
 class LogCapture(logging.Handler):
     """Custom handler to capture log records for testing."""
@@ -38,6 +43,30 @@ class LogCapture(logging.Handler):
         self.records.append(record)
 
 
+@contextmanager
+def capture_csv_logs():
+    """
+    Capture csv_export_service warnings for the duration of the block.
+
+    The handler is detached and the logger level restored on exit, so
+    repeated runs in the same process don't accumulate handlers.
+
+    Yields:
+        LogCapture handler whose records remain readable after the block
+    """
+    handler = LogCapture()
+    handler.setLevel(logging.WARNING)
+    csv_logger = logging.getLogger("services.csv_export_service")
+    old_level = csv_logger.level
+    csv_logger.addHandler(handler)
+    csv_logger.setLevel(logging.WARNING)
+    try:
+        yield handler
+    finally:
+        csv_logger.removeHandler(handler)
+        csv_logger.setLevel(old_level)
+
+
 def test_csv_injection_logging():
     """
     Test that CSV injection attempts are logged.
@@ -49,25 +78,8 @@ def test_csv_injection_logging():
     print("TEST: CSV Injection Logging")
     print("=" * 80)
 
-    # Set up log capture
-    log_capture = LogCapture()
-    log_capture.setLevel(logging.WARNING)
-
-    # Get the csv_export_service logger
-    csv_logger = logging.getLogger("services.csv_export_service")
-    csv_logger.addHandler(log_capture)
-    csv_logger.setLevel(logging.WARNING)
-
-    print("\n1. Creating test client...")
-    client = get_client_by_email("injection_test@example.com")
-    if client is None:
-        client = create_test_client("injection_test@example.com", "Injection Test Corp")
-        print(f"   Created client: {client.email}")
-    else:
-        print(f"   Using existing client: {client.email}")
-
     # Create lead with malicious data in multiple fields
-    print("\n2. Creating lead with malicious CSV injection data...")
+    print("\n1. Building lead with malicious CSV injection data...")
     malicious_lead = Lead(
         lead_id=uuid4(),
         state="LA",
@@ -97,32 +109,40 @@ def test_csv_injection_logging():
     print(f"     address: {malicious_lead.address}")
     print(f"     county: {malicious_lead.county}")
 
-    # Insert lead into database
-    insert_lead(malicious_lead)
-    print(f"   Lead inserted with ID: {malicious_lead.lead_id}")
-
-    # Create sale for this lead
-    print("\n3. Creating sale record...")
-    from decimal import Decimal
-    sale = record_sale(
-        lead_id=malicious_lead.lead_id,
-        client_id=client.client_id,
-        bucket=AgeBucket.MONTH_6_TO_8,
-        sold_at=datetime.now(timezone.utc),
-        purchase_price=Decimal("8.00"),
-        currency="USD"
-    )
-    print(f"   Sale created with ID: {sale.sale_id}")
-
-    # Clear any previous log records
-    log_capture.records.clear()
+    # Get-or-create the client, insert the lead and record the sale in a
+    # single round trip (database/test_fixtures.sql)
+    print("\n2. Creating client, lead, and sale records...")
+    response = supabase.rpc(
+        "setup_csv_export_fixture",
+        {
+            "p_email": "injection_test@example.com",
+            "p_company_name": "Injection Test Corp",
+            "p_lead": _lead_to_row(malicious_lead),
+            "p_sale": {
+                "age_bucket": AgeBucket.MONTH_6_TO_8.value,
+                "sold_at_utc": datetime.now(timezone.utc).isoformat(),
+                "purchase_price": "8.00",
+                "currency": "USD",
+            },
+        },
+    ).execute()
+    error = getattr(response, "error", None)
+    if error:
+        raise RuntimeError(f"Failed to set up CSV export fixture: {error}")
+    fixture = response.data
+    client_id = UUID(fixture["client_id"])
+    sale_id = UUID(fixture["sale_id"])
+    print(f"   Client ID: {client_id}")
+    print(f"   Lead inserted with ID: {fixture['lead_id']}")
+    print(f"   Sale created with ID: {sale_id}")
 
     # Generate CSV export (this should trigger logging)
-    print("\n4. Generating CSV export (should trigger security warnings)...")
-    csv_content = generate_csv_for_sales([sale.sale_id], client.client_id)
+    print("\n3. Generating CSV export (should trigger security warnings)...")
+    with capture_csv_logs() as log_capture:
+        csv_content = generate_csv_for_sales([sale_id], client_id)
 
     # Check what was logged
-    print(f"\n5. Checking security logs...")
+    print(f"\n4. Checking security logs...")
     print(f"   Total warnings logged: {len(log_capture.records)}")
 
     if len(log_capture.records) == 0:
@@ -144,15 +164,16 @@ def test_csv_injection_logging():
         print(f"     Sanitized value: {sanitized}")
 
     # Verify CSV is safe
-    print("\n6. Verifying CSV is safe...")
-    csv_lines = csv_content.split('\n')
-    data_lines = [line for line in csv_lines[1:] if line]  # Skip header, remove empty
-
-    dangerous_found = False
-    for line in data_lines:
-        if line and line[0] in ['=', '+', '@']:
-            print(f"   [FAIL] Dangerous character found in CSV: {line[0]}")
-            dangerous_found = True
+    print("\n5. Verifying CSV is safe...")
+    csv_bytes = csv_content.encode("utf-8", "surrogatepass")
+    header_end = csv_bytes.find(b"\n") + 1  # Skip header
+    dangerous_found = _INJECT_RE.search(csv_bytes, header_end) is not None
+
+    if dangerous_found:
+        # Only split into lines to report the offending rows
+        for line in csv_content.split('\n')[1:]:
+            if line and line[0] in '=+-@\t':
+                print(f"   [FAIL] Dangerous character found in CSV: {line[0]!r}")
 
     if not dangerous_found:
         print("   [PASS] CSV is safe - no dangerous characters in output")
@@ -10,8 +10,14 @@ Usage:
 
 from __future__ import annotations
 
+import contextlib
+import io
 import sys
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, Optional, TextIO, cast
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -21,6 +27,7 @@ from domain.lead import LeadClassification
 from repositories.inventory_query_repository import (
     InventoryQueryFilters,
     MixedInventoryRequest,
+    next_inventory_cursor,
     query_available_inventory,
     query_mixed_inventory,
     get_inventory_counts,
@@ -30,10 +37,14 @@ from repositories.inventory_query_repository import (
 
 def print_section(title: str) -> None:
     """Print a section header."""
-    print()
-    print("=" * 80)
-    print(title)
-    print("=" * 80)
+    rule = "=" * 80
+    print(f"\n{rule}\n{title}\n{rule}")
+
+
+def _buffer_stdout() -> None:
+    """Stop flushing stdout on every newline; output is flushed on exit."""
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=False)
 
 
 def test_basic_query() -> None:
@@ -127,10 +138,9 @@ def test_combined_filters() -> None:
 
     if results:
         # Verify filters
-        for lead in results:
-            assert lead.classification == LeadClassification.GOLD
-            assert lead.state == "LA"
-            assert lead.age_bucket == AgeBucket.MONTH_12_TO_23
+        combos = {(lead.classification, lead.state, lead.age_bucket) for lead in results}
+        expected = {(LeadClassification.GOLD, "LA", AgeBucket.MONTH_12_TO_23)}
+        assert combos == expected, f"Expected only {expected}, got {combos}"
 
         print("SUCCESS: All results match combined filters")
         print(f"\nSample lead:")
@@ -184,12 +194,12 @@ def test_pagination() -> None:
     filters = InventoryQueryFilters()
 
     # Get first 5
-    page1 = query_available_inventory(filters, limit=5, offset=0)
-    print(f"Page 1 (offset=0, limit=5): {len(page1)} results")
+    page1 = query_available_inventory(filters, limit=5)
+    print(f"Page 1 (first page, limit=5): {len(page1)} results")
 
-    # Get next 5
-    page2 = query_available_inventory(filters, limit=5, offset=5)
-    print(f"Page 2 (offset=5, limit=5): {len(page2)} results")
+    # Get next 5, continuing after the last item of page 1
+    page2 = query_available_inventory(filters, limit=5, cursor=next_inventory_cursor(page1))
+    print(f"Page 2 (after page 1 cursor, limit=5): {len(page2)} results")
 
     # Verify no overlap
     page1_ids = {lead.inventory_id for lead in page1}
@@ -227,17 +237,17 @@ def test_mixed_inventory() -> None:
     print(f"Expected: 80 (50 Silver + 30 Gold)")
 
     # Verify counts by classification
-    silver_count = sum(1 for lead in results if lead.classification == LeadClassification.SILVER)
-    gold_count = sum(1 for lead in results if lead.classification == LeadClassification.GOLD)
+    by_class = Counter(lead.classification for lead in results)
+    silver_count = by_class[LeadClassification.SILVER]
+    gold_count = by_class[LeadClassification.GOLD]
 
     print(f"\nBreakdown:")
     print(f"  Silver leads: {silver_count}")
     print(f"  Gold leads: {gold_count}")
 
     # Verify all are from correct age bucket and state
-    for lead in results:
-        assert lead.age_bucket == AgeBucket.MONTH_12_TO_23
-        assert lead.state == "LA"
+    combos = {(lead.age_bucket, lead.state) for lead in results}
+    assert combos <= {(AgeBucket.MONTH_12_TO_23, "LA")}, f"Unexpected bucket/state: {combos}"
 
     print(f"\nSUCCESS: All {len(results)} leads match requested criteria")
     print("  - All from MONTH_12_TO_23 bucket")
@@ -274,33 +284,89 @@ def test_complex_mixed_inventory() -> None:
     print(f"Total leads returned: {len(results)}")
 
     # Group by classification and bucket
-    groups: dict[tuple[str, str], int] = {}
-    for lead in results:
-        key = (lead.classification.value, lead.age_bucket.value)
-        groups[key] = groups.get(key, 0) + 1
+    groups = Counter((lead.classification, lead.age_bucket) for lead in results)
 
     print(f"\nBreakdown by classification + bucket:")
     for (classification, bucket), count in sorted(groups.items()):
-        print(f"  {classification} + {bucket}: {count} leads")
+        print(f"  {classification.value} + {bucket.value}: {count} leads")
 
     print(f"\nSUCCESS: Retrieved {len(results)} leads across multiple classification/bucket combinations")
 
 
+TESTS: tuple[Callable[[], None], ...] = (
+    test_basic_query,
+    test_filter_by_state,
+    test_filter_by_classification,
+    test_filter_by_age_bucket,
+    test_combined_filters,
+    test_inventory_counts,
+    test_inventory_summary,
+    test_pagination,
+    test_mixed_inventory,
+    test_complex_mixed_inventory,
+)
+
+
+class _ThreadOutput(io.TextIOBase):
+    """sys.stdout stand-in that sends prints from a capturing thread to its own buffer."""
+
+    def __init__(self, stream: TextIO) -> None:
+        super().__init__()
+        self.stream = stream
+        self._local = threading.local()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        return getattr(self._local, "buffer", self.stream).write(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+    def capture(self, test: Callable[[], None]) -> tuple[str, Optional[Exception]]:
+        """Run test, returning its printed output and the exception it raised (if any)."""
+        buffer = io.StringIO()
+        self._local.buffer = buffer
+        try:
+            test()
+            return buffer.getvalue(), None
+        except Exception as e:
+            return buffer.getvalue(), e
+        finally:
+            del self._local.buffer
+
+
+def run_tests_concurrently(tests: tuple[Callable[[], None], ...]) -> None:
+    """
+    Run read-only tests on a thread pool, so their queries overlap.
+
+    Each test's output is captured separately and printed in test order
+    once all have finished; the first failure (in that order) is re-raised.
+    sys.stdout is replaced once, before any test thread starts, and restored
+    after they have all finished.
+    """
+    output = _ThreadOutput(sys.stdout)
+    # A TextIOBase provides everything print() uses, but typeshed types
+    # sys.stdout as typing.TextIO
+    with contextlib.redirect_stdout(cast(TextIO, output)):
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            results = list(executor.map(output.capture, tests))
+
+    for text, error in results:
+        sys.stdout.write(text)
+        if error is not None:
+            raise error
+
+
 def main() -> int:
     """Run all tests."""
+    _buffer_stdout()
+
     try:
         print("Starting inventory query tests...")
 
-        test_basic_query()
-        test_filter_by_state()
-        test_filter_by_classification()
-        test_filter_by_age_bucket()
-        test_combined_filters()
-        test_inventory_counts()
-        test_inventory_summary()
-        test_pagination()
-        test_mixed_inventory()
-        test_complex_mixed_inventory()
+        run_tests_concurrently(TESTS)
 
         print()
         print("=" * 80)
@@ -316,6 +382,7 @@ def main() -> int:
         print(f"TEST FAILED: {e}")
         print("=" * 80)
         import traceback
+        sys.stdout.flush()  # keep buffered output ahead of the traceback
         traceback.print_exc()
         return 1
 
@@ -10,7 +10,7 @@ from repositories.client import supabase
 # Query with large limit
 response = (
     supabase.table("inventory")
-    .select("*, leads!inner(classification)")
+    .select("inventory_id, leads!inner(classification)")
     .is_("sold_at_utc", "null")
     .eq("age_bucket", "MONTH_12_TO_23")
     .eq("leads.classification", "Gold")
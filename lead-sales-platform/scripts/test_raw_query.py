@@ -10,7 +10,7 @@ from repositories.client import supabase
 # Raw query for Gold 12-23 month leads
 response = (
     supabase.table("inventory")
-    .select("*, leads!inner(classification)")
+    .select("inventory_id, age_bucket, leads!inner(classification)")
     .is_("sold_at_utc", "null")
     .eq("age_bucket", "MONTH_12_TO_23")
     .eq("leads.classification", "Gold")
@@ -26,7 +26,7 @@ for i, row in enumerate(response.data, 1):
 print("\n--- Without classification filter ---")
 response2 = (
     supabase.table("inventory")
-    .select("*")
+    .select("inventory_id")
     .is_("sold_at_utc", "null")
     .eq("age_bucket", "MONTH_12_TO_23")
     .limit(10)
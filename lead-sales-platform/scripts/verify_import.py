@@ -18,9 +18,20 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from repositories.lead_repository import list_leads_by_filter, get_lead_by_id
+from repositories.lead_repository import (
+    _row_to_lead,
+    count_leads_by_classification_and_state,
+    get_lead_by_id,
+    list_leads_by_filter,
+)
 from repositories.client import supabase
 
+# CSV columns every imported lead's raw_payload should contain
+_EXPECTED_FIELDS = frozenset({
+    "Mortage ID", "Campaign ID", "Type", "Call In Date",
+    "Status", "Full Name", "State", "Source"
+})
+
 
 def verify_import():
     """Verify the import results in Supabase."""
@@ -30,10 +41,12 @@ def verify_import():
     print("=" * 60)
     print()
 
-    # 1. Check total count using direct query
+    # All counts below come from one grouped (classification, state) query
+    counts = count_leads_by_classification_and_state()
+
+    # 1. Check total count
     print("1. Checking total lead count...")
-    count_response = supabase.table("leads").select("lead_id", count="exact").execute()
-    total_count = count_response.count if hasattr(count_response, 'count') else 0
+    total_count = sum(counts.values())
     print(f"   Total leads in database: {total_count}")
     print()
 
@@ -44,11 +57,8 @@ def verify_import():
 
     # 2. Check classification distribution
     print("2. Checking classification distribution...")
-    gold_response = supabase.table("leads").select("lead_id", count="exact").eq("classification", "Gold").execute()
-    silver_response = supabase.table("leads").select("lead_id", count="exact").eq("classification", "Silver").execute()
-
-    gold_count = gold_response.count if hasattr(gold_response, 'count') else 0
-    silver_count = silver_response.count if hasattr(silver_response, 'count') else 0
+    gold_count = sum(n for (classification, _), n in counts.items() if classification == "Gold")
+    silver_count = sum(n for (classification, _), n in counts.items() if classification == "Silver")
 
     print(f"   Gold leads:   {gold_count} ({gold_count/total_count*100:.1f}%)")
     print(f"   Silver leads: {silver_count} ({silver_count/total_count*100:.1f}%)")
@@ -56,15 +66,13 @@ def verify_import():
 
     # 3. Check state distribution
     print("3. Checking state distribution...")
-    la_response = supabase.table("leads").select("lead_id", count="exact").eq("state", "LA").execute()
-    la_count = la_response.count if hasattr(la_response, 'count') else 0
+    la_count = sum(n for (_, state), n in counts.items() if state == "LA")
     print(f"   LA leads: {la_count}")
     print()
 
     # 4. Sample lead data
     print("4. Sampling lead data...")
     if sample_leads:
-        from repositories.lead_repository import _row_to_lead
         sample_lead = _row_to_lead(sample_leads[0])
         print(f"   Sample Lead ID: {sample_lead.lead_id}")
         print(f"   State: {sample_lead.state}")
@@ -80,24 +88,19 @@ def verify_import():
         print(f"   Raw payload has {len(payload_keys)} fields")
         print(f"   Sample fields: {payload_keys[:5]}")
 
-        # Check if specific CSV fields are present
-        expected_fields = [
-            "Mortage ID", "Campaign ID", "Type", "Call In Date",
-            "Status", "Full Name", "State", "Source"
-        ]
-        present_fields = [f for f in expected_fields if f in sample_lead.raw_payload]
-        print(f"   Expected fields present: {len(present_fields)}/{len(expected_fields)}")
+        # Check if specific CSV fields are present (set ops on the keys view)
+        missing = _EXPECTED_FIELDS - sample_lead.raw_payload.keys()
+        present_count = len(_EXPECTED_FIELDS) - len(missing)
+        print(f"   Expected fields present: {present_count}/{len(_EXPECTED_FIELDS)}")
 
-        if len(present_fields) < len(expected_fields):
-            missing = set(expected_fields) - set(present_fields)
-            print(f"   Missing fields: {missing}")
+        if missing:
+            print(f"   Missing fields: {set(missing)}")
         print()
 
     # 6. Check for Gold leads with complete data
     print("6. Verifying Gold lead criteria...")
     gold_leads_response = supabase.table("leads").select("*").eq("classification", "Gold").limit(1).execute()
     if gold_leads_response.data:
-        from repositories.lead_repository import _row_to_lead
         gold_sample = _row_to_lead(gold_leads_response.data[0])
         gold_fields = [
             "Borrower Age",
@@ -118,7 +121,6 @@ def verify_import():
     print("7. Verifying Silver lead criteria...")
     silver_leads_response = supabase.table("leads").select("*").eq("classification", "Silver").limit(1).execute()
     if silver_leads_response.data:
-        from repositories.lead_repository import _row_to_lead
         silver_sample = _row_to_lead(silver_leads_response.data[0])
         silver_fields = [
             "Borrower Age",
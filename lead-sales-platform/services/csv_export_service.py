@@ -14,26 +14,130 @@ from __future__ import annotations
 
 import csv
 import logging
-from dataclasses import dataclass
-from datetime import datetime
-from decimal import Decimal
+import re
 from io import StringIO
-from typing import List
+from itertools import islice
+from operator import attrgetter
+from typing import Iterator, List, Sequence
 from uuid import UUID
 
-from domain.age_bucket import AgeBucket
-from domain.lead import LeadClassification
-from repositories.lead_repository import get_lead_by_id
-from repositories.sale_repository import get_sale_by_id
+from domain.lead import Lead
+from domain.sale import SaleRecord
+from repositories.lead_repository import get_leads_by_ids
+from repositories.sale_repository import get_sales_by_ids
 
 logger = logging.getLogger(__name__)
 
 
+# Leading run of characters that can start a formula in Excel/Sheets.
+# An anchored match returns None straight away for the common clean value.
+_CSV_INJECTION_RE = re.compile(r"[=+\-@\t\r]+")
+
+# Data rows formatted per yielded chunk when streaming an export.
+_CSV_ROWS_PER_CHUNK = 500
+
+# Export column headings, in row order.
+_CSV_HEADER: tuple[str, ...] = (
+    "Sale ID",
+    "Purchase Price",
+    "Currency",
+    "Purchased At",
+    "Age Bucket",
+    "Classification",
+
+    # Contact
+    "Full Name",
+    "First Name",
+    "Last Name",
+    "Borrower Phone",
+    "Call-In Phone Number",
+
+    # Address
+    "Address",
+    "City",
+    "County",
+    "State",
+    "ZIP",
+
+    # Lead Details
+    "Mortgage ID",
+    "Mortgage Amount",
+    "Lender",
+    "Sale Date",
+    "Call-In Date",
+
+    # Co-borrower
+    "Co-Borrower Name",
+    "Co-Borrower?",
+
+    # Qualification
+    "Borrower Age",
+    "Medical Issues",
+    "Tobacco Use",
+
+    # Metadata
+    "Source",
+    "Campaign ID",
+    "Type",
+    "Status",
+    "Agent ID",
+)
+
+# Lead attributes exported after the sale columns, in header order. Each
+# value is sanitized and the attribute name is used for security logging.
+_LEAD_EXPORT_FIELDS: tuple[str, ...] = (
+    # Contact
+    "full_name",
+    "first_name",
+    "last_name",
+    "borrower_phone",
+    "call_in_phone_number",
+
+    # Address
+    "address",
+    "city",
+    "county",
+    "state",
+    "zip",
+
+    # Lead Details
+    "mortgage_id",
+    "mortgage_amount",
+    "lender",
+    "sale_date",
+    "call_in_date",
+
+    # Co-borrower
+    "co_borrower_name",
+    "co_borrower",
+
+    # Qualification
+    "borrower_age",
+    "borrower_medical_issues",
+    "borrower_tobacco_use",
+
+    # Metadata
+    "source",
+    "campaign_id",
+    "type",
+    "status",
+    "agent_id",
+)
+
+# Reads every export attribute of a lead in one C-level call.
+_get_lead_export_values = attrgetter(*_LEAD_EXPORT_FIELDS)
+
+
 class SecurityError(Exception):
     """Raised when authorization check fails (client doesn't own sales)."""
     pass
 
 
+class SaleNotFoundError(RuntimeError):
+    """Raised when a requested sale does not exist."""
+    pass
+
+
 def sanitize_csv_field(value: str | None, field_name: str = "unknown") -> str:
     """
     Sanitize field to prevent CSV injection attacks with security logging.
@@ -66,156 +170,88 @@ def sanitize_csv_field(value: str | None, field_name: str = "unknown") -> str:
         return ""
 
     text = str(value).strip()
-    original_text = text
-    dangerous_chars = {'=', '+', '-', '@', '\t', '\r'}
 
     # Strip dangerous leading characters
-    stripped_chars = []
-    while text and text[0] in dangerous_chars:
-        stripped_chars.append(text[0])
-        text = text[1:]
-
-    # Log warning if we modified the data (potential CSV injection attempt)
-    if stripped_chars:
-        logger.warning(
-            f"CSV injection character(s) stripped from field '{field_name}'",
-            extra={
-                "field_name": field_name,
-                "stripped_characters": "".join(stripped_chars),
-                "original_value": original_text[:100],  # First 100 chars
-                "sanitized_value": text[:100],
-                "modification_type": "csv_injection_prevention"
-            }
-        )
+    match = _CSV_INJECTION_RE.match(text)
+    if match is None:
+        return text
 
-    return text
+    # Log warning since we modified the data (potential CSV injection attempt)
+    _log_stripped(field_name, text, match.end())
+    return text[match.end():]
 
 
-@dataclass(frozen=True, slots=True)
-class PurchasedLeadExport:
+def _sanitize_fields(
+    field_names: Sequence[str],
+    values: Sequence[str | None]
+) -> List[str]:
     """
-    Combined lead + purchase information for CSV export.
-    """
-    # Sale information
-    sale_id: UUID
-    purchase_price: Decimal
-    currency: str
-    purchased_at: datetime
-    age_bucket: AgeBucket
-
-    # Lead classification
-    classification: LeadClassification
-
-    # Contact information
-    full_name: str
-    first_name: str
-    last_name: str
-    borrower_phone: str
-    call_in_phone_number: str
+    Sanitize several named fields in one pass (same rules as sanitize_csv_field).
 
-    # Address
-    address: str
-    city: str
-    county: str
-    state: str
-    zip: str
-
-    # Additional lead details
-    mortgage_id: str
-    mortgage_amount: str
-    lender: str
-    sale_date: str
-    call_in_date: str
-
-    # Co-borrower info
-    co_borrower_name: str
-
-    # Qualification details
-    borrower_age: str
-    borrower_medical_issues: str
-    borrower_tobacco_use: str
-    co_borrower: str
+    Args:
+        field_names: Name of each field (for logging)
+        values: Raw field values, aligned with field_names
 
-    # Metadata
-    source: str
-    campaign_id: str
-    type: str
-    status: str
-    agent_id: str
+    Returns:
+        Sanitized values, in the same order
+    """
+    sanitized: List[str] = []
+    for field_name, value in zip(field_names, values):
+        if not value:
+            sanitized.append("")
+            continue
+        text = value.strip()
+        match = _CSV_INJECTION_RE.match(text)
+        if match is not None:
+            _log_stripped(field_name, text, match.end())
+            text = text[match.end():]
+        sanitized.append(text)
+    return sanitized
+
+
+def _log_stripped(field_name: str, original_text: str, stripped_length: int) -> None:
+    """Log a security warning for a field whose first stripped_length characters were removed."""
+    # Skip building the record (and its extras) when warnings are filtered out
+    if not logger.isEnabledFor(logging.WARNING):
+        return
+
+    logger.warning(
+        "CSV injection character(s) stripped from field '%s'",
+        field_name,
+        extra={
+            "field_name": field_name,
+            "stripped_characters": original_text[:stripped_length],
+            "original_value": original_text[:100],  # First 100 chars
+            "sanitized_value": original_text[stripped_length:stripped_length + 100],
+            "modification_type": "csv_injection_prevention"
+        }
+    )
 
 
-def _fetch_purchased_lead_data(sale_id: UUID) -> PurchasedLeadExport:
+def _build_row(sale: SaleRecord, lead: Lead) -> List[str]:
     """
-    Fetch combined sale + lead data for a single sale.
+    Build the CSV row for a sale and its lead, in header order.
 
     Args:
-        sale_id: Sale record ID
+        sale: Sale record
+        lead: Lead the sale refers to
 
     Returns:
-        PurchasedLeadExport with all lead and purchase details
-
-    Raises:
-        RuntimeError: If sale or lead not found
+        List of sanitized field values
     """
-    # Fetch sale record
-    sale = get_sale_by_id(sale_id)
-    if sale is None:
-        raise RuntimeError(f"Sale not found: {sale_id}")
-
-    # Fetch lead record
-    lead = get_lead_by_id(sale.lead_id)
-    if lead is None:
-        raise RuntimeError(f"Lead not found for sale {sale_id}: {sale.lead_id}")
-
-    # Combine into export record with CSV injection sanitization
-    return PurchasedLeadExport(
+    # Lead fields, sanitized in one pass (field names are used for logging)
+    lead_fields = _sanitize_fields(_LEAD_EXPORT_FIELDS, _get_lead_export_values(lead))
+
+    return [
         # Sale information
-        sale_id=sale.sale_id,
-        purchase_price=sale.purchase_price,
-        currency=sale.currency,
-        purchased_at=sale.sold_at,
-        age_bucket=sale.age_bucket,
-
-        # Lead classification
-        classification=lead.classification,
-
-        # Contact information (sanitized with field names for logging)
-        full_name=sanitize_csv_field(lead.full_name, "full_name"),
-        first_name=sanitize_csv_field(lead.first_name, "first_name"),
-        last_name=sanitize_csv_field(lead.last_name, "last_name"),
-        borrower_phone=sanitize_csv_field(lead.borrower_phone, "borrower_phone"),
-        call_in_phone_number=sanitize_csv_field(lead.call_in_phone_number, "call_in_phone_number"),
-
-        # Address (sanitized with field names for logging)
-        address=sanitize_csv_field(lead.address, "address"),
-        city=sanitize_csv_field(lead.city, "city"),
-        county=sanitize_csv_field(lead.county, "county"),
-        state=sanitize_csv_field(lead.state, "state"),
-        zip=sanitize_csv_field(lead.zip, "zip"),
-
-        # Additional lead details (sanitized with field names for logging)
-        mortgage_id=sanitize_csv_field(lead.mortgage_id, "mortgage_id"),
-        mortgage_amount=sanitize_csv_field(lead.mortgage_amount, "mortgage_amount"),
-        lender=sanitize_csv_field(lead.lender, "lender"),
-        sale_date=sanitize_csv_field(lead.sale_date, "sale_date"),
-        call_in_date=sanitize_csv_field(lead.call_in_date, "call_in_date"),
-
-        # Co-borrower info (sanitized with field names for logging)
-        co_borrower_name=sanitize_csv_field(lead.co_borrower_name, "co_borrower_name"),
-
-        # Qualification details (sanitized with field names for logging)
-        borrower_age=sanitize_csv_field(lead.borrower_age, "borrower_age"),
-        borrower_medical_issues=sanitize_csv_field(lead.borrower_medical_issues, "borrower_medical_issues"),
-        borrower_tobacco_use=sanitize_csv_field(lead.borrower_tobacco_use, "borrower_tobacco_use"),
-        co_borrower=sanitize_csv_field(lead.co_borrower, "co_borrower"),
-
-        # Metadata (sanitized with field names for logging)
-        source=sanitize_csv_field(lead.source, "source"),
-        campaign_id=sanitize_csv_field(lead.campaign_id, "campaign_id"),
-        type=sanitize_csv_field(lead.type, "type"),
-        status=sanitize_csv_field(lead.status, "status"),
-        agent_id=sanitize_csv_field(lead.agent_id, "agent_id"),
-    )
+        str(sale.sale_id),
+        str(sale.purchase_price),
+        sale.currency,
+        sale.sold_at.isoformat(),
+        sale.age_bucket.value,
+        lead.classification.value,
+        *lead_fields,
+    ]
 
 
 def generate_csv_for_sales(sale_ids: List[UUID], client_id: UUID) -> str:
@@ -235,8 +271,9 @@ def generate_csv_for_sales(sale_ids: List[UUID], client_id: UUID) -> str:
 
     Raises:
         ValueError: If sale_ids is empty
+        SaleNotFoundError: If any sale is not found
         SecurityError: If any sale doesn't belong to the requesting client
-        RuntimeError: If any sale or lead is not found
+        RuntimeError: If any lead is not found
 
     Example:
         csv_content = generate_csv_for_sales(
@@ -247,132 +284,106 @@ def generate_csv_for_sales(sale_ids: List[UUID], client_id: UUID) -> str:
         # Save to file
         with open("purchased_leads.csv", "w") as f:
             f.write(csv_content)
+    """
+    return "".join(iter_csv_for_sales(sale_ids, client_id))
 
-        # Or return in API response
-        return Response(content=csv_content, media_type="text/csv")
+
+def iter_csv_for_sales(sale_ids: List[UUID], client_id: UUID) -> Iterator[str]:
+    """
+    Stream a CSV file containing full lead details for purchased leads.
+
+    Authorization and data fetching happen when this is called, so
+    SecurityError and lookup failures are raised before any output is
+    produced. The returned iterator then yields the header line followed by
+    one line per sale.
+
+    Args:
+        sale_ids: List of sale IDs to include in the export
+        client_id: Client requesting the export (for authorization)
+
+    Returns:
+        Iterator of CSV lines (each ending with a line terminator)
+
+    Raises:
+        ValueError: If sale_ids is empty
+        SaleNotFoundError: If any sale is not found
+        SecurityError: If any sale doesn't belong to the requesting client
+        RuntimeError: If any lead is not found
+
+    Example:
+        # Stream in an API response
+        return StreamingResponse(
+            iter_csv_for_sales(sale_ids, current_client.client_id),
+            media_type="text/csv"
+        )
     """
     if not sale_ids:
         raise ValueError("sale_ids cannot be empty")
 
+    # Fetch every sale with batched IN (...) queries
+    sales_by_id = {sale.sale_id: sale for sale in get_sales_by_ids(sale_ids)}
+
+    # Both checks below fail before the lead round trip is spent.
+    # A count mismatch means some ID was not found; only then look for which
+    requested_ids = set(sale_ids)
+    if len(sales_by_id) != len(requested_ids):
+        missing_id = next(sale_id for sale_id in sale_ids if sale_id not in sales_by_id)
+        raise SaleNotFoundError(f"Sale not found: {missing_id}")
+
     # AUTHORIZATION: Verify ALL sales belong to requesting client
-    for sale_id in sale_ids:
-        sale = get_sale_by_id(sale_id)
-        if sale is None:
-            raise RuntimeError(f"Sale not found: {sale_id}")
+    foreign_sale = next(
+        (sale for sale in sales_by_id.values() if sale.client_id != client_id),
+        None
+    )
+    if foreign_sale is not None:
+        raise SecurityError(
+            f"Authorization failed: Sale {foreign_sale.sale_id} does not belong to client {client_id}"
+        )
+
+    sales = [sales_by_id[sale_id] for sale_id in sale_ids]
+
+    # Fetch the leads for all sales at once, then pair them up in memory
+    leads_by_id = {lead.lead_id: lead for lead in get_leads_by_ids([sale.lead_id for sale in sales])}
 
-        if sale.client_id != client_id:
-            raise SecurityError(
-                f"Authorization failed: Sale {sale_id} does not belong to client {client_id}"
-            )
+    sale_leads: List[tuple[SaleRecord, Lead]] = []
+    for sale in sales:
+        lead = leads_by_id.get(sale.lead_id)
+        if lead is None:
+            raise RuntimeError(f"Lead not found for sale {sale.sale_id}: {sale.lead_id}")
+        sale_leads.append((sale, lead))
 
-    # Fetch all purchased lead data (already sanitized in _fetch_purchased_lead_data)
-    purchased_leads = [_fetch_purchased_lead_data(sale_id) for sale_id in sale_ids]
+    return _iter_csv_lines(sale_leads)
 
-    # Generate CSV
-    output = StringIO()
-    writer = csv.writer(output)
+
+def _iter_csv_lines(sale_leads: List[tuple[SaleRecord, Lead]]) -> Iterator[str]:
+    """Yield the CSV header line, then the sanitized data lines in chunks."""
+    # Rows are written to one reusable buffer and yielded a chunk at a time,
+    # so the CSV text held at once is bounded by the chunk size. The sales
+    # and leads themselves are already fully loaded in sale_leads
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+
+    def _flush() -> str:
+        line = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return line
 
     # Write header
-    writer.writerow([
-        "Sale ID",
-        "Purchase Price",
-        "Currency",
-        "Purchased At",
-        "Age Bucket",
-        "Classification",
-
-        # Contact
-        "Full Name",
-        "First Name",
-        "Last Name",
-        "Borrower Phone",
-        "Call-In Phone Number",
-
-        # Address
-        "Address",
-        "City",
-        "County",
-        "State",
-        "ZIP",
-
-        # Lead Details
-        "Mortgage ID",
-        "Mortgage Amount",
-        "Lender",
-        "Sale Date",
-        "Call-In Date",
-
-        # Co-borrower
-        "Co-Borrower Name",
-        "Co-Borrower?",
-
-        # Qualification
-        "Borrower Age",
-        "Medical Issues",
-        "Tobacco Use",
-
-        # Metadata
-        "Source",
-        "Campaign ID",
-        "Type",
-        "Status",
-        "Agent ID",
-    ])
-
-    # Write data rows
-    for lead in purchased_leads:
-        writer.writerow([
-            str(lead.sale_id),
-            str(lead.purchase_price),
-            lead.currency,
-            lead.purchased_at.isoformat(),
-            lead.age_bucket.value,
-            lead.classification.value,
-
-            # Contact
-            lead.full_name,
-            lead.first_name,
-            lead.last_name,
-            lead.borrower_phone,
-            lead.call_in_phone_number,
-
-            # Address
-            lead.address,
-            lead.city,
-            lead.county,
-            lead.state,
-            lead.zip,
-
-            # Lead Details
-            lead.mortgage_id,
-            lead.mortgage_amount,
-            lead.lender,
-            lead.sale_date,
-            lead.call_in_date,
-
-            # Co-borrower
-            lead.co_borrower_name,
-            lead.co_borrower,
-
-            # Qualification
-            lead.borrower_age,
-            lead.borrower_medical_issues,
-            lead.borrower_tobacco_use,
-
-            # Metadata
-            lead.source,
-            lead.campaign_id,
-            lead.type,
-            lead.status,
-            lead.agent_id,
-        ])
-
-    return output.getvalue()
+    writer.writerow(_CSV_HEADER)
+    yield _flush()
+
+    # Write data rows; writerows() runs the per-row loop in C
+    rows = (_build_row(sale, lead) for sale, lead in sale_leads)
+    while chunk := list(islice(rows, _CSV_ROWS_PER_CHUNK)):
+        writer.writerows(chunk)
+        yield _flush()
 
 
 __all__ = [
-    "PurchasedLeadExport",
     "generate_csv_for_sales",
+    "iter_csv_for_sales",
+    "SaleNotFoundError",
     "SecurityError",
     "sanitize_csv_field",
 ]
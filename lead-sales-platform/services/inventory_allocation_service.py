@@ -23,10 +23,31 @@ from repositories.inventory_query_repository import (
     AvailableInventoryItem,
     InventoryQueryFilters,
     MixedInventoryRequest,
-    query_mixed_inventory,
+    count_available_inventory,
+    query_mixed_inventory_by_request,
 )
 
 
+# Age buckets from youngest to oldest.
+_BUCKET_ORDER: tuple[AgeBucket, ...] = (
+    AgeBucket.MONTH_3_TO_5,
+    AgeBucket.MONTH_6_TO_8,
+    AgeBucket.MONTH_9_TO_11,
+    AgeBucket.MONTH_12_TO_23,
+    AgeBucket.MONTH_24_PLUS,
+)
+
+# Adjacent buckets to suggest as alternatives: the next (older) bucket first,
+# then the previous one.
+_ADJACENT_AGE_BUCKETS: dict[AgeBucket, tuple[AgeBucket, ...]] = {
+    bucket: _BUCKET_ORDER[index + 1:index + 2] + _BUCKET_ORDER[max(index - 1, 0):index]
+    for index, bucket in enumerate(_BUCKET_ORDER)
+}
+
+# Most "different_age_bucket" suggestions returned per criterion.
+_MAX_AGE_BUCKET_ALTERNATIVES = 2
+
+
 @dataclass(frozen=True, slots=True)
 class InventoryAlternative:
     """Alternative inventory options when requested criteria cannot be fulfilled."""
@@ -67,16 +88,12 @@ class AllocationCriteria:
 
     def to_string(self) -> str:
         """Human-readable description of criteria."""
-        parts = [
-            f"{self.classification.value}",
-            f"{self.age_bucket.value}",
-        ]
-        if self.state:
-            parts.append(f"state={self.state}")
-        if self.county:
-            parts.append(f"county={self.county}")
-        parts.append(f"qty={self.quantity}")
-        return " ".join(parts)
+        state_part = f" state={self.state}" if self.state else ""
+        county_part = f" county={self.county}" if self.county else ""
+        return (
+            f"{self.classification.value} {self.age_bucket.value}"
+            f"{state_part}{county_part} qty={self.quantity}"
+        )
 
 
 @dataclass(frozen=True, slots=True)
@@ -120,9 +137,7 @@ def _get_inventory_alternatives(
             counties=None,
             available_only=True
         )
-        from repositories.inventory_query_repository import query_available_inventory
-        items_no_location = query_available_inventory(filters_no_location, limit=10000)
-        count_no_location = len(items_no_location)
+        count_no_location = count_available_inventory(filters_no_location)
 
         if count_no_location > current_available:
             location_desc = f"{criterion.state}" if criterion.state else ""
@@ -135,9 +150,13 @@ def _get_inventory_alternatives(
                 suggestion_type="no_location_filter"
             ))
 
-    # Option 3: Try different age buckets (adjacent ones)
-    age_bucket_alternatives = _get_adjacent_age_buckets(criterion.age_bucket)
-    for alt_bucket in age_bucket_alternatives:
+    # Option 3: Try different age buckets (adjacent ones). Check the limit
+    # before querying so no count is fetched once enough hits are found
+    age_bucket_hits = 0
+    for alt_bucket in _get_adjacent_age_buckets(criterion.age_bucket):
+        if age_bucket_hits >= _MAX_AGE_BUCKET_ALTERNATIVES:
+            break
+
         filters_alt = InventoryQueryFilters(
             classifications=[criterion.classification],
             age_buckets=[alt_bucket],
@@ -145,9 +164,7 @@ def _get_inventory_alternatives(
             counties=[criterion.county] if criterion.county else None,
             available_only=True
         )
-        from repositories.inventory_query_repository import query_available_inventory
-        items_alt = query_available_inventory(filters_alt, limit=10000)
-        count_alt = len(items_alt)
+        count_alt = count_available_inventory(filters_alt)
 
         if count_alt >= criterion.quantity:
             location_part = f" in {criterion.state}" if criterion.state else ""
@@ -156,37 +173,14 @@ def _get_inventory_alternatives(
                 available_count=count_alt,
                 suggestion_type="different_age_bucket"
             ))
-            # Only show first 2 age bucket alternatives
-            if len([a for a in alternatives if a.suggestion_type == "different_age_bucket"]) >= 2:
-                break
+            age_bucket_hits += 1
 
     return alternatives
 
 
 def _get_adjacent_age_buckets(current_bucket: AgeBucket) -> List[AgeBucket]:
     """Get adjacent age buckets for suggesting alternatives."""
-    bucket_order = [
-        AgeBucket.MONTH_3_TO_5,
-        AgeBucket.MONTH_6_TO_8,
-        AgeBucket.MONTH_9_TO_11,
-        AgeBucket.MONTH_12_TO_23,
-        AgeBucket.MONTH_24_PLUS,
-    ]
-
-    try:
-        current_idx = bucket_order.index(current_bucket)
-    except ValueError:
-        return []
-
-    adjacent = []
-    # Add next bucket
-    if current_idx + 1 < len(bucket_order):
-        adjacent.append(bucket_order[current_idx + 1])
-    # Add previous bucket
-    if current_idx - 1 >= 0:
-        adjacent.append(bucket_order[current_idx - 1])
-
-    return adjacent
+    return list(_ADJACENT_AGE_BUCKETS.get(current_bucket, ()))
 
 
 def allocate_inventory_by_criteria(
@@ -200,6 +194,11 @@ def allocate_inventory_by_criteria(
     2. Allocates inventory for each criterion
     3. Returns allocated items
 
+    A lead is allocated at most once, even if it is in inventory under
+    several of the requested age buckets: it goes to the first criterion
+    that matches it, and later criteria are filled from the remaining leads.
+    A criterion is only short when there are not enough distinct leads.
+
     Note: This function does NOT mark items as sold. That's done by the
     purchase service after payment processing.
 
@@ -228,26 +227,28 @@ def allocate_inventory_by_criteria(
     if not criteria_list:
         raise ValueError("criteria_list cannot be empty")
 
-    results = []
-
-    for idx, criterion in enumerate(criteria_list):
-        # Build mixed inventory request
-        states = [criterion.state] if criterion.state else None
-        counties = [criterion.county] if criterion.county else None
-
-        request = MixedInventoryRequest(
+    # Build one mixed inventory request per criterion
+    requests = [
+        MixedInventoryRequest(
             classification=criterion.classification,
             age_bucket=criterion.age_bucket,
             quantity=criterion.quantity,
-            states=states,
-            counties=counties
+            states=[criterion.state] if criterion.state else None,
+            counties=[criterion.county] if criterion.county else None
         )
+        for criterion in criteria_list
+    ]
 
-        # Query available inventory
-        # Note: query_mixed_inventory returns available inventory items
-        # In production, this should use SELECT FOR UPDATE for row locking
-        allocated_items = query_mixed_inventory([request])
+    # Query available inventory for all criteria with one database call.
+    # Nothing is reserved here: a concurrent purchase can still take these
+    # items. purchase_inventory() (database/schema.sql) is the race guard; it
+    # locks the rows and sells only those still unsold, and the purchase
+    # service replaces any that were lost
+    items_per_criterion = query_mixed_inventory_by_request(requests)
 
+    results = []
+
+    for idx, (criterion, allocated_items) in enumerate(zip(criteria_list, items_per_criterion)):
         # Validate we got the requested quantity
         if len(allocated_items) < criterion.quantity:
             # Generate alternatives
@@ -306,11 +307,7 @@ def validate_inventory_availability(
             available_only=True
         )
 
-        # Query to get count (we use a large limit since we just want to count)
-        from repositories.inventory_query_repository import query_available_inventory
-        available_items = query_available_inventory(filters, limit=10000)
-
-        availability[criterion.to_string()] = len(available_items)
+        availability[criterion.to_string()] = count_available_inventory(filters)
 
     return availability
 
@@ -84,21 +84,17 @@ def calculate_purchase_quote(
     pricing_map = get_pricing_for_inventory_items(inventory_items)
 
     # Build line items
-    line_items: List[PriceCalculation] = []
-    subtotal = Decimal("0.00")
-
-    for item in inventory_items:
-        unit_price = pricing_map[item.inventory_id]
-
-        line_items.append(PriceCalculation(
+    line_items: List[PriceCalculation] = [
+        PriceCalculation(
             inventory_id=item.inventory_id,
             lead_id=item.lead_id,
             classification=item.classification,
             age_bucket=item.age_bucket,
-            unit_price=unit_price
-        ))
-
-        subtotal += unit_price
+            unit_price=pricing_map[item.inventory_id]
+        )
+        for item in inventory_items
+    ]
+    subtotal = sum((line_item.unit_price for line_item in line_items), Decimal("0.00"))
 
     # Calculate expiration
     now = datetime.now(timezone.utc)
@@ -4,30 +4,36 @@ Purchase service for executing lead purchases.
 Handles:
 - Automatic replacement of unavailable leads
 - All-or-nothing transaction strategy
-- Integration with execute_sale_atomic() PostgreSQL function
+- Integration with purchase_inventory() PostgreSQL function
 """
 
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import List, Optional
 from uuid import UUID
 
-from domain.age_bucket import AgeBucket
 from domain.lead import LeadClassification
 from repositories.client import supabase
 from repositories.client_repository import get_client_by_id
 from repositories.inventory_query_repository import (
     AvailableInventoryItem,
-    InventoryQueryFilters,
-    query_available_inventory,
+    MixedInventoryRequest,
+    get_inventory_items_by_ids,
+    query_mixed_inventory_by_request,
 )
 from repositories.sale_repository import record_sale
 from services.pricing_service import PriceCalculation, calculate_purchase_quote
 
 
+# Replacement candidates fetched per failed item, so enough remain after
+# dropping ones that were already attempted.
+_REPLACEMENT_OVERFETCH_FACTOR = 3
+
+
 @dataclass(frozen=True, slots=True)
 class PurchaseRequest:
     """
@@ -45,7 +51,7 @@ class PurchaseResult:
     success: True if purchase completed successfully
     sale_ids: List of sale IDs created
     total_paid: Total amount charged
-    items_requested: Number of items originally requested
+    items_requested: Number of distinct items requested
     items_purchased: Number of items actually purchased
     items_replaced: Number of items that were automatically replaced
     errors: List of error messages (empty if success=True)
@@ -60,38 +66,59 @@ class PurchaseResult:
 
 
 @dataclass(frozen=True, slots=True)
-class AtomicSaleResult:
-    """Result from execute_sale_atomic PostgreSQL function."""
+class AtomicPurchaseResult:
+    """
+    Result from purchase_inventory PostgreSQL function.
+
+    sale_ids maps inventory_id to sale_id for each item actually sold;
+    requested items missing from it were already sold or locked by
+    another purchase.
+    """
     success: bool
-    sale_id: Optional[UUID]
+    sale_ids: dict[UUID, UUID]
     error_code: Optional[str]
     error_message: Optional[str]
 
 
-def _execute_atomic_sale(
-    lead_id: UUID,
-    age_bucket: AgeBucket,
-    client_id: UUID,
-    purchase_price: Decimal
-) -> AtomicSaleResult:
+def _parse_purchase_result(result: dict) -> AtomicPurchaseResult:
+    """Convert the JSON returned by purchase_inventory() into a result."""
+    if result.get('success'):
+        return AtomicPurchaseResult(
+            success=True,
+            sale_ids={
+                UUID(sale['inventory_id']): UUID(sale['sale_id'])
+                for sale in result.get('sales') or []
+            },
+            error_code=None,
+            error_message=None
+        )
+
+    return AtomicPurchaseResult(
+        success=False,
+        sale_ids={},
+        error_code=result.get('error'),
+        error_message=result.get('message')
+    )
+
+
+def _execute_atomic_purchase(
+    items: List[tuple[AvailableInventoryItem, Decimal]],
+    client_id: UUID
+) -> AtomicPurchaseResult:
     """
-    Execute atomic sale via PostgreSQL function.
+    Execute a batch of sales via one PostgreSQL function call.
 
-    Calls execute_sale_atomic() which:
-    - Locks inventory row (FOR UPDATE NOWAIT)
-    - Checks if available (sold_at_utc IS NULL)
-    - Marks as sold
-    - Creates sale record
-    All in a single atomic transaction.
+    Calls purchase_inventory() which, in a single transaction:
+    - Locks the requested inventory rows (FOR UPDATE SKIP LOCKED)
+    - Marks every still-available item as sold
+    - Creates all sale records with one INSERT ... SELECT
 
     Args:
-        lead_id: Lead to sell
-        age_bucket: Age bucket being sold
+        items: (inventory item, purchase price) pairs to buy
         client_id: Buyer
-        purchase_price: Price for this lead
 
     Returns:
-        AtomicSaleResult with success status and sale_id or error
+        AtomicPurchaseResult with the sale_id of each item sold, or error
     """
     from postgrest.exceptions import APIError
 
@@ -99,41 +126,30 @@ def _execute_atomic_sale(
 
     try:
         response = supabase.rpc(
-            'execute_sale_atomic',
+            'purchase_inventory',
             {
-                'p_lead_id': str(lead_id),
-                'p_age_bucket': age_bucket.value,
                 'p_client_id': str(client_id),
-                'p_sold_at': sold_at.isoformat(),
-                'p_purchase_price': float(purchase_price)
+                'p_items': [
+                    {
+                        'inventory_id': str(item.inventory_id),
+                        'purchase_price': float(price)
+                    }
+                    for item, price in items
+                ],
+                'p_sold_at': sold_at.isoformat()
             }
         ).execute()
 
         error = getattr(response, "error", None)
         if error:
-            return AtomicSaleResult(
+            return AtomicPurchaseResult(
                 success=False,
-                sale_id=None,
+                sale_ids={},
                 error_code="RPC_ERROR",
                 error_message=str(error)
             )
 
-        result = response.data
-
-        if result.get('success'):
-            return AtomicSaleResult(
-                success=True,
-                sale_id=UUID(result['sale_id']),
-                error_code=None,
-                error_message=None
-            )
-        else:
-            return AtomicSaleResult(
-                success=False,
-                sale_id=None,
-                error_code=result.get('error'),
-                error_message=result.get('message')
-            )
+        return _parse_purchase_result(response.data)
 
     except APIError as e:
         # Supabase-py throws APIError when PostgreSQL function returns JSON
@@ -145,25 +161,20 @@ def _execute_atomic_sale(
 
         # Check if it's actually a success response wrapped in an APIError
         if error_data.get('success') is True:
-            return AtomicSaleResult(
-                success=True,
-                sale_id=UUID(error_data['sale_id']),
-                error_code=None,
-                error_message=None
-            )
+            return _parse_purchase_result(error_data)
 
         # It's a real error
-        return AtomicSaleResult(
+        return AtomicPurchaseResult(
             success=False,
-            sale_id=None,
+            sale_ids={},
             error_code=error_data.get('error', 'API_ERROR'),
             error_message=error_data.get('message', str(e))
         )
 
     except Exception as e:
-        return AtomicSaleResult(
+        return AtomicPurchaseResult(
             success=False,
-            sale_id=None,
+            sale_ids={},
             error_code="EXCEPTION",
             error_message=str(e)
         )
@@ -176,13 +187,17 @@ def _find_replacement_leads(
     """
     Find replacement leads matching the criteria of failed items.
 
-    For each failed item, query for leads with:
+    For each failed item, look for leads with:
     - Same classification (Gold/Silver)
     - Same age bucket
     - Same state (if specified)
     - Same county (if specified)
     - Not already attempted
 
+    Failed items with the same criteria are grouped, and the candidates for
+    every group come from one query_mixed_inventory_by_request() call, so
+    each group gets distinct replacements.
+
     Args:
         failed_items: Items that failed to purchase
         already_attempted: Set of inventory IDs already attempted (to avoid retrying same leads)
@@ -190,30 +205,34 @@ def _find_replacement_leads(
     Returns:
         List of replacement leads (may be fewer than requested)
     """
-    replacements: List[AvailableInventoryItem] = []
-
-    for failed_item in failed_items:
-        # Query for similar leads
-        filters = InventoryQueryFilters(
-            classifications=[failed_item.classification],
-            age_buckets=[failed_item.age_bucket],
-            states=[failed_item.state] if failed_item.state else None,
-            counties=[failed_item.county] if failed_item.county else None,
-            available_only=True
+    needed_per_criteria = Counter(
+        (item.classification, item.age_bucket, item.state, item.county)
+        for item in failed_items
+    )
+    if not needed_per_criteria:
+        return []
+
+    # Fetch more than we need (in case some were already attempted)
+    requests = [
+        MixedInventoryRequest(
+            classification=classification,
+            age_bucket=age_bucket,
+            quantity=needed * _REPLACEMENT_OVERFETCH_FACTOR,
+            states=[state] if state else None,
+            counties=[county] if county else None
         )
+        for (classification, age_bucket, state, county), needed in needed_per_criteria.items()
+    ]
+    candidates_per_request = query_mixed_inventory_by_request(requests)
 
-        # Fetch more than we need (in case some are also sold)
-        candidates = query_available_inventory(filters, limit=10)
-
-        # Filter out already attempted
+    replacements: List[AvailableInventoryItem] = []
+    for needed, candidates in zip(needed_per_criteria.values(), candidates_per_request):
+        # Filter out already attempted, then take the first ones as replacements
         available_candidates = [
             c for c in candidates
             if c.inventory_id not in already_attempted
         ]
-
-        if available_candidates:
-            # Take first available candidate as replacement
-            replacements.append(available_candidates[0])
+        replacements.extend(available_candidates[:needed])
 
     return replacements
 
@@ -226,10 +245,10 @@ def execute_purchase(request: PurchaseRequest) -> PurchaseResult:
     1. Validate client exists and is active
     2. Fetch requested inventory items
     3. Calculate quote (pricing)
-    4. Attempt to purchase each item via execute_sale_atomic()
+    4. Purchase all items in one purchase_inventory() call
     5. If any fail (already sold):
        - Find replacement leads matching same criteria
-       - Attempt to purchase replacements
+       - Attempt to purchase replacements (one more call)
     6. If still can't get requested quantity:
        - REJECT entire purchase (all-or-nothing strategy)
        - Return error explaining shortage
@@ -256,7 +275,9 @@ def execute_purchase(request: PurchaseRequest) -> PurchaseResult:
         else:
             print(f"Purchase failed: {result.errors}")
     """
-    items_requested = len(request.inventory_item_ids)
+    # A repeated ID asks for the same lead again; it can only be sold once
+    requested_ids = set(request.inventory_item_ids)
+    items_requested = len(requested_ids)
 
     # 1. Validate client
     client = get_client_by_id(request.client_id)
@@ -283,23 +304,11 @@ def execute_purchase(request: PurchaseRequest) -> PurchaseResult:
             errors=[f"Client account cannot purchase (status: {client.status}, email_verified: {client.email_verified})"]
         )
 
-    # 2. Fetch inventory items
-    # Need to implement get_inventory_items_by_ids in inventory_query_repository
-    # For now, query all and filter (will optimize later)
-    from repositories.inventory_query_repository import query_available_inventory
-
-    all_available = query_available_inventory(
-        InventoryQueryFilters(),
-        limit=10000  # TODO: Optimize with direct ID query
-    )
-
-    requested_items = [
-        item for item in all_available
-        if item.inventory_id in request.inventory_item_ids
-    ]
+    # 2. Fetch inventory items (only the requested IDs, filtered in SQL)
+    requested_items = get_inventory_items_by_ids(request.inventory_item_ids)
 
-    if len(requested_items) != items_requested:
-        missing_count = items_requested - len(requested_items)
+    missing_ids = requested_ids - {item.inventory_id for item in requested_items}
+    if missing_ids:
         return PurchaseResult(
             success=False,
             sale_ids=[],
@@ -307,7 +316,7 @@ def execute_purchase(request: PurchaseRequest) -> PurchaseResult:
             items_requested=items_requested,
             items_purchased=0,
             items_replaced=0,
-            errors=[f"{missing_count} requested items are no longer available or don't exist"]
+            errors=[f"{len(missing_ids)} requested items are no longer available or don't exist"]
         )
 
     # 3. Calculate quote
@@ -324,28 +333,22 @@ def execute_purchase(request: PurchaseRequest) -> PurchaseResult:
             errors=["Quote has expired. Please request a new quote."]
         )
 
-    # 4. Attempt to purchase each item
-    successful_sales: List[UUID] = []
-    failed_items: List[AvailableInventoryItem] = []
-    attempted_inventory_ids: set[UUID] = set(request.inventory_item_ids)
+    # 4. Purchase all items in one atomic call
+    attempted_inventory_ids: set[UUID] = set(requested_ids)
 
     # Map inventory_id to price for lookup
     price_map = {item.inventory_id: item.unit_price for item in quote.items}
 
-    for item in requested_items:
-        unit_price = price_map[item.inventory_id]
-
-        result = _execute_atomic_sale(
-            lead_id=item.lead_id,
-            age_bucket=item.age_bucket,
-            client_id=request.client_id,
-            purchase_price=unit_price
-        )
+    result = _execute_atomic_purchase(
+        [(item, price_map[item.inventory_id]) for item in requested_items],
+        client_id=request.client_id
+    )
 
-        if result.success:
-            successful_sales.append(result.sale_id)
-        else:
-            failed_items.append(item)
+    successful_sales: List[UUID] = list(result.sale_ids.values())
+    failed_items: List[AvailableInventoryItem] = [
+        item for item in requested_items
+        if item.inventory_id not in result.sale_ids
+    ]
 
     # 5. Automatic replacement for failed items
     items_replaced = 0
@@ -354,29 +357,24 @@ def execute_purchase(request: PurchaseRequest) -> PurchaseResult:
         # Find replacements
         replacements = _find_replacement_leads(failed_items, attempted_inventory_ids)
 
-        # Calculate pricing for replacements
         if replacements:
-            replacement_quote = calculate_purchase_quote(replacements)
-            replacement_price_map = {
-                item.inventory_id: item.unit_price
-                for item in replacement_quote.items
+            # Replacements share the classification and age bucket of the
+            # items they replace, and prices are per bucket, so reuse the
+            # quoted prices instead of pricing them again
+            bucket_price = {
+                (item.classification, item.age_bucket): item.unit_price
+                for item in quote.items
             }
+            attempted_inventory_ids.update(r.inventory_id for r in replacements)
 
             # Attempt to purchase replacements
-            for replacement in replacements:
-                attempted_inventory_ids.add(replacement.inventory_id)
-                unit_price = replacement_price_map[replacement.inventory_id]
-
-                result = _execute_atomic_sale(
-                    lead_id=replacement.lead_id,
-                    age_bucket=replacement.age_bucket,
-                    client_id=request.client_id,
-                    purchase_price=unit_price
-                )
-
-                if result.success:
-                    successful_sales.append(result.sale_id)
-                    items_replaced += 1
+            result = _execute_atomic_purchase(
+                [(r, bucket_price[(r.classification, r.age_bucket)]) for r in replacements],
+                client_id=request.client_id
+            )
+
+            successful_sales.extend(result.sale_ids.values())
+            items_replaced = len(result.sale_ids)
 
     # 6. Check if we got the requested quantity (ALL-OR-NOTHING)
     items_purchased = len(successful_sales)
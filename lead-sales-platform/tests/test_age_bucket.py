@@ -6,11 +6,15 @@ Covers contract rules:
 - Leads with age_days < 90 are not in any bucket (None).
 - Negative ages and inconsistent timestamps raise errors.
 - All timestamps passed to LeadAge must be UTC timezone-aware.
+- The set-based bucketing in database/schema.sql (compute_lead_buckets)
+  uses the same day ranges as the domain.
 """
 
 from __future__ import annotations
 
+import re
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 
 import pytest
 
@@ -119,3 +123,24 @@ def test_lead_age_requires_utc_timestamps() -> None:
         LeadAge(created_at_utc=utc, as_of_utc=non_utc).age_days()
 
 
+def test_compute_lead_buckets_sql_matches_domain_boundaries() -> None:
+    """Verify the SQL CASE cutoffs in compute_lead_buckets() mirror AgeBucket.for_age_days."""
+
+    schema = (Path(__file__).parent.parent / "database" / "schema.sql").read_text(encoding="utf-8")
+    function_sql = schema[schema.index("CREATE OR REPLACE FUNCTION compute_lead_buckets("):]
+    function_sql = function_sql[: function_sql.index("$$ LANGUAGE")]
+
+    assert "INTERVAL '90 days'" in function_sql
+
+    cutoffs = [
+        (int(max_days), AgeBucket(bucket))
+        for max_days, bucket in re.findall(r"WHEN a\.age_days <= (\d+) THEN '(\w+)'", function_sql)
+    ]
+    assert cutoffs, "no CASE branches found in compute_lead_buckets()"
+    for max_days, bucket in cutoffs:
+        assert AgeBucket.for_age_days(max_days) == bucket
+        assert AgeBucket.for_age_days(max_days + 1) != bucket
+
+    fallback = re.search(r"ELSE '(\w+)'", function_sql)
+    assert fallback is not None
+    assert AgeBucket(fallback.group(1)) == AgeBucket.for_age_days(cutoffs[-1][0] + 1)
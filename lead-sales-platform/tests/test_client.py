@@ -0,0 +1,99 @@
+"""
+Tests for `repositories/client.py`.
+
+Covers contract rules:
+- execute_with_retry retries HTTP 429/503 responses, whether postgrest reports
+  the status as an error code or only a gateway message in a JSON body.
+- Other errors are raised immediately; the last attempt's error is re-raised.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+APIError = pytest.importorskip("postgrest.exceptions").APIError
+
+from repositories import client  # noqa: E402
+
+
+class _FakeQuery:
+    """Query builder whose execute() raises `failures` errors, then succeeds."""
+
+    def __init__(self, failures: list[Exception]) -> None:
+        self._failures = list(failures)
+        self.calls = 0
+
+    def execute(self) -> Any:
+        self.calls += 1
+        if self._failures:
+            raise self._failures.pop(0)
+        return "ok"
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(client.time, "sleep", lambda seconds: None)
+
+
+def test_retries_gateway_rate_limit_json_body() -> None:
+    """Verify a code-less JSON 429 body ("API rate limit exceeded") is retried."""
+
+    query = _FakeQuery([APIError({"message": "API rate limit exceeded"})] * 2)
+
+    assert client.execute_with_retry(query, max_retries=3) == "ok"
+    assert query.calls == 3
+
+
+def test_retries_non_json_429_status_code() -> None:
+    """Verify a 429 whose status postgrest put in APIError.code is retried."""
+
+    query = _FakeQuery([APIError({"code": 429, "message": "Too Many Requests"})])
+
+    assert client.execute_with_retry(query, max_retries=3) == "ok"
+    assert query.calls == 2
+
+
+def test_retries_postgrest_connection_errors() -> None:
+    """Verify PostgREST's 503 error codes (PGRST000-PGRST002) are retried."""
+
+    query = _FakeQuery([APIError({"code": "PGRST001", "message": "Database client error"})])
+
+    assert client.execute_with_retry(query, max_retries=3) == "ok"
+    assert query.calls == 2
+
+
+def test_does_not_retry_other_errors() -> None:
+    """Verify SQLSTATE errors and unrelated messages are raised immediately."""
+
+    duplicate = APIError({"code": "23505", "message": "duplicate key value violates unique constraint"})
+    query = _FakeQuery([duplicate])
+    with pytest.raises(APIError):
+        client.execute_with_retry(query, max_retries=3)
+    assert query.calls == 1
+
+    query = _FakeQuery([APIError({"message": "Invalid API key"})])
+    with pytest.raises(APIError):
+        client.execute_with_retry(query, max_retries=3)
+    assert query.calls == 1
+
+
+def test_raises_last_error_after_max_retries() -> None:
+    """Verify a persistent transient error is raised after max_retries attempts."""
+
+    query = _FakeQuery([APIError({"message": "API rate limit exceeded"})] * 5)
+
+    with pytest.raises(APIError):
+        client.execute_with_retry(query, max_retries=3)
+    assert query.calls == 3
+
+
+def test_max_retries_must_be_positive() -> None:
+    """Verify max_retries < 1 is rejected before any request is made."""
+
+    query = _FakeQuery([])
+
+    with pytest.raises(ValueError):
+        client.execute_with_retry(query, max_retries=0)
+    assert query.calls == 0
@@ -171,6 +171,10 @@ class TestTimezoneUtils:
         tz = get_timezone_for_state("XX")
         assert str(tz) == "UTC"
 
+    def test_get_timezone_unknown_states_share_utc_instance(self):
+        """Unknown states reuse one UTC ZoneInfo instead of building a new one"""
+        assert get_timezone_for_state("XX") is get_timezone_for_state(" zz ")
+
     def test_get_timezone_whitespace_handling(self):
         """Handles whitespace in state code"""
         tz = get_timezone_for_state(" LA ")
@@ -313,6 +317,128 @@ class TestLeadFactory:
         assert lead.mortgage_amount == "$100,000"
 
 
+class TestLeadBuilder:
+    """Tests for the Lead builder generated per CSV layout."""
+
+    GOLD_ROW = {
+        "Mortage ID": " 89536905 ",
+        "Campaign ID": "WK060225A",
+        "State": "LA",
+        "Source": " CALL ",
+        "Call In Date": "06-09-2025 15:55:13",
+        "Full Name": "  ",
+        "City": "Baton Rouge",
+        "Borrower Age": "36",
+        "Borrower Medical Issues": "No",
+        "Borrower Tobacco Use": "No",
+        "Co-Borrower ?": "No",
+        "Borrower Phone": "2254859918",
+    }
+
+    @staticmethod
+    def _expected_lead(row, lead_id):
+        """Reference Lead built field by field, without the generated builder"""
+        from domain.lead import Lead
+        from scripts.ingest_csv_leads import _OPTIONAL_FIELD_COLUMNS
+
+        return Lead(
+            lead_id=lead_id,
+            state=row["State"],
+            classification=classify_lead(row),
+            created_at_utc=parse_timestamp_with_state_timezone(row["Call In Date"], row["State"]),
+            call_in_date=row["Call In Date"],
+            **{
+                field: (row.get(column) or "").strip() or None
+                for field, column in _OPTIONAL_FIELD_COLUMNS
+            },
+        )
+
+    @staticmethod
+    def _build_both_ways(row, header, lead_id):
+        """Build a lead from the dictionary row and from its values by index"""
+        from scripts.ingest_csv_leads import CsvLayout, create_lead_from_row
+
+        layout = CsvLayout.from_header(header)
+        values = [row.get(column, "") for column in header]
+        return (
+            create_lead_from_row(row, lead_id=lead_id),
+            create_lead_from_row(values, lead_id=lead_id, layout=layout),
+        )
+
+    def test_gold_row_matches_reference(self):
+        """Dictionary and indexed rows strip optional fields and classify as Gold"""
+        from uuid import uuid4
+
+        lead_id = uuid4()
+        header = list(reversed(self.GOLD_ROW))  # column order differs from the field order
+
+        from_dict, from_values = self._build_both_ways(self.GOLD_ROW, header, lead_id)
+        expected = self._expected_lead(self.GOLD_ROW, lead_id)
+
+        assert from_dict == expected
+        assert from_values == expected
+        assert expected.classification == LeadClassification.GOLD
+        assert expected.mortgage_id == "89536905"
+        assert expected.source == "CALL"
+        assert expected.full_name is None  # whitespace-only value
+        assert expected.lender is None  # column not in the CSV
+
+    def test_whitespace_gold_field_classifies_silver(self):
+        """A whitespace-only Gold field makes the lead Silver in both row forms"""
+        from uuid import uuid4
+
+        lead_id = uuid4()
+        row = {**self.GOLD_ROW, "Borrower Phone": "   "}
+
+        from_dict, from_values = self._build_both_ways(row, list(row), lead_id)
+        expected = self._expected_lead(row, lead_id)
+
+        assert from_dict == expected
+        assert from_values == expected
+        assert expected.classification == LeadClassification.SILVER
+        assert expected.borrower_phone is None
+
+    def test_short_header_without_gold_columns(self):
+        """A header missing Gold columns yields Silver leads with those fields None"""
+        from uuid import uuid4
+
+        lead_id = uuid4()
+        row = {
+            "State": "TX",
+            "Call In Date": "06-10-2025 09:00:00",
+            "Source": "WEB",
+            "Borrower Age": "52",
+            "Zip": " 75001 ",
+        }
+
+        from_dict, from_values = self._build_both_ways(row, list(row), lead_id)
+        expected = self._expected_lead(row, lead_id)
+
+        assert from_dict == expected
+        assert from_values == expected
+        assert expected.classification == LeadClassification.SILVER
+        assert expected.zip == "75001"
+        assert expected.borrower_phone is None
+
+    def test_build_lead_direct_call(self):
+        """The generated builder takes pre-parsed values and returns the same Lead"""
+        from uuid import uuid4
+
+        from scripts.ingest_csv_leads import CsvLayout
+
+        lead_id = uuid4()
+        header = list(self.GOLD_ROW)
+        layout = CsvLayout.from_header(header)
+        values = [self.GOLD_ROW[column] for column in header]
+        expected = self._expected_lead(self.GOLD_ROW, lead_id)
+
+        lead = layout.build_lead(
+            values, lead_id, "LA", self.GOLD_ROW["Call In Date"], expected.created_at_utc
+        )
+
+        assert lead == expected
+
+
 class TestValidation:
     """Tests for CSV row validation."""
 
@@ -391,5 +517,219 @@ class TestValidation:
         assert "Call In Date" in error
 
 
+
+class TestCsvReading:
+    """Tests for reading CSV data rows."""
+
+    CSV_TEXT = (
+        'State,Call In Date,Address\n'
+        'LA,06-09-2025 15:55:13,"12 Main St\nApt 4"\n'
+        'TX,06-10-2025 09:00:00,5 Oak Ave\n'
+    )
+    EXPECTED_ROWS = [
+        ["LA", "06-09-2025 15:55:13", "12 Main St\nApt 4"],
+        ["TX", "06-10-2025 09:00:00", "5 Oak Ave"],
+    ]
+
+    def test_quoted_newline_with_csv_module(self, tmp_path, monkeypatch):
+        """csv.reader keeps a quoted line break inside its value"""
+        import scripts.ingest_csv_leads as ingest
+
+        monkeypatch.setattr(ingest, "pyarrow", None)
+        csv_file = tmp_path / "leads.csv"
+        csv_file.write_text(self.CSV_TEXT, encoding="utf-8", newline="")
+
+        fieldnames = ingest._read_csv_header(csv_file)
+        rows = [list(row) for row in ingest._iter_csv_rows(csv_file, fieldnames)]
+
+        assert rows == self.EXPECTED_ROWS
+
+    def test_quoted_newline_with_pyarrow(self, tmp_path, monkeypatch):
+        """pyarrow reads quoted line breaks the same way as csv.reader, across blocks"""
+        pytest.importorskip("pyarrow")
+        import scripts.ingest_csv_leads as ingest
+
+        # Small blocks, so block boundaries fall between the lines of a value
+        monkeypatch.setattr(ingest, "ARROW_BLOCK_SIZE", 64)
+        csv_file = tmp_path / "leads.csv"
+        csv_file.write_text(
+            "State,Call In Date,Address\n"
+            + "".join(f'LA,06-09-2025 15:55:13,"{i} Main St\nApt {i}"\n' for i in range(50)),
+            encoding="utf-8",
+            newline="",
+        )
+
+        fieldnames = ingest._read_csv_header(csv_file)
+        # Read with pyarrow directly, so a fallback to csv.reader can't hide a difference
+        rows = [list(row) for row in ingest._iter_arrow_rows(csv_file, fieldnames)]
+
+        assert rows == [
+            ["LA", "06-09-2025 15:55:13", f"{i} Main St\nApt {i}"] for i in range(50)
+        ]
+
+
+class TestBatchIsolation:
+    """Tests for bisecting a failed bulk insert down to the rejected rows."""
+
+    @staticmethod
+    def _leads(count):
+        from uuid import UUID
+
+        from domain.lead import Lead
+
+        created_at = datetime(2025, 6, 9, 20, 55, 13, tzinfo=timezone.utc)
+        return [
+            Lead(
+                lead_id=UUID(int=i + 1),
+                state="LA",
+                classification=LeadClassification.SILVER,
+                created_at_utc=created_at,
+                source="CALL",
+            )
+            for i in range(count)
+        ]
+
+    @staticmethod
+    def _fake_inserts(monkeypatch, bad_leads):
+        """Replace the repository inserts with fakes that reject bad_leads."""
+        import scripts.ingest_csv_leads as ingest
+
+        bad_ids = {lead.lead_id for lead in bad_leads}
+        inserted = []
+        requests = []
+
+        def insert_leads_bulk(leads):
+            requests.append(len(leads))
+            if any(lead.lead_id in bad_ids for lead in leads):
+                raise RuntimeError("bulk insert rejected")
+            inserted.extend(lead.lead_id for lead in leads)
+
+        def insert_lead(lead):
+            requests.append(1)
+            if lead.lead_id in bad_ids:
+                raise RuntimeError(f"row rejected: {lead.lead_id}")
+            inserted.append(lead.lead_id)
+
+        monkeypatch.setattr(ingest, "insert_leads_bulk", insert_leads_bulk)
+        monkeypatch.setattr(ingest, "insert_lead", insert_lead)
+        return inserted, requests
+
+    def test_only_rejected_rows_are_reported(self, monkeypatch):
+        """Exactly the rejected rows become errors; every other row is inserted"""
+        import scripts.ingest_csv_leads as ingest
+
+        batch = self._leads(20)
+        bad = [batch[3], batch[4], batch[17]]
+        inserted, requests = self._fake_inserts(monkeypatch, bad)
+
+        success_count, errors = ingest._isolate_failures(batch)
+
+        assert success_count == 17
+        assert sorted(e["lead_id"] for e in errors) == sorted(str(lead.lead_id) for lead in bad)
+        assert all(e["error"].startswith("row rejected") for e in errors)
+        assert all(e["state"] == "LA" and e["source"] == "CALL" for e in errors)
+        assert sorted(inserted) == sorted(lead.lead_id for lead in batch if lead not in bad)
+        # Bisection needs far fewer requests than one insert per row
+        assert len(requests) < len(batch)
+
+    def test_single_row_batch(self, monkeypatch):
+        """A one-row batch is retried with a single insert"""
+        import scripts.ingest_csv_leads as ingest
+
+        [good] = self._leads(1)
+        inserted, _ = self._fake_inserts(monkeypatch, [])
+        assert ingest._isolate_failures([good]) == (1, [])
+        assert inserted == [good.lead_id]
+
+        [bad] = self._leads(1)
+        inserted, _ = self._fake_inserts(monkeypatch, [bad])
+        success_count, errors = ingest._isolate_failures([bad])
+        assert success_count == 0
+        assert [e["lead_id"] for e in errors] == [str(bad.lead_id)]
+        assert inserted == []
+
+    def test_all_rows_rejected(self, monkeypatch):
+        """When every row is bad, every row is reported and nothing is inserted"""
+        import scripts.ingest_csv_leads as ingest
+
+        batch = self._leads(7)
+        inserted, _ = self._fake_inserts(monkeypatch, batch)
+
+        success_count, errors = ingest._isolate_failures(batch)
+
+        assert success_count == 0
+        assert sorted(e["lead_id"] for e in errors) == sorted(str(lead.lead_id) for lead in batch)
+        assert inserted == []
+
+
+class TestParallelIngestion:
+    """Tests for parsing with several processes (--parallel)."""
+
+    @staticmethod
+    def _record_batches(monkeypatch):
+        """Make process_batch append every batch it gets to runs[-1]"""
+        import scripts.ingest_csv_leads as ingest
+
+        runs = []
+        process_batch = ingest.process_batch
+
+        def recording_process_batch(batch, dry_run=False):
+            runs[-1].extend(batch)
+            return process_batch(batch, dry_run)
+
+        monkeypatch.setattr(ingest, "process_batch", recording_process_batch)
+        return runs
+
+    @staticmethod
+    def _dry_run(runs, csv_file, parallel):
+        """Dry-run ingest_csv, returning the result and every lead it produced"""
+        import scripts.ingest_csv_leads as ingest
+
+        runs.append([])
+        result = ingest.ingest_csv(str(csv_file), batch_size=7, dry_run=True, parallel=parallel)
+        return result, runs[-1]
+
+    def test_parallel_matches_sequential(self, tmp_path, monkeypatch, capsys):
+        """Parallel parsing yields the same leads, counters and errors as one process"""
+        import dataclasses
+        from uuid import UUID
+
+        rows = ["State,Call In Date,Source,First Name,Borrower Age,Borrower Medical Issues,"
+                "Borrower Tobacco Use,Co-Borrower ?,Borrower Phone"]
+        for i in range(200):
+            if i % 37 == 5:
+                rows.append(f",06-09-2025 15:55:13,CALL,missing-state-{i},,,,,")
+            elif i % 41 == 7:
+                rows.append(f"LA,not a date,CALL,bad-date-{i},,,,,")
+            elif i % 3 == 0:
+                rows.append(f"TX,06-{1 + i % 28:02d}-2025 08:05:14,CALL,gold-{i},36,No,No,No,2254859918")
+            else:
+                rows.append(f"LA,06-{1 + i % 28:02d}-2025 15:55:13,,silver-{i},,,,,")
+        csv_file = tmp_path / "leads.csv"
+        csv_file.write_text("\n".join(rows) + "\n", encoding="utf-8")
+
+        runs = self._record_batches(monkeypatch)
+        sequential, sequential_leads = self._dry_run(runs, csv_file, parallel=1)
+        parallel, parallel_leads = self._dry_run(runs, csv_file, parallel=3)
+        capsys.readouterr()
+
+        def comparable(leads):
+            return sorted(
+                (dataclasses.replace(lead, lead_id=UUID(int=0)) for lead in leads),
+                key=lambda lead: lead.first_name,
+            )
+
+        assert len(sequential_leads) == sequential.successful > 0
+        assert comparable(parallel_leads) == comparable(sequential_leads)
+        for name in ("total_rows", "successful", "failed", "skipped", "gold_count", "silver_count"):
+            assert getattr(parallel, name) == getattr(sequential, name), name
+        assert sequential.skipped + sequential.failed > 0
+
+        def error_rows(result):
+            return sorted((error["row_num"], error["error"]) for error in result.errors)
+
+        assert error_rows(parallel) == error_rows(sequential)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,150 @@
+"""
+Tests for `repositories/inventory_query_repository.py`.
+
+Covers contract rules:
+- Inventory rows map stored age bucket and classification values to enum members.
+- Unknown stored values raise ValueError, not KeyError.
+- iter_available_inventory fetches keyset pages of at most page_size rows,
+  stops at `limit` or a short page, and continues each page after the
+  previous page's last item.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, Optional
+from uuid import UUID
+
+import pytest
+
+from domain.age_bucket import AgeBucket
+from domain.lead import LeadClassification
+from repositories import inventory_query_repository as repo
+from repositories.inventory_query_repository import (
+    AvailableInventoryItem,
+    InventoryCursor,
+    InventoryQueryFilters,
+)
+
+
+def _row(index: int, *, age_bucket: str = "MONTH_3_TO_5", classification: str = "Gold") -> dict[str, Any]:
+    return {
+        "inventory_id": str(UUID(int=1000 + index)),
+        "lead_id": str(UUID(int=index)),
+        "age_bucket": age_bucket,
+        "created_at_utc": f"2025-01-01T00:00:{index:02d}Z",
+        "leads": {"state": "TX", "classification": classification},
+    }
+
+
+def test_row_to_item_parses_enums() -> None:
+    """Verify stored values map to AgeBucket and LeadClassification members."""
+
+    item = repo._row_to_item(_row(1, age_bucket=AgeBucket.MONTH_6_TO_8.value, classification="Silver"))
+
+    assert item is not None
+    assert item.age_bucket is AgeBucket.MONTH_6_TO_8
+    assert item.classification is LeadClassification.SILVER
+    assert item.created_at_utc == datetime(2025, 1, 1, 0, 0, 1, tzinfo=timezone.utc)
+
+
+def test_row_to_item_unknown_values_raise_value_error() -> None:
+    """Verify unknown age bucket or classification values raise ValueError."""
+
+    with pytest.raises(ValueError):
+        repo._row_to_item(_row(1, age_bucket="MONTH_99"))
+
+    with pytest.raises(ValueError):
+        repo._row_to_item(_row(1, classification="Platinum"))
+
+
+def _inventory(count: int) -> list[AvailableInventoryItem]:
+    """Items in (created_at_utc, inventory_id) order, two per timestamp."""
+    items = [
+        repo._row_to_item({**_row(i), "created_at_utc": f"2025-01-01T00:00:{i // 2:02d}Z"})
+        for i in range(count)
+    ]
+    return [item for item in items if item is not None]
+
+
+def _stub_pages(
+    monkeypatch: pytest.MonkeyPatch, items: list[AvailableInventoryItem]
+) -> list[tuple[int, Optional[InventoryCursor]]]:
+    """Serve _fetch_inventory_page from `items`, recording (limit, cursor) per call."""
+    calls: list[tuple[int, Optional[InventoryCursor]]] = []
+
+    def fetch_page(
+        filters: InventoryQueryFilters, limit: int, cursor: Optional[InventoryCursor]
+    ) -> list[AvailableInventoryItem]:
+        calls.append((limit, cursor))
+        after = [
+            item for item in items
+            if cursor is None or (item.created_at_utc, item.inventory_id) > cursor
+        ]
+        return after[:limit]
+
+    monkeypatch.setattr(repo, "_fetch_inventory_page", fetch_page)
+    return calls
+
+
+@pytest.mark.parametrize(
+    ("limit", "expected_limits"),
+    [
+        (3, [3]),  # smaller than page_size: one request of `limit` rows
+        (4, [4]),  # equal to page_size: no second request
+        (9, [4, 4, 1]),  # larger: full pages, then the remainder
+        (None, [4, 4, 4]),  # everything: stops at the short last page
+    ],
+)
+def test_iter_available_inventory_pages(
+    monkeypatch: pytest.MonkeyPatch, limit: Optional[int], expected_limits: list[int]
+) -> None:
+    """Verify page limits and that items come out in order, up to `limit`."""
+
+    items = _inventory(10)
+    calls = _stub_pages(monkeypatch, items)
+
+    result = list(repo.iter_available_inventory(InventoryQueryFilters(), limit=limit, page_size=4))
+
+    assert result == items[:limit]
+    assert [page_limit for page_limit, _ in calls] == expected_limits
+
+
+def test_iter_available_inventory_passes_cursor_between_pages(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify each page starts after the last item of the previous page."""
+
+    items = _inventory(10)
+    calls = _stub_pages(monkeypatch, items)
+
+    list(repo.iter_available_inventory(InventoryQueryFilters(), page_size=4))
+
+    assert [cursor for _, cursor in calls] == [
+        None,
+        (items[3].created_at_utc, items[3].inventory_id),
+        (items[7].created_at_utc, items[7].inventory_id),
+    ]
+
+
+def test_iter_available_inventory_starts_after_given_cursor(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify a caller's cursor is used for the first page."""
+
+    items = _inventory(10)
+    calls = _stub_pages(monkeypatch, items)
+    start = repo.next_inventory_cursor(items[:5])
+
+    result = list(repo.iter_available_inventory(InventoryQueryFilters(), limit=3, cursor=start, page_size=4))
+
+    assert result == items[5:8]
+    assert calls == [(3, start)]
+
+
+def test_iter_available_inventory_exact_multiple_of_page_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify a result that fills every page ends after one empty page."""
+
+    items = _inventory(8)
+    calls = _stub_pages(monkeypatch, items)
+
+    result = list(repo.iter_available_inventory(InventoryQueryFilters(), page_size=4))
+
+    assert result == items
+    assert len(calls) == 3
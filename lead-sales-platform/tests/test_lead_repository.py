@@ -0,0 +1,139 @@
+"""
+Tests for `repositories/lead_repository.py`.
+
+Covers contract rules:
+- copy_leads sends one COPY with records in the column order of the row payload.
+- copy_leads refuses to run without asyncpg and DATABASE_URL.
+- Row parsing maps stored classifications to enum members and rejects unknown ones with ValueError.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any
+from uuid import UUID
+
+import pytest
+
+from domain.lead import Lead, LeadClassification
+from repositories import lead_repository
+
+
+class _FakeConnection:
+    def __init__(self, calls: list[dict[str, Any]]) -> None:
+        self._calls = calls
+        self.closed = False
+
+    async def copy_records_to_table(self, table: str, *, records: Any, columns: Any) -> None:
+        self._calls.append({"table": table, "records": list(records), "columns": list(columns)})
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def _lead(lead_id: int, classification: LeadClassification, **fields: str) -> Lead:
+    return Lead(
+        lead_id=UUID(int=lead_id),
+        state="TX",
+        classification=classification,
+        created_at_utc=datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        **fields,
+    )
+
+
+def test_copy_leads_sends_records_in_row_column_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify copy_leads passes one COPY with tuples aligned to the row payload keys."""
+
+    calls: list[dict[str, Any]] = []
+    connections: list[_FakeConnection] = []
+
+    async def connect(dsn: str) -> _FakeConnection:
+        assert dsn == "postgresql://example/db"
+        conn = _FakeConnection(calls)
+        connections.append(conn)
+        return conn
+
+    monkeypatch.setattr(lead_repository, "asyncpg", SimpleNamespace(connect=connect))
+    monkeypatch.setattr(lead_repository, "DATABASE_URL", "postgresql://example/db")
+    monkeypatch.setattr(lead_repository, "COPY_AVAILABLE", True)
+
+    leads = [
+        _lead(1, LeadClassification.GOLD, full_name="Jane Doe", city="Austin"),
+        _lead(2, LeadClassification.SILVER, source="web"),
+    ]
+    lead_repository.copy_leads(leads)
+
+    assert len(calls) == 1
+    assert connections[0].closed
+    call = calls[0]
+    assert call["table"] == "leads"
+
+    columns = call["columns"]
+    assert columns == list(lead_repository._lead_to_row(leads[0]))
+    assert columns[:3] == ["lead_id", "created_at_utc", "classification"]
+
+    records = call["records"]
+    assert len(records) == 2
+    for lead, record in zip(leads, records):
+        row = dict(zip(columns, record))
+        assert row["lead_id"] == lead.lead_id
+        assert row["created_at_utc"] == lead.created_at_utc
+        assert row["created_at_utc"].tzinfo is not None
+        assert row["classification"] == lead.classification.value
+        assert row["state"] == "TX"
+
+    first = dict(zip(columns, records[0]))
+    second = dict(zip(columns, records[1]))
+    assert first["full_name"] == "Jane Doe"
+    assert first["city"] == "Austin"
+    assert first["source"] == ""
+    assert second["source"] == "web"
+    assert second["full_name"] == ""
+
+
+def test_copy_leads_empty_is_noop(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify an empty sequence does not open a connection."""
+
+    monkeypatch.setattr(lead_repository, "COPY_AVAILABLE", False)
+
+    lead_repository.copy_leads([])
+
+
+def test_copy_leads_requires_copy_support(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify copy_leads raises when asyncpg or DATABASE_URL is unavailable."""
+
+    monkeypatch.setattr(lead_repository, "COPY_AVAILABLE", False)
+
+    with pytest.raises(RuntimeError):
+        lead_repository.copy_leads([_lead(1, LeadClassification.GOLD)])
+
+
+def test_row_to_lead_parses_classification() -> None:
+    """Verify stored classification values map to LeadClassification members."""
+
+    row = {
+        "lead_id": "00000000-0000-0000-0000-000000000001",
+        "state": "TX",
+        "classification": "Gold",
+        "created_at_utc": "2025-01-02T03:04:05Z",
+    }
+
+    lead = lead_repository._row_to_lead(row)
+
+    assert lead.classification is LeadClassification.GOLD
+    assert lead.created_at_utc == datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+def test_row_to_lead_unknown_classification_raises_value_error() -> None:
+    """Verify an unknown classification raises ValueError, not KeyError."""
+
+    row = {
+        "lead_id": "00000000-0000-0000-0000-000000000001",
+        "state": "TX",
+        "classification": "Platinum",
+        "created_at_utc": "2025-01-02T03:04:05Z",
+    }
+
+    with pytest.raises(ValueError):
+        lead_repository._row_to_lead(row)
@@ -0,0 +1,80 @@
+"""
+Tests for `repositories/pricing_repository.py`.
+
+Covers contract rules:
+- Active pricing is fetched once and reused until the cache TTL passes.
+- clear_pricing_cache() forces the next lookup to refetch.
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from domain.age_bucket import AgeBucket
+from domain.lead import LeadClassification
+from repositories import pricing_repository
+
+TTL = pricing_repository._PRICING_CACHE_TTL_SECONDS
+
+
+@pytest.fixture
+def pricing(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Stub get_all_active_pricing and time.monotonic; record each fetch's time."""
+
+    state = SimpleNamespace(now=1000.0, fetches=[])
+
+    def get_all_active_pricing() -> dict[tuple[str, str], Decimal]:
+        state.fetches.append(state.now)
+        # The price changes with every fetch, so a stale cache is visible
+        price = Decimal(len(state.fetches))
+        return {(LeadClassification.GOLD.value, AgeBucket.MONTH_3_TO_5.value): price}
+
+    monkeypatch.setattr(pricing_repository, "get_all_active_pricing", get_all_active_pricing)
+    # Replace the module's clock only, not time.monotonic for everyone
+    monkeypatch.setattr(pricing_repository, "time", SimpleNamespace(monotonic=lambda: state.now))
+    # Start every test with an empty cache, and leave none behind
+    monkeypatch.setattr(pricing_repository, "_pricing_cache", {})
+    monkeypatch.setattr(pricing_repository, "_pricing_cache_expires_at", 0.0)
+    return state
+
+
+def _gold_price() -> Decimal | None:
+    return pricing_repository.get_active_pricing(LeadClassification.GOLD, AgeBucket.MONTH_3_TO_5)
+
+
+def test_pricing_fetched_once_within_ttl(pricing: SimpleNamespace) -> None:
+    """Verify repeated lookups within the TTL reuse one fetch."""
+
+    assert _gold_price() == Decimal(1)
+    pricing.now += TTL - 1
+    assert _gold_price() == Decimal(1)
+    assert pricing_repository.get_active_pricing(
+        LeadClassification.SILVER, AgeBucket.MONTH_3_TO_5
+    ) is None
+
+    assert pricing.fetches == [1000.0]
+
+
+def test_pricing_refetched_after_ttl(pricing: SimpleNamespace) -> None:
+    """Verify the first lookup at or after expiry fetches again."""
+
+    assert _gold_price() == Decimal(1)
+    pricing.now += TTL
+    assert _gold_price() == Decimal(2)
+    assert _gold_price() == Decimal(2)
+
+    assert pricing.fetches == [1000.0, 1000.0 + TTL]
+
+
+def test_clear_pricing_cache_forces_refetch(pricing: SimpleNamespace) -> None:
+    """Verify clear_pricing_cache() makes the next lookup refetch immediately."""
+
+    assert _gold_price() == Decimal(1)
+    pricing_repository.clear_pricing_cache()
+    assert _gold_price() == Decimal(2)
+    assert _gold_price() == Decimal(2)
+
+    assert pricing.fetches == [1000.0, 1000.0]
@@ -0,0 +1,300 @@
+"""
+Tests for `services/purchase_service.py`.
+
+Covers contract rules:
+- Items missing from the purchase_inventory() sales are treated as failed and
+  replaced; the purchase is all-or-nothing.
+- A success:false payload fails every item.
+- A success payload that supabase-py raises as an APIError is still a success.
+- Failed items with the same criteria get distinct replacements, never an
+  already-attempted item.
+- Requested IDs are compared as a set: repeats are bought once, and only IDs
+  that were not found are reported missing.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any
+from uuid import UUID
+
+import pytest
+
+APIError = pytest.importorskip("postgrest.exceptions").APIError
+
+from domain.age_bucket import AgeBucket  # noqa: E402
+from domain.client import Client  # noqa: E402
+from domain.lead import LeadClassification  # noqa: E402
+from repositories.inventory_query_repository import AvailableInventoryItem  # noqa: E402
+from services import pricing_service, purchase_service  # noqa: E402
+from services.purchase_service import PurchaseRequest, execute_purchase  # noqa: E402
+
+CLIENT_ID = UUID(int=999)
+UNIT_PRICE = Decimal("5.00")
+
+
+def _item(
+    n: int,
+    *,
+    classification: LeadClassification = LeadClassification.GOLD,
+    age_bucket: AgeBucket = AgeBucket.MONTH_3_TO_5,
+    state: str = "LA",
+) -> AvailableInventoryItem:
+    return AvailableInventoryItem(
+        inventory_id=UUID(int=n),
+        lead_id=UUID(int=1000 + n),
+        age_bucket=age_bucket,
+        created_at_utc=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        state=state,
+        county=None,
+        classification=classification,
+        first_name=None,
+        last_name=None,
+        city=None,
+        zip=None,
+        mortgage_amount=None,
+        borrower_age=None,
+        borrower_phone=None,
+    )
+
+
+def _sale_id(item: AvailableInventoryItem) -> UUID:
+    return UUID(int=5000 + item.inventory_id.int)
+
+
+def _sales(*items: AvailableInventoryItem) -> dict[str, Any]:
+    return {
+        "success": True,
+        "sales": [
+            {"inventory_id": str(item.inventory_id), "sale_id": str(_sale_id(item))}
+            for item in items
+        ],
+    }
+
+
+class _FakeSupabase:
+    """Answers rpc() calls with scripted outcomes: a payload, or an exception to raise."""
+
+    def __init__(self, outcomes: list[Any]) -> None:
+        self._outcomes = list(outcomes)
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    def rpc(self, name: str, params: dict[str, Any]) -> Any:
+        self.calls.append((name, params))
+        outcome = self._outcomes.pop(0)
+
+        def execute() -> Any:
+            if isinstance(outcome, Exception):
+                raise outcome
+            return SimpleNamespace(data=outcome, error=None)
+
+        return SimpleNamespace(execute=execute)
+
+    def rpc_item_ids(self, call: int) -> list[UUID]:
+        return [UUID(entry["inventory_id"]) for entry in self.calls[call][1]["p_items"]]
+
+
+@pytest.fixture
+def store(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Stub the client, inventory, pricing and replacement lookups of purchase_service."""
+
+    state = SimpleNamespace(items={}, candidates=[], replacement_requests=[])
+    client = Client(client_id=CLIENT_ID, email="buyer@example.com", status="active", email_verified=True)
+
+    def query_mixed_inventory_by_request(requests: list[Any]) -> list[list[AvailableInventoryItem]]:
+        state.replacement_requests.append(list(requests))
+        return [
+            [
+                c for c in state.candidates
+                if c.classification == r.classification and c.age_bucket == r.age_bucket
+            ][:r.quantity]
+            for r in requests
+        ]
+
+    monkeypatch.setattr(purchase_service, "get_client_by_id", lambda client_id: client)
+    monkeypatch.setattr(
+        purchase_service,
+        "get_inventory_items_by_ids",
+        lambda ids: [state.items[i] for i in dict.fromkeys(ids) if i in state.items],
+    )
+    monkeypatch.setattr(
+        pricing_service,
+        "get_pricing_for_inventory_items",
+        lambda items: {item.inventory_id: UNIT_PRICE for item in items},
+    )
+    monkeypatch.setattr(purchase_service, "query_mixed_inventory_by_request", query_mixed_inventory_by_request)
+    return state
+
+
+def _use_rpc(monkeypatch: pytest.MonkeyPatch, *outcomes: Any) -> _FakeSupabase:
+    fake = _FakeSupabase(list(outcomes))
+    monkeypatch.setattr(purchase_service, "supabase", fake)
+    return fake
+
+
+def _request(*items: AvailableInventoryItem) -> PurchaseRequest:
+    return PurchaseRequest(client_id=CLIENT_ID, inventory_item_ids=[item.inventory_id for item in items])
+
+
+def test_partial_sales_are_replaced(monkeypatch: pytest.MonkeyPatch, store: SimpleNamespace) -> None:
+    """Verify only items missing from `sales` are replaced, and all sale IDs are returned."""
+
+    a, b, c = _item(1), _item(2, classification=LeadClassification.SILVER), _item(3)
+    replacement = _item(4, classification=LeadClassification.SILVER)
+    store.items = {item.inventory_id: item for item in (a, b, c)}
+    store.candidates = [b, replacement]
+    rpc = _use_rpc(monkeypatch, _sales(a, c), _sales(replacement))
+
+    result = execute_purchase(_request(a, b, c))
+
+    assert result.success
+    assert result.sale_ids == [_sale_id(a), _sale_id(c), _sale_id(replacement)]
+    assert result.items_purchased == 3
+    assert result.items_replaced == 1
+    assert result.total_paid == 3 * UNIT_PRICE
+
+    # One batch call for the request, one for the replacement of b only
+    assert rpc.rpc_item_ids(0) == [a.inventory_id, b.inventory_id, c.inventory_id]
+    assert rpc.rpc_item_ids(1) == [replacement.inventory_id]
+    [requests] = store.replacement_requests
+    assert [(r.classification, r.age_bucket, r.states) for r in requests] == [
+        (LeadClassification.SILVER, AgeBucket.MONTH_3_TO_5, ["LA"]),
+    ]
+
+
+def test_partial_sales_without_replacement_fail(monkeypatch: pytest.MonkeyPatch, store: SimpleNamespace) -> None:
+    """Verify a shortage after replacement rejects the whole purchase."""
+
+    a, b = _item(1), _item(2)
+    store.items = {item.inventory_id: item for item in (a, b)}
+    rpc = _use_rpc(monkeypatch, _sales(a))
+
+    result = execute_purchase(_request(a, b))
+
+    assert not result.success
+    assert result.sale_ids == []
+    assert result.items_purchased == 0
+    assert "only 1 available" in result.errors[0]
+    assert len(rpc.calls) == 1
+
+
+def test_success_false_fails_every_item(monkeypatch: pytest.MonkeyPatch, store: SimpleNamespace) -> None:
+    """Verify a success:false payload marks every requested item as failed."""
+
+    a, b = _item(1), _item(2, age_bucket=AgeBucket.MONTH_6_TO_8)
+    store.items = {item.inventory_id: item for item in (a, b)}
+    rpc = _use_rpc(
+        monkeypatch,
+        {"success": False, "error": "CLIENT_NOT_FOUND", "message": "Client not found"},
+    )
+
+    result = execute_purchase(_request(a, b))
+
+    assert not result.success
+    assert "only 0 available" in result.errors[0]
+    assert len(rpc.calls) == 1
+    # Replacements were looked up for both items
+    [requests] = store.replacement_requests
+    assert sorted(r.age_bucket.value for r in requests) == sorted(
+        [AgeBucket.MONTH_3_TO_5.value, AgeBucket.MONTH_6_TO_8.value]
+    )
+
+
+def test_success_wrapped_in_api_error(monkeypatch: pytest.MonkeyPatch, store: SimpleNamespace) -> None:
+    """Verify a success payload raised as an APIError is parsed as a success."""
+
+    a, b = _item(1), _item(2)
+    store.items = {item.inventory_id: item for item in (a, b)}
+    rpc = _use_rpc(monkeypatch, APIError(_sales(a, b)))
+
+    result = execute_purchase(_request(a, b))
+
+    assert result.success
+    assert result.sale_ids == [_sale_id(a), _sale_id(b)]
+    assert result.items_replaced == 0
+    assert len(rpc.calls) == 1
+    assert store.replacement_requests == []
+
+
+def test_api_error_fails_every_item(monkeypatch: pytest.MonkeyPatch, store: SimpleNamespace) -> None:
+    """Verify a real APIError fails the batch, so every item needs a replacement."""
+
+    a = _item(1)
+    store.items = {a.inventory_id: a}
+    _use_rpc(monkeypatch, APIError({"code": "42501", "message": "permission denied"}))
+
+    result = execute_purchase(_request(a))
+
+    assert not result.success
+    assert "only 0 available" in result.errors[0]
+    assert len(store.replacement_requests) == 1
+
+
+def test_replacements_are_distinct_and_skip_attempted(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify same-criteria failures share one request and get distinct, unattempted replacements."""
+
+    failed = [_item(1), _item(2), _item(3, classification=LeadClassification.SILVER)]
+    gold_candidates = [_item(2), _item(10), _item(11), _item(12)]  # item 2 was already attempted
+    silver_candidates = [_item(20, classification=LeadClassification.SILVER)]
+    calls: list[list[Any]] = []
+
+    def query_mixed_inventory_by_request(requests: list[Any]) -> list[list[AvailableInventoryItem]]:
+        calls.append(list(requests))
+        return [
+            gold_candidates if r.classification == LeadClassification.GOLD else silver_candidates
+            for r in requests
+        ]
+
+    monkeypatch.setattr(purchase_service, "query_mixed_inventory_by_request", query_mixed_inventory_by_request)
+
+    replacements = purchase_service._find_replacement_leads(failed, {UUID(int=1), UUID(int=2), UUID(int=3)})
+
+    assert [r.inventory_id for r in replacements] == [UUID(int=10), UUID(int=11), UUID(int=20)]
+    # One lookup for all criteria, over-fetching per failed item
+    [requests] = calls
+    assert [(r.classification, r.quantity) for r in requests] == [
+        (LeadClassification.GOLD, 2 * purchase_service._REPLACEMENT_OVERFETCH_FACTOR),
+        (LeadClassification.SILVER, purchase_service._REPLACEMENT_OVERFETCH_FACTOR),
+    ]
+
+
+def test_no_failed_items_needs_no_lookup(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify no query is made when nothing failed."""
+
+    def query_mixed_inventory_by_request(requests: list[Any]) -> list[list[AvailableInventoryItem]]:
+        raise AssertionError("unexpected replacement lookup")
+
+    monkeypatch.setattr(purchase_service, "query_mixed_inventory_by_request", query_mixed_inventory_by_request)
+
+    assert purchase_service._find_replacement_leads([], set()) == []
+
+
+def test_duplicate_ids_are_bought_once(monkeypatch: pytest.MonkeyPatch, store: SimpleNamespace) -> None:
+    """Verify a repeated ID is neither reported missing nor counted as a shortage."""
+
+    a, b = _item(1), _item(2)
+    store.items = {item.inventory_id: item for item in (a, b)}
+    rpc = _use_rpc(monkeypatch, _sales(a, b))
+
+    result = execute_purchase(_request(a, b, a))
+
+    assert result.success
+    assert result.items_requested == 2
+    assert result.sale_ids == [_sale_id(a), _sale_id(b)]
+    assert rpc.rpc_item_ids(0) == [a.inventory_id, b.inventory_id]
+
+
+def test_missing_ids_are_reported(monkeypatch: pytest.MonkeyPatch, store: SimpleNamespace) -> None:
+    """Verify only IDs absent from the inventory lookup count as missing."""
+
+    a, b, c = _item(1), _item(2), _item(3)
+    store.items = {a.inventory_id: a}
+    rpc = _use_rpc(monkeypatch)
+
+    result = execute_purchase(_request(a, b, c, b))
+
+    assert not result.success
+    assert result.errors == ["2 requested items are no longer available or don't exist"]
+    assert rpc.calls == []
@@ -0,0 +1,161 @@
+"""
+Tests for `repositories/sale_repository.py`.
+
+Covers contract rules:
+- record_sales_bulk sends one insert request per batch_size sales and returns
+  the database-assigned sale_ids in input order.
+- Sale rows are serialized with string IDs, enum values and UTC ISO-8601 timestamps.
+- record_sale returns the SaleRecord of the inserted row.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any
+from uuid import UUID
+
+import pytest
+
+from domain.age_bucket import AgeBucket
+from domain.sale import SaleRecord
+from repositories import sale_repository
+from repositories.sale_repository import SaleInput, record_sale, record_sales_bulk
+
+SOLD_AT = datetime(2025, 3, 4, 5, 6, 7, tzinfo=timezone.utc)
+
+
+class _FakeSupabase:
+    """Records insert payloads and answers each with rows carrying new sale_ids."""
+
+    def __init__(self) -> None:
+        self.inserts: list[tuple[str, list[dict[str, Any]]]] = []
+        self._next_id = 1
+
+    def table(self, name: str) -> Any:
+        def insert(payloads: list[dict[str, Any]]) -> Any:
+            self.inserts.append((name, payloads))
+            rows = []
+            for payload in payloads:
+                rows.append({"sale_id": str(UUID(int=self._next_id)), **payload})
+                self._next_id += 1
+            return SimpleNamespace(execute=lambda: SimpleNamespace(data=rows, error=None))
+
+        return SimpleNamespace(insert=insert)
+
+
+@pytest.fixture
+def fake_supabase(monkeypatch: pytest.MonkeyPatch) -> _FakeSupabase:
+    fake = _FakeSupabase()
+    monkeypatch.setattr(sale_repository, "supabase", fake)
+    return fake
+
+
+def _sale(n: int) -> SaleInput:
+    return SaleInput(
+        lead_id=UUID(int=100 + n),
+        client_id=UUID(int=7),
+        bucket=AgeBucket.MONTH_3_TO_5,
+        sold_at=SOLD_AT,
+        purchase_price=Decimal("12.50"),
+    )
+
+
+def test_record_sales_bulk_one_request_per_batch(fake_supabase: _FakeSupabase) -> None:
+    """Verify N sales take ceil(N / batch_size) requests and ids come back in order."""
+
+    sales = [_sale(n) for n in range(5)]
+
+    sale_ids = record_sales_bulk(sales)
+
+    assert len(fake_supabase.inserts) == 1
+    assert [len(payloads) for _, payloads in fake_supabase.inserts] == [5]
+    assert sale_ids == [UUID(int=n) for n in range(1, 6)]
+
+    fake_supabase.inserts.clear()
+    record_sales_bulk(sales, batch_size=2)
+    assert [len(payloads) for _, payloads in fake_supabase.inserts] == [2, 2, 1]
+
+
+def test_record_sales_bulk_row_serialization(fake_supabase: _FakeSupabase) -> None:
+    """Verify each sale is serialized to the sales table row format."""
+
+    sale = SaleInput(
+        lead_id=UUID(int=101),
+        client_id=UUID(int=7),
+        bucket=AgeBucket.MONTH_6_TO_8,
+        sold_at=SOLD_AT,
+        purchase_price=Decimal("12.50"),
+        currency="CAD",
+        payment_status="completed",
+        payment_transaction_id="txn_123",
+    )
+
+    record_sales_bulk([sale, _sale(2)])
+
+    [(table, payloads)] = fake_supabase.inserts
+    assert table == "sales"
+    row = payloads[0]
+    created_at = datetime.fromisoformat(row.pop("created_at_utc"))
+    assert created_at.utcoffset() == timedelta(0)
+    assert row == {
+        "lead_id": str(UUID(int=101)),
+        "client_id": str(UUID(int=7)),
+        "age_bucket": "MONTH_6_TO_8",
+        "sold_at_utc": "2025-03-04T05:06:07+00:00",
+        "purchase_price": "12.50",
+        "currency": "CAD",
+        "payment_status": "completed",
+        "payment_transaction_id": "txn_123",
+    }
+    # One created_at for the whole call
+    assert payloads[1]["created_at_utc"] == created_at.isoformat()
+    assert payloads[1]["payment_status"] is None
+
+
+def test_record_sales_bulk_empty_and_invalid(fake_supabase: _FakeSupabase) -> None:
+    """Verify an empty list sends nothing and invalid values are rejected."""
+
+    assert record_sales_bulk([]) == []
+    assert fake_supabase.inserts == []
+
+    with pytest.raises(ValueError):
+        record_sales_bulk([_sale(1)], batch_size=0)
+
+    naive = SaleInput(
+        lead_id=UUID(int=101),
+        client_id=UUID(int=7),
+        bucket=AgeBucket.MONTH_3_TO_5,
+        sold_at=datetime(2025, 3, 4, 5, 6, 7),
+        purchase_price=Decimal("12.50"),
+    )
+    with pytest.raises(ValueError):
+        record_sales_bulk([naive])
+
+
+def test_record_sale_returns_sale_record(fake_supabase: _FakeSupabase) -> None:
+    """Verify record_sale inserts one row and returns its SaleRecord."""
+
+    record = record_sale(
+        lead_id=UUID(int=101),
+        client_id=UUID(int=7),
+        bucket=AgeBucket.MONTH_3_TO_5,
+        sold_at=SOLD_AT,
+        purchase_price=Decimal("12.50"),
+        payment_status="pending",
+    )
+
+    [(_, [row])] = fake_supabase.inserts
+    assert record == SaleRecord(
+        sale_id=UUID(int=1),
+        lead_id=UUID(int=101),
+        client_id=UUID(int=7),
+        age_bucket=AgeBucket.MONTH_3_TO_5,
+        sold_at=SOLD_AT,
+        purchase_price=Decimal("12.50"),
+        currency="USD",
+        payment_status="pending",
+        payment_transaction_id=None,
+        created_at=datetime.fromisoformat(row["created_at_utc"]),
+    )